@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Formatting Preservation Benchmark
+
+Times FormattingPreserver extraction and restoration on markup-heavy
+documents from 10 KB to 100 KB, next to the previous sequential
+implementation (one regex per pattern, one str.replace per match).
+Time per KB stays flat for a linear implementation and grows with the
+document for a quadratic one. Every run uses a fresh FormattingPreserver,
+so the extraction memo never answers a timed call. A second run extracts a
+site's worth of short, often repeated segments one call at a time and as
+one batch.
+
+Usage:
+    python benchmarks/formatting_benchmark.py [--repeat N]
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.translation_service import FormattingPreserver
+
+
+LINE = (
+    "<p class='room'>Room **{number}** has <b>a view</b> of the valley, `wifi` and "
+    "[photos](https://example.com/rooms). Write to info@example.com.</p>\n"
+)
+
+LEGACY_PATTERNS = [
+    (r"(<[^>]+>)", "HTML_TAG"),
+    (r"(\{[^}]+\})", "PLACEHOLDER"),
+    (r"(\[[^\]]+\])", "BRACKET"),
+    (r"(\*\*[^*]+\*\*)", "BOLD"),
+    (r"(\*[^*]+\*)", "ITALIC"),
+    (r"(`[^`]+`)", "CODE"),
+    (r"(https?://[^\s]+)", "URL"),
+    (r"(\w+@\w+\.\w+)", "EMAIL"),
+]
+
+
+def legacy_extract(text):
+    """Sequential extraction as implemented before the single-pass tokenizer"""
+    placeholders = {}
+    clean_text = text
+    for i, (pattern, prefix) in enumerate(LEGACY_PATTERNS):
+        for j, match in enumerate(re.finditer(pattern, clean_text)):
+            original = match.group(1)
+            placeholder = f"___{prefix}_{i}_{j}___"
+            placeholders[placeholder] = original
+            clean_text = clean_text.replace(original, placeholder, 1)
+    return clean_text, placeholders
+
+
+def legacy_restore(text, placeholders):
+    """Restoration with one full-string replace per placeholder"""
+    for placeholder, original in placeholders.items():
+        text = text.replace(placeholder, original)
+    return text
+
+
+def make_document(size_kb):
+    """Markup-heavy document of roughly size_kb kilobytes"""
+    lines = []
+    total = 0
+    while total < size_kb * 1024:
+        line = LINE.format(number=len(lines))
+        lines.append(line)
+        total += len(line)
+    return "".join(lines)
+
+
+def make_segments(count, unique):
+    """Short segments in which unique distinct texts recur, like a site's pages"""
+    return [LINE.format(number=i % unique).strip() for i in range(count)]
+
+
+def best_time(function, repeat):
+    """Fastest of repeat runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark formatting preservation")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'size':>7} {'single-pass':>14} {'per KB':>10} {'sequential':>14} {'per KB':>10}")
+    for size_kb in (10, 25, 50, 100):
+        document = make_document(size_kb)
+
+        def single_pass():
+            formatter = FormattingPreserver()
+            clean_text, placeholders = formatter.extract_formatting(document)
+            formatter.restore_formatting(clean_text, placeholders)
+
+        def sequential():
+            clean_text, placeholders = legacy_extract(document)
+            legacy_restore(clean_text, placeholders)
+
+        new_time = best_time(single_pass, args.repeat)
+        old_time = best_time(sequential, args.repeat)
+        print(
+            f"{size_kb:>5}KB {new_time * 1000:>12.1f}ms {new_time * 1e6 / size_kb:>8.0f}us "
+            f"{old_time * 1000:>12.1f}ms {old_time * 1e6 / size_kb:>8.0f}us"
+        )
+
+    segments = make_segments(20000, 500)
+    per_segment = best_time(lambda: [legacy_extract(text) for text in segments], args.repeat)
+    batch = best_time(
+        lambda: FormattingPreserver().extract_formatting_batch(segments), args.repeat
+    )
+    print(f"\n{len(segments)} segments, {len(set(segments))} distinct")
+    print(f"  sequential, one call per segment: {per_segment * 1000:>8.1f}ms")
+    print(f"  single-pass batch with memo:      {batch * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
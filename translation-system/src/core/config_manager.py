@@ -8,7 +8,7 @@ with proper validation and error handling.
 import os
 import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from dotenv import load_dotenv
@@ -32,15 +32,38 @@ class FTPConfig:
 class TranslationConfig:
     """Translation service configuration"""
 
-    service: str = "google"  # google, deepl, azure, openai
+    service: str = "google"  # google, deepl, azure, openai, mock
     api_key: Optional[str] = None
     api_endpoint: Optional[str] = None
     source_language: str = "en"
     target_languages: List[str] = None
     max_retries: int = 3
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0  # Backoff ceiling after the first failed attempt, doubling after
+    retry_max_delay: float = 30.0  # Largest backoff ceiling
+    retry_policies: Dict[str, Dict[str, float]] = None  # Retry overrides by backend
     cache_enabled: bool = True
+    cache_memory_entries: int = 10000  # In-memory LRU tier in front of the disk cache
+    translation_memory_enabled: bool = False  # Reuse near-matches of translated segments
+    translation_memory_threshold: float = 0.95  # Minimum similarity for a fuzzy match
     preserve_formatting: bool = True
+    glossary_file: Optional[str] = None  # JSON glossary of protected and forced terms
+    rate_limit_requests_per_second: float = 10.0  # Shared per backend, 0 = unlimited
+    rate_limit_characters_per_second: float = 0.0  # Shared per backend, 0 = unlimited
+    max_concurrent_requests: int = 8  # Backend requests in flight at once
+    pack_max_chars: int = 1000  # Budget for packing short segments into one request, 0 = off
+    fallback_services: List[str] = None  # Backends tried in order when the primary is unhealthy
+    service_api_keys: Dict[str, str] = None  # API keys of fallback backends by service
+    circuit_error_rate: float = 0.5  # Share of failed or slow calls that trips a backend
+    circuit_slow_call_seconds: float = 15.0  # Calls slower than this count as failed, 0 = off
+    circuit_open_seconds: float = 30.0  # Time before a tripped backend is probed again
+    hedge_requests: bool = False  # Duplicate calls that run past the latency percentile
+    hedge_percentile: float = 95.0  # Observed latency percentile that triggers a hedge
+    hedge_max_rate: float = 0.05  # Maximum share of calls that may be hedged
+    mock_latency_seconds: float = 0.05  # Median request latency of the mock backend
+    mock_latency_sigma: float = 0.5  # Log-normal spread of mock latencies, 0 = constant
+    mock_throttle_rate: float = 0.0  # Share of mock requests answered with 429
+    mock_failure_rate: float = 0.0  # Share of mock requests failing with 503
+    mock_seed: Optional[int] = None  # Seed for repeatable mock runs
 
 
 @dataclass
@@ -123,6 +146,27 @@ class ConfigManager:
         else:
             target_languages = self.DEFAULT_LANGUAGES.copy()
 
+        fallback_services = os.getenv("TRANSLATION_FALLBACK_SERVICES")
+        fallback_services = (
+            [service.strip() for service in fallback_services.split(",") if service.strip()]
+            if fallback_services
+            else []
+        )
+        service_api_keys = {
+            service: os.getenv(variable)
+            for service, variable in (("deepl", "DEEPL_API_KEY"), ("openai", "OPENAI_API_KEY"))
+            if os.getenv(variable)
+        }
+
+        mock_seed = os.getenv("TRANSLATION_MOCK_SEED")
+
+        retry_policies = {}
+        if os.getenv("TRANSLATION_RETRY_POLICIES"):
+            try:
+                retry_policies = json.loads(os.getenv("TRANSLATION_RETRY_POLICIES"))
+            except json.JSONDecodeError as e:
+                self.logger.warning(f"Could not parse TRANSLATION_RETRY_POLICIES: {e}")
+
         config = TranslationConfig(
             service=os.getenv("TRANSLATION_SERVICE", "google"),
             api_key=os.getenv("TRANSLATION_API_KEY"),
@@ -131,8 +175,33 @@ class ConfigManager:
             target_languages=target_languages,
             max_retries=int(os.getenv("TRANSLATION_MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("TRANSLATION_RETRY_DELAY", "1.0")),
+            retry_max_delay=float(os.getenv("TRANSLATION_RETRY_MAX_DELAY", "30")),
+            retry_policies=retry_policies,
             cache_enabled=os.getenv("TRANSLATION_CACHE", "true").lower() == "true",
+            cache_memory_entries=int(os.getenv("TRANSLATION_CACHE_MEMORY_ENTRIES", "10000")),
+            translation_memory_enabled=os.getenv("TRANSLATION_MEMORY", "false").lower() == "true",
+            translation_memory_threshold=float(os.getenv("TRANSLATION_MEMORY_THRESHOLD", "0.95")),
             preserve_formatting=os.getenv("PRESERVE_FORMATTING", "true").lower() == "true",
+            glossary_file=os.getenv("TRANSLATION_GLOSSARY_FILE") or None,
+            rate_limit_requests_per_second=float(os.getenv("TRANSLATION_RATE_LIMIT_RPS", "10")),
+            rate_limit_characters_per_second=float(os.getenv("TRANSLATION_RATE_LIMIT_CPS", "0")),
+            max_concurrent_requests=int(os.getenv("TRANSLATION_MAX_CONCURRENCY", "8")),
+            pack_max_chars=int(os.getenv("TRANSLATION_PACK_MAX_CHARS", "1000")),
+            fallback_services=fallback_services,
+            service_api_keys=service_api_keys,
+            circuit_error_rate=float(os.getenv("TRANSLATION_CIRCUIT_ERROR_RATE", "0.5")),
+            circuit_slow_call_seconds=float(
+                os.getenv("TRANSLATION_CIRCUIT_SLOW_CALL_SECONDS", "15")
+            ),
+            circuit_open_seconds=float(os.getenv("TRANSLATION_CIRCUIT_OPEN_SECONDS", "30")),
+            hedge_requests=os.getenv("TRANSLATION_HEDGE", "false").lower() == "true",
+            hedge_percentile=float(os.getenv("TRANSLATION_HEDGE_PERCENTILE", "95")),
+            hedge_max_rate=float(os.getenv("TRANSLATION_HEDGE_MAX_RATE", "0.05")),
+            mock_latency_seconds=float(os.getenv("TRANSLATION_MOCK_LATENCY", "0.05")),
+            mock_latency_sigma=float(os.getenv("TRANSLATION_MOCK_LATENCY_SIGMA", "0.5")),
+            mock_throttle_rate=float(os.getenv("TRANSLATION_MOCK_THROTTLE_RATE", "0")),
+            mock_failure_rate=float(os.getenv("TRANSLATION_MOCK_FAILURE_RATE", "0")),
+            mock_seed=int(mock_seed) if mock_seed else None,
         )
 
         # Override with config file if available
@@ -200,6 +269,67 @@ class ConfigManager:
         ):
             errors.append(f"API key is required for {self.translation_config.service}")
 
+        retry_keys = {"max_retries", "retry_delay", "retry_max_delay"}
+        for service, policy in (self.translation_config.retry_policies or {}).items():
+            if not isinstance(policy, dict) or not set(policy) <= retry_keys:
+                errors.append(
+                    f"Retry policy for {service} may only set {', '.join(sorted(retry_keys))}"
+                )
+
+        if self.translation_config.glossary_file:
+            if not Path(self.translation_config.glossary_file).is_file():
+                errors.append(
+                    f"Glossary file not found: {self.translation_config.glossary_file}"
+                )
+            if not self.translation_config.preserve_formatting:
+                errors.append("Glossary requires formatting preservation to be enabled")
+
+        if self.translation_config.cache_memory_entries < 0:
+            errors.append("Cache memory entries must not be negative")
+
+        if not 0 < self.translation_config.translation_memory_threshold <= 1:
+            errors.append("Translation memory threshold must be between 0 and 1")
+
+        if (
+            self.translation_config.rate_limit_requests_per_second < 0
+            or self.translation_config.rate_limit_characters_per_second < 0
+        ):
+            errors.append("Rate limits must not be negative")
+
+        if self.translation_config.max_concurrent_requests <= 0:
+            errors.append("Maximum concurrent requests must be positive")
+
+        if self.translation_config.pack_max_chars < 0:
+            errors.append("Segment packing budget must not be negative")
+
+        if not 0 < self.translation_config.circuit_error_rate <= 1:
+            errors.append("Circuit breaker error rate must be between 0 and 1")
+
+        if (
+            self.translation_config.circuit_slow_call_seconds < 0
+            or self.translation_config.circuit_open_seconds < 0
+        ):
+            errors.append("Circuit breaker durations must not be negative")
+
+        if not 0 < self.translation_config.hedge_percentile < 100:
+            errors.append("Hedge percentile must be between 0 and 100")
+
+        if not 0 <= self.translation_config.hedge_max_rate <= 1:
+            errors.append("Hedge rate must be between 0 and 1")
+
+        if (
+            self.translation_config.mock_latency_seconds < 0
+            or self.translation_config.mock_latency_sigma < 0
+        ):
+            errors.append("Mock latency settings must not be negative")
+
+        mock_rates = (
+            self.translation_config.mock_throttle_rate,
+            self.translation_config.mock_failure_rate,
+        )
+        if min(mock_rates) < 0 or sum(mock_rates) > 1:
+            errors.append("Mock throttle and failure rates must be between 0 and 1 in total")
+
         # Validate processing config
         if self.processing_config.max_file_size <= 0:
             errors.append("Max file size must be positive")
@@ -233,8 +363,36 @@ class ConfigManager:
                 "target_languages": self.translation_config.target_languages,
                 "max_retries": self.translation_config.max_retries,
                 "retry_delay": self.translation_config.retry_delay,
+                "retry_max_delay": self.translation_config.retry_max_delay,
+                "retry_policies": self.translation_config.retry_policies,
                 "cache_enabled": self.translation_config.cache_enabled,
+                "cache_memory_entries": self.translation_config.cache_memory_entries,
+                "translation_memory_enabled": self.translation_config.translation_memory_enabled,
+                "translation_memory_threshold": (
+                    self.translation_config.translation_memory_threshold
+                ),
                 "preserve_formatting": self.translation_config.preserve_formatting,
+                "glossary_file": self.translation_config.glossary_file,
+                "rate_limit_requests_per_second": (
+                    self.translation_config.rate_limit_requests_per_second
+                ),
+                "rate_limit_characters_per_second": (
+                    self.translation_config.rate_limit_characters_per_second
+                ),
+                "max_concurrent_requests": self.translation_config.max_concurrent_requests,
+                "pack_max_chars": self.translation_config.pack_max_chars,
+                "fallback_services": self.translation_config.fallback_services,
+                "circuit_error_rate": self.translation_config.circuit_error_rate,
+                "circuit_slow_call_seconds": self.translation_config.circuit_slow_call_seconds,
+                "circuit_open_seconds": self.translation_config.circuit_open_seconds,
+                "hedge_requests": self.translation_config.hedge_requests,
+                "hedge_percentile": self.translation_config.hedge_percentile,
+                "hedge_max_rate": self.translation_config.hedge_max_rate,
+                "mock_latency_seconds": self.translation_config.mock_latency_seconds,
+                "mock_latency_sigma": self.translation_config.mock_latency_sigma,
+                "mock_throttle_rate": self.translation_config.mock_throttle_rate,
+                "mock_failure_rate": self.translation_config.mock_failure_rate,
+                "mock_seed": self.translation_config.mock_seed,
             },
             "processing": {
                 "supported_extensions": self.processing_config.supported_extensions,
@@ -17,6 +17,7 @@ from core.config_manager import ConfigManager
 from services.ftp_client import FTPClientManager, TransferResult
 from services.translation_service import TranslationService
 from services.file_processor import FileProcessorManager, FileProcessingResult
+from utils.logging_setup import PerformanceLogger
 
 
 @dataclass
@@ -35,6 +36,7 @@ class WorkflowResult:
     error_messages: List[str] = field(default_factory=list)
     file_results: List[FileProcessingResult] = field(default_factory=list)
     upload_results: List[TransferResult] = field(default_factory=list)
+    translation_stats: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def processing_time(self) -> float:
@@ -60,7 +62,12 @@ class WorkflowConfig:
     ftp_upload: bool = True
     ftp_download: bool = False
     backup_original: bool = True
+    # With deduplication, files are extracted and rebuilt max_workers at a
+    # time (one without parallel_processing) and share one translation pass;
+    # without it, parallel_processing picks per-file threads or a plain loop.
+    # Translation requests are bounded by max_concurrent_requests either way.
     parallel_processing: bool = True
+    deduplicate_segments: bool = True
     max_workers: int = 4
     file_patterns: List[str] = field(default_factory=lambda: ["*.txt", "*.md", "*.html", "*.json"])
     exclude_patterns: List[str] = field(default_factory=list)
@@ -107,6 +114,7 @@ class TranslationWorkflow:
         # Initialize workflow result
         result = WorkflowResult(workflow_id=workflow_id, start_time=start_time)
         self.current_workflow = result
+        stats_baseline = self.translation_service.get_stats()
 
         try:
             # Step 1: Discover files
@@ -126,7 +134,9 @@ class TranslationWorkflow:
                 files_to_process = downloaded_files
 
             # Step 3: Process files (translate)
-            if workflow_config.parallel_processing:
+            if workflow_config.deduplicate_segments:
+                file_results = self._process_files_deduplicated(files_to_process, workflow_config)
+            elif workflow_config.parallel_processing:
                 file_results = self._process_files_parallel(files_to_process, workflow_config)
             else:
                 file_results = self._process_files_sequential(files_to_process, workflow_config)
@@ -156,6 +166,7 @@ class TranslationWorkflow:
 
         finally:
             result.end_time = datetime.now()
+            result.translation_stats = self.translation_service.stats.since(stats_baseline)
             self.current_workflow = None
 
             # Log workflow summary
@@ -223,6 +234,33 @@ class TranslationWorkflow:
 
         return downloaded_files
 
+    def _process_files_deduplicated(
+        self, files: List[str], config: WorkflowConfig
+    ) -> List[FileProcessingResult]:
+        """Process files translating segments shared between them only once"""
+        max_workers = config.max_workers if config.parallel_processing else 1
+        self.logger.info(
+            f"Processing files with cross-file segment deduplication, "
+            f"{max_workers} workers for extraction and rebuilding"
+        )
+
+        output_dir = config.output_directory or str(Path(files[0]).parent / "translations")
+        results = self.file_processor.process_files(files, output_dir, max_workers)
+
+        for i, result in enumerate(results, 1):
+            if result.success:
+                self.logger.info(
+                    f"[{i}/{len(files)}] Successfully processed: {result.file_path} "
+                    f"({result.translations_count} translations)"
+                )
+            else:
+                self.logger.error(
+                    f"[{i}/{len(files)}] Failed to process: {result.file_path} "
+                    f"- {result.error_message}"
+                )
+
+        return results
+
     def _process_files_sequential(
         self, files: List[str], config: WorkflowConfig
     ) -> List[FileProcessingResult]:
@@ -370,6 +408,25 @@ class TranslationWorkflow:
         self.logger.info(f"  Uploaded files: {result.uploaded_files}")
         self.logger.info(f"  Success rate: {result.success_rate:.1f}%")
 
+        stats = result.translation_stats
+        if stats:
+            self.logger.info(
+                f"  Cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses "
+                f"({stats['cache_hit_rate']:.1f}% hit rate), "
+                f"{stats['api_calls_avoided']} API calls avoided"
+            )
+            self.logger.info(
+                f"  Placeholders: {stats['placeholder_repairs']} repaired, "
+                f"{stats['placeholder_fallbacks']} retranslated around formatting, "
+                f"{stats['placeholder_failures']} failed"
+            )
+
+            performance_logger = PerformanceLogger(self.logger)
+            for name, value in stats.items():
+                performance_logger.log_performance_metric(
+                    f"translation_{name}", value, workflow_id=result.workflow_id
+                )
+
         if result.error_messages:
             self.logger.error("Errors encountered:")
             for error in result.error_messages:
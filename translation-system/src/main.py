@@ -86,6 +86,7 @@ class TranslationSystemCLI:
                 ftp_download=args.ftp_download,
                 backup_original=args.backup,
                 parallel_processing=args.parallel,
+                deduplicate_segments=args.deduplicate,
                 max_workers=args.workers,
                 file_patterns=args.patterns
                 if args.patterns
@@ -183,6 +184,19 @@ class TranslationSystemCLI:
         print(f"  Total translations: {result.total_translations}")
         print(f"  Files uploaded: {result.uploaded_files}")
 
+        stats = result.translation_stats
+        if stats:
+            print(
+                f"  Cache hits: {stats['cache_hits']}/{stats['cache_hits'] + stats['cache_misses']}"
+                f" ({stats['cache_hit_rate']:.1f}%)"
+            )
+            print(f"  API calls: {stats['api_calls']} ({stats['api_calls_avoided']} avoided)")
+            print(
+                f"  Placeholders: {stats['placeholder_repairs']} repaired, "
+                f"{stats['placeholder_fallbacks']} retranslated around formatting, "
+                f"{stats['placeholder_failures']} failed"
+            )
+
         if result.error_messages:
             print(f"\nErrors:")
             for error in result.error_messages:
@@ -202,6 +216,7 @@ class TranslationSystemCLI:
             "success_rate": result.success_rate,
             "total_translations": result.total_translations,
             "uploaded_files": result.uploaded_files,
+            "translation_stats": result.translation_stats,
             "error_messages": result.error_messages,
         }
 
@@ -246,6 +261,7 @@ class TranslationSystemCLI:
                     "processing_time": r.processing_time,
                     "files_processed": f"{r.processed_files}/{r.total_files}",
                     "translations": r.total_translations,
+                    "translation_stats": r.translation_stats,
                 }
                 for r in results
             ],
@@ -326,6 +342,12 @@ Examples:
     translate_parser.add_argument(
         "--no-parallel", dest="parallel", action="store_false", help="Disable parallel processing"
     )
+    translate_parser.add_argument(
+        "--no-dedup",
+        dest="deduplicate",
+        action="store_false",
+        help="Translate each file separately instead of deduplicating segments across files",
+    )
     translate_parser.add_argument(
         "--workers", type=int, default=4, help="Number of parallel workers"
     )
@@ -0,0 +1,163 @@
+"""
+Async Translation Service for Multilingual Text Management System
+
+asyncio front end to TranslationService that keeps many segment and
+language requests in flight at once under a configurable limit.
+"""
+
+import asyncio
+import logging
+import weakref
+import concurrent.futures
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.translation_service import TranslationService, TranslationResult
+
+
+class AsyncTranslationService:
+    """Translate with bounded concurrency from asyncio code
+
+    The backends are blocking HTTP clients, so each request runs on a
+    worker thread sized to the in-flight limit. Caching, retries and the
+    shared per-backend rate limiter all come from the wrapped
+    TranslationService.
+    """
+
+    def __init__(
+        self, translation_service: TranslationService, max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize async translation service
+
+        Args:
+            translation_service: Synchronous service doing the actual work
+            max_concurrency: Maximum requests in flight (default from config)
+        """
+        self.translation_service = translation_service
+        self.max_concurrency = (
+            max_concurrency or translation_service.config.max_concurrent_requests
+        )
+        self.logger = logging.getLogger(__name__)
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="translation"
+        )
+        # asyncio primitives belong to one event loop, so keep one per loop
+        self._semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the in-flight limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def translate_text(
+        self, text: str, target_language: str, source_language: Optional[str] = None
+    ) -> TranslationResult:
+        """
+        Translate text once a concurrency slot is free
+
+        Args:
+            text: Text to translate
+            target_language: Target language code
+            source_language: Source language code (auto-detect if None)
+
+        Returns:
+            TranslationResult: Translation result
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self.translation_service.translate_text,
+                text,
+                target_language,
+                source_language,
+            )
+
+    async def translate_text_multi(
+        self, text: str, target_languages: List[str], source_language: Optional[str] = None
+    ) -> Dict[str, TranslationResult]:
+        """
+        Translate text into several languages once a concurrency slot is free
+
+        Args:
+            text: Text to translate
+            target_languages: Target language codes
+            source_language: Source language code (auto-detect if None)
+
+        Returns:
+            Dict[str, TranslationResult]: Translation result by target language
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self.translation_service.translate_text_multi,
+                text,
+                target_languages,
+                source_language,
+            )
+
+    async def translate_batch(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate texts into one language as a batch once a concurrency slot is free
+
+        Args:
+            texts: Texts to translate
+            target_language: Target language code
+            source_language: Source language code (auto-detect if None)
+
+        Returns:
+            List[TranslationResult]: Translation results in input order
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self.translation_service.translate_batch,
+                texts,
+                target_language,
+                source_language,
+            )
+
+    async def translate_many(
+        self, requests: Iterable[Tuple[str, str, Optional[str]]]
+    ) -> List[TranslationResult]:
+        """
+        Translate many (text, target_language, source_language) requests concurrently
+
+        Args:
+            requests: Requests spanning any mix of segments and languages
+
+        Returns:
+            List[TranslationResult]: Results in request order
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.translate_text(text, target_language, source_language)
+                    for text, target_language, source_language in requests
+                )
+            )
+        )
+
+    def close(self) -> None:
+        """Shut down the worker threads"""
+        self._executor.shutdown(wait=True)
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads without blocking the event loop"""
+        # Waiting for running requests to drain can take a full backend call
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> "AsyncTranslationService":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
@@ -0,0 +1,139 @@
+"""
+Circuit Breaker for Multilingual Text Management System
+
+Tracks the health of each translation backend so that a failing or
+stalling provider stops receiving traffic until a probe shows it recovered.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+
+
+class CircuitBreaker:
+    """Error-rate and slow-call circuit breaker for one backend
+
+    The breaker is closed while the backend is healthy. When the share of
+    failed or slow calls among the recent ones reaches the threshold it
+    opens and rejects calls. After open_seconds one probe call is let
+    through (half-open): a success closes the breaker again, a failure
+    reopens it. A call made while the breaker is open, because the caller
+    had no other backend left, closes it when it succeeds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # Recent calls considered, and how many are needed before tripping
+    WINDOW_SIZE = 20
+    MIN_CALLS = 5
+
+    def __init__(
+        self,
+        name: str,
+        error_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 0.0,
+        open_seconds: float = 30.0,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Backend name used in log messages
+            error_rate_threshold: Share of bad calls that opens the breaker
+            slow_call_seconds: Calls slower than this count as bad (0 = off)
+            open_seconds: Time to wait before probing an open backend
+        """
+        self.name = name
+        self.error_rate_threshold = error_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._outcomes: deque = deque(maxlen=self.WINDOW_SIZE)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current breaker state"""
+        with self._lock:
+            if self._state == self.OPEN and self._probe_due():
+                return self.HALF_OPEN
+            return self._state
+
+    def _probe_due(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.open_seconds
+
+    def allow_request(self) -> bool:
+        """Tell whether a call may be sent to the backend now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN and self._probe_due():
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # Half-open: exactly one probe at a time
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self, latency: float = 0.0) -> None:
+        """
+        Record a completed call
+
+        Args:
+            latency: Call duration in seconds
+        """
+        if self.slow_call_seconds and latency > self.slow_call_seconds:
+            self._record(False, f"slow response ({latency:.1f}s)")
+        else:
+            self._record(True)
+
+    def record_failure(self, reason: str = "error") -> None:
+        """Record a failed call"""
+        self._record(False, reason)
+
+    def _record(self, ok: bool, reason: str = "") -> None:
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if ok:
+                    self._close()
+                else:
+                    self._open(f"probe failed: {reason}")
+                return
+
+            if self._state == self.OPEN:
+                if ok:
+                    self._close()
+                return
+
+            self._outcomes.append(ok)
+            if self._state == self.CLOSED and len(self._outcomes) >= self.MIN_CALLS:
+                error_rate = self._outcomes.count(False) / len(self._outcomes)
+                if error_rate >= self.error_rate_threshold:
+                    self._open(f"{error_rate:.0%} of recent calls failed, last: {reason}")
+
+    def _close(self) -> None:
+        """Resume normal traffic to the backend (lock held)"""
+        self._state = self.CLOSED
+        self._outcomes.clear()
+        self.logger.info(f"Backend {self.name} recovered, circuit closed")
+
+    def _open(self, reason: str) -> None:
+        """Stop sending traffic to the backend (lock held)"""
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.logger.warning(
+            f"Backend {self.name} circuit opened ({reason}), "
+            f"probing again in {self.open_seconds:.0f}s"
+        )
@@ -5,19 +5,29 @@ Handles various file types (txt, md, html, json) with content extraction,
 translation, and preservation of original structure and formatting.
 """
 
+import re
 import json
+import time
+import asyncio
+import concurrent.futures
+import hashlib
 import logging
+import secrets
+import threading
 import chardet
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 # For HTML processing
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution
 
 from core.config_manager import ConfigManager
-from services.translation_service import TranslationService
+from services.translation_service import TranslationService, TranslationResult
+from services.async_translation_service import AsyncTranslationService
 
 
 @dataclass
@@ -252,121 +262,205 @@ class MarkdownFileProcessor(BaseFileProcessor):
         return translated_text
 
 
+@dataclass
+class _HTMLTemplate:
+    """Serialized HTML document with a slot for every translatable string"""
+
+    parts: List[str]  # Markup between slots, one more than slot_order
+    slot_order: List[int]  # Slot filling each gap between parts
+    slot_ids: List[List[str]]  # Element ids sharing each slot, last applied wins
+    slot_originals: List[str]  # Serialized original of each slot
+    slot_is_attribute: List[bool]
+
+    def render(self, translations: Dict[str, str]) -> str:
+        """Fill every slot with its translation, or its original when untranslated"""
+        output = [self.parts[0]]
+        for slot, part in zip(self.slot_order, self.parts[1:]):
+            value = None
+            for element_id in self.slot_ids[slot]:
+                value = translations.get(element_id, value)
+
+            if value is None:
+                output.append(self.slot_originals[slot])
+            elif self.slot_is_attribute[slot]:
+                output.append(
+                    EntitySubstitution.quoted_attribute_value(
+                        EntitySubstitution.substitute_xml(value)
+                    )
+                )
+            else:
+                output.append(EntitySubstitution.substitute_xml(value))
+            output.append(part)
+        return "".join(output)
+
+
 class HTMLFileProcessor(BaseFileProcessor):
-    """Processor for HTML files (.html, .htm)"""
+    """Processor for HTML files (.html, .htm)
+
+    A document is parsed once. Extraction records every translatable text
+    node and attribute in a single walk of the tree, and serializes the
+    document with a sentinel in each of those places. Each language's
+    output is then produced by filling the sentinels, without parsing the
+    document again.
+    """
+
+    TRANSLATABLE_TAGS = [
+        "title",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "p",
+        "a",
+        "span",
+        "div",
+        "td",
+        "th",
+        "li",
+        "label",
+        "button",
+    ]
+
+    # Parsed documents kept, keyed by content hash
+    TEMPLATE_CACHE_SIZE = 256
+
+    def __init__(self, config_manager: ConfigManager, translation_service: TranslationService):
+        super().__init__(config_manager, translation_service)
+        self._templates: "OrderedDict[str, Tuple[List[Tuple[str, str]], _HTMLTemplate]]" = (
+            OrderedDict()
+        )
+        self._templates_lock = threading.Lock()
 
     def can_process(self, file_path: str) -> bool:
         return Path(file_path).suffix.lower() in [".html", ".htm"]
 
     def extract_translatable_content(self, content: str) -> List[Tuple[str, str]]:
         """Extract translatable content from HTML"""
-        soup = BeautifulSoup(content, "html.parser")
-        translatable = []
-
-        # Extract text from common translatable tags
-        translatable_tags = [
-            "title",
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "p",
-            "a",
-            "span",
-            "div",
-            "td",
-            "th",
-            "li",
-            "label",
-            "button",
-        ]
-
-        for tag_name in translatable_tags:
-            elements = soup.find_all(tag_name)
-            for i, element in enumerate(elements):
-                if element.string and element.string.strip():
-                    text = element.string.strip()
-                    if len(text) > 1 and not text.isdigit():  # Skip very short text and numbers
-                        element_id = f"{tag_name}_{i}"
-                        translatable.append((element_id, text))
-
-        # Extract alt attributes from images
-        images = soup.find_all("img", alt=True)
-        for i, img in enumerate(images):
-            alt_text = img.get("alt", "").strip()
-            if alt_text and len(alt_text) > 1:
-                translatable.append((f"img_alt_{i}", alt_text))
-
-        # Extract title attributes
-        elements_with_title = soup.find_all(attrs={"title": True})
-        for i, element in enumerate(elements_with_title):
-            title_text = element.get("title", "").strip()
-            if title_text and len(title_text) > 1:
-                translatable.append((f"title_attr_{i}", title_text))
-
-        return translatable
+        translatable, _ = self._parse(content)
+        return list(translatable)
 
     def rebuild_content(
         self, original_content: str, translations: Dict[str, Dict[str, str]]
     ) -> Dict[str, str]:
         """Rebuild HTML content with translations"""
         results = {}
+        _, template = self._parse(original_content)
 
         for language in self.config_manager.translation_config.target_languages:
             if language == self.config_manager.translation_config.source_language:
                 results[language] = original_content
                 continue
 
-            lang_translations = translations.get(language, {})
-            soup = BeautifulSoup(original_content, "html.parser")
-
-            # Replace translatable text
-            translatable_tags = [
-                "title",
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-                "p",
-                "a",
-                "span",
-                "div",
-                "td",
-                "th",
-                "li",
-                "label",
-                "button",
-            ]
-
-            for tag_name in translatable_tags:
-                elements = soup.find_all(tag_name)
-                for i, element in enumerate(elements):
-                    element_id = f"{tag_name}_{i}"
-                    if element_id in lang_translations and element.string:
-                        element.string.replace_with(lang_translations[element_id])
-
-            # Replace alt attributes
-            images = soup.find_all("img", alt=True)
-            for i, img in enumerate(images):
-                alt_id = f"img_alt_{i}"
-                if alt_id in lang_translations:
-                    img["alt"] = lang_translations[alt_id]
-
-            # Replace title attributes
-            elements_with_title = soup.find_all(attrs={"title": True})
-            for i, element in enumerate(elements_with_title):
-                title_id = f"title_attr_{i}"
-                if title_id in lang_translations:
-                    element["title"] = lang_translations[title_id]
-
-            results[language] = str(soup)
+            results[language] = template.render(translations.get(language, {}))
 
         return results
 
+    def _parse(self, content: str) -> Tuple[List[Tuple[str, str]], _HTMLTemplate]:
+        """Get the translatable content and template of a document, parsing it once"""
+        key = hashlib.md5(content.encode("utf-8")).hexdigest()
+        with self._templates_lock:
+            parsed = self._templates.get(key)
+            if parsed is not None:
+                self._templates.move_to_end(key)
+                return parsed
+
+        parsed = self._build_template(content)
+        with self._templates_lock:
+            self._templates[key] = parsed
+            while len(self._templates) > self.TEMPLATE_CACHE_SIZE:
+                self._templates.popitem(last=False)
+        return parsed
+
+    def _build_template(self, content: str) -> Tuple[List[Tuple[str, str]], _HTMLTemplate]:
+        """Parse a document, collect its translatable strings and slot them out"""
+        soup = BeautifulSoup(content, "html.parser")
+
+        # Element ids number each tag name, images with alt and elements with
+        # a title separately, in document order
+        tag_counts = Counter()
+        by_tag: Dict[str, List[Tuple[str, str, Any]]] = {tag: [] for tag in self.TRANSLATABLE_TAGS}
+        alts = []
+        titles = []
+        alt_count = title_count = 0
+
+        for element in soup.find_all(True):
+            if element.name in by_tag:
+                element_id = f"{element.name}_{tag_counts[element.name]}"
+                tag_counts[element.name] += 1
+                if element.string and element.string.strip():
+                    text = element.string.strip()
+                    if len(text) > 1 and not text.isdigit():  # Skip very short text and numbers
+                        by_tag[element.name].append((element_id, text, element.string))
+
+            if element.name == "img" and element.has_attr("alt"):
+                alt_text = element.get("alt", "").strip()
+                if alt_text and len(alt_text) > 1:
+                    alts.append((f"img_alt_{alt_count}", alt_text, element))
+                alt_count += 1
+
+            if element.has_attr("title"):
+                title_text = element.get("title", "").strip()
+                if title_text and len(title_text) > 1:
+                    titles.append((f"title_attr_{title_count}", title_text, element))
+                title_count += 1
+
+        marker = secrets.token_hex(8)
+        slot_ids: List[List[str]] = []
+        slot_originals: List[str] = []
+        slot_is_attribute: List[bool] = []
+
+        # Nested single-child elements share one text node, so one slot
+        node_slots: Dict[int, int] = {}
+        for tag in self.TRANSLATABLE_TAGS:
+            for element_id, _, node in by_tag[tag]:
+                slot = node_slots.get(id(node))
+                if slot is None:
+                    slot = node_slots[id(node)] = len(slot_ids)
+                    slot_ids.append([])
+                    slot_originals.append(node.output_ready("minimal"))
+                    slot_is_attribute.append(False)
+                slot_ids[slot].append(element_id)
+
+        string_nodes = {}
+        for tag in self.TRANSLATABLE_TAGS:
+            for _, _, node in by_tag[tag]:
+                string_nodes[id(node)] = node
+        for node_id, node in string_nodes.items():
+            node.replace_with(f"{marker}{node_slots[node_id]}{marker}")
+
+        for attribute, entries in (("alt", alts), ("title", titles)):
+            for element_id, _, element in entries:
+                slot_ids.append([element_id])
+                slot_originals.append(
+                    EntitySubstitution.quoted_attribute_value(
+                        EntitySubstitution.substitute_xml(element[attribute])
+                    )
+                )
+                slot_is_attribute.append(True)
+                element[attribute] = f"{marker}{len(slot_ids) - 1}{marker}"
+
+        # Attribute sentinels are serialized with their quotes, which the
+        # slot brings back as needed for the value
+        markup = str(soup)
+        parts = []
+        slot_order = []
+        position = 0
+        for match in re.finditer(f'"{marker}(\\d+){marker}"|{marker}(\\d+){marker}', markup):
+            parts.append(markup[position : match.start()])
+            slot_order.append(int(match.group(1) or match.group(2)))
+            position = match.end()
+        parts.append(markup[position:])
+
+        translatable = [
+            (element_id, text)
+            for entries in list(by_tag.values()) + [alts, titles]
+            for element_id, text, _ in entries
+        ]
+        template = _HTMLTemplate(parts, slot_order, slot_ids, slot_originals, slot_is_attribute)
+        return translatable, template
+
 
 class JSONFileProcessor(BaseFileProcessor):
     """Processor for JSON files (.json)"""
@@ -480,6 +574,9 @@ class JSONFileProcessor(BaseFileProcessor):
 class FileProcessorManager:
     """Manager for file processing with multiple processors"""
 
+    # Segments of one language handed to the translation service per call
+    SEGMENTS_PER_BATCH = 50
+
     def __init__(self, config_manager: ConfigManager, translation_service: TranslationService):
         """
         Initialize file processor manager
@@ -492,6 +589,11 @@ class FileProcessorManager:
         self.translation_service = translation_service
         self.logger = logging.getLogger(__name__)
 
+        # Segment requests from all files share one bounded worker pool
+        self.async_translation_service = AsyncTranslationService(
+            translation_service, config_manager.translation_config.max_concurrent_requests
+        )
+
         # Initialize processors
         self.processors = [
             TextFileProcessor(config_manager, translation_service),
@@ -500,6 +602,109 @@ class FileProcessorManager:
             JSONFileProcessor(config_manager, translation_service),
         ]
 
+    def translate_content(
+        self, translatable_content: List[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Translate extracted segments into every target language
+
+        Each language's segments are sent as batches so short segments can
+        share requests, and the batches of all languages are translated
+        concurrently, bounded by the translation service's in-flight limit.
+        Backends that answer several target languages in one request get one
+        request per segment for all languages instead.
+
+        Args:
+            translatable_content: (identifier, text) pairs from a processor
+
+        Returns:
+            Dict[str, Dict[str, str]]: Translations by language and identifier
+        """
+        source_lang = self.config_manager.translation_config.source_language
+        target_langs = [
+            lang
+            for lang in self.config_manager.translation_config.target_languages
+            if lang != source_lang
+        ]
+
+        if self.translation_service.supports_multi_target and len(target_langs) > 1:
+            return self._translate_content_multi_target(
+                translatable_content, target_langs, source_lang
+            )
+
+        texts = [text for _, text in translatable_content]
+        batches = [
+            texts[start : start + self.SEGMENTS_PER_BATCH]
+            for start in range(0, len(texts), self.SEGMENTS_PER_BATCH)
+        ]
+
+        async def translate_all() -> List[List[TranslationResult]]:
+            return await asyncio.gather(
+                *(
+                    self.async_translation_service.translate_batch(batch, target_lang, source_lang)
+                    for target_lang in target_langs
+                    for batch in batches
+                )
+            )
+
+        batch_results = asyncio.run(translate_all())
+
+        result_iter = (result for results in batch_results for result in results)
+        return self._collect_translations(
+            translatable_content,
+            target_langs,
+            lambda identifier, target_lang: next(result_iter),
+        )
+
+    def _translate_content_multi_target(
+        self,
+        translatable_content: List[Tuple[str, str]],
+        target_langs: List[str],
+        source_lang: Optional[str],
+    ) -> Dict[str, Dict[str, str]]:
+        """Translate each segment into all target languages with one request"""
+
+        async def translate_all() -> List[Dict[str, TranslationResult]]:
+            return await asyncio.gather(
+                *(
+                    self.async_translation_service.translate_text_multi(
+                        text, target_langs, source_lang
+                    )
+                    for _, text in translatable_content
+                )
+            )
+
+        identifiers = [identifier for identifier, _ in translatable_content]
+        segment_results = dict(zip(identifiers, asyncio.run(translate_all())))
+        return self._collect_translations(
+            translatable_content,
+            target_langs,
+            lambda identifier, target_lang: segment_results[identifier][target_lang],
+        )
+
+    def _collect_translations(
+        self,
+        translatable_content: List[Tuple[str, str]],
+        target_langs: List[str],
+        get_result: Callable[[str, str], TranslationResult],
+    ) -> Dict[str, Dict[str, str]]:
+        """Arrange results by language, keeping the original for failed segments"""
+        translations: Dict[str, Dict[str, str]] = {lang: {} for lang in target_langs}
+        for target_lang in target_langs:
+            lang_translations = translations[target_lang]
+            for identifier, text in translatable_content:
+                result = get_result(identifier, target_lang)
+
+                if result.translated_text and not result.error_message:
+                    lang_translations[identifier] = result.translated_text
+                else:
+                    self.logger.warning(
+                        f"Translation failed for {identifier}: {result.error_message}"
+                    )
+                    lang_translations[identifier] = text  # Keep original
+
+        return translations
+
     def get_processor(self, file_path: str) -> Optional[BaseFileProcessor]:
         """Get appropriate processor for file"""
         for processor in self.processors:
@@ -507,6 +712,59 @@ class FileProcessorManager:
                 return processor
         return None
 
+    def _load_file(
+        self, file_path: Path
+    ) -> Tuple[Optional[BaseFileProcessor], str, List[Tuple[str, str]]]:
+        """
+        Read a file and extract its translatable segments
+
+        Returns:
+            Tuple of processor, original content and segments
+
+        Raises:
+            FileNotFoundError, ValueError: If the file cannot be processed
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File does not exist: {file_path}")
+
+        # Check if file is supported
+        if not self.config_manager.is_supported_file(str(file_path)):
+            raise ValueError(f"File type not supported: {file_path.suffix}")
+
+        # Get appropriate processor
+        processor = self.get_processor(str(file_path))
+        if not processor:
+            raise ValueError(f"No processor available for: {file_path.suffix}")
+
+        original_content = processor.read_file(str(file_path))
+        return processor, original_content, processor.extract_translatable_content(original_content)
+
+    def _write_translated_files(
+        self,
+        file_path: Path,
+        processor: BaseFileProcessor,
+        original_content: str,
+        translations: Dict[str, Dict[str, str]],
+        output_dir: Optional[str],
+    ) -> List[str]:
+        """Rebuild a file for each language and save the results"""
+        rebuilt_content = processor.rebuild_content(original_content, translations)
+
+        output_dir = Path(output_dir) if output_dir else file_path.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        translated_files = []
+        for language, content in rebuilt_content.items():
+            translated_filename = self.config_manager.get_translated_filename(
+                str(file_path.name), language
+            )
+            translated_path = output_dir / translated_filename
+
+            processor.write_file(str(translated_path), content)
+            translated_files.append(str(translated_path))
+
+        return translated_files
+
     def process_file(
         self, file_path: str, output_dir: Optional[str] = None
     ) -> FileProcessingResult:
@@ -520,43 +778,17 @@ class FileProcessorManager:
         Returns:
             FileProcessingResult: Processing result
         """
-        import time
-
         start_time = time.time()
-
         file_path = Path(file_path)
 
-        if not file_path.exists():
-            return FileProcessingResult(
-                file_path=str(file_path),
-                success=False,
-                error_message=f"File does not exist: {file_path}",
-            )
-
-        # Check if file is supported
-        if not self.config_manager.is_supported_file(str(file_path)):
-            return FileProcessingResult(
-                file_path=str(file_path),
-                success=False,
-                error_message=f"File type not supported: {file_path.suffix}",
-            )
-
-        # Get appropriate processor
-        processor = self.get_processor(str(file_path))
-        if not processor:
+        try:
+            processor, original_content, translatable_content = self._load_file(file_path)
+        except (OSError, ValueError) as e:
             return FileProcessingResult(
-                file_path=str(file_path),
-                success=False,
-                error_message=f"No processor available for: {file_path.suffix}",
+                file_path=str(file_path), success=False, error_message=str(e)
             )
 
         try:
-            # Read original content
-            original_content = processor.read_file(str(file_path))
-
-            # Extract translatable content
-            translatable_content = processor.extract_translatable_content(original_content)
-
             if not translatable_content:
                 self.logger.warning(f"No translatable content found in {file_path}")
                 return FileProcessingResult(
@@ -567,62 +799,155 @@ class FileProcessorManager:
                 )
 
             # Translate content
-            translations = {}
-            source_lang = self.config_manager.translation_config.source_language
+            translations = self.translate_content(translatable_content)
 
-            for target_lang in self.config_manager.translation_config.target_languages:
-                if target_lang == source_lang:
-                    continue
+            translated_files = self._write_translated_files(
+                file_path, processor, original_content, translations, output_dir
+            )
 
-                lang_translations = {}
-                for identifier, text in translatable_content:
-                    result = self.translation_service.translate_text(text, target_lang, source_lang)
+            return FileProcessingResult(
+                file_path=str(file_path),
+                success=True,
+                translated_files=translated_files,
+                processing_time=time.time() - start_time,
+                translations_count=len(translatable_content),
+            )
 
-                    if result.translated_text and not result.error_message:
-                        lang_translations[identifier] = result.translated_text
-                    else:
-                        self.logger.warning(
-                            f"Translation failed for {identifier}: {result.error_message}"
-                        )
-                        lang_translations[identifier] = text  # Keep original
+        except Exception as e:
+            processing_time = time.time() - start_time
+            error_msg = f"File processing failed: {e}"
+            self.logger.error(error_msg)
 
-                translations[target_lang] = lang_translations
+            return FileProcessingResult(
+                file_path=str(file_path),
+                success=False,
+                processing_time=processing_time,
+                error_message=error_msg,
+            )
 
-            # Rebuild content for each language
-            rebuilt_content = processor.rebuild_content(original_content, translations)
+    def process_files(
+        self, file_paths: List[str], output_dir: Optional[str] = None, max_workers: int = 1
+    ) -> List[FileProcessingResult]:
+        """
+        Process many files, translating each distinct segment only once
 
-            # Save translated files
-            output_dir = Path(output_dir) if output_dir else file_path.parent
-            output_dir.mkdir(parents=True, exist_ok=True)
+        Segments are extracted from every file first. Headers, footers and
+        boilerplate repeated across pages then cost one translation per
+        language, and every file is rebuilt from the shared result map.
+        If translating the shared segments fails, every file is processed
+        on its own instead, so one bad segment fails one file, not the run.
 
-            translated_files = []
-            for language, content in rebuilt_content.items():
-                translated_filename = self.config_manager.get_translated_filename(
-                    str(file_path.name), language
-                )
-                translated_path = output_dir / translated_filename
+        Args:
+            file_paths: Paths to input files
+            output_dir: Output directory (default: next to each input)
+            max_workers: Files extracted and rebuilt at the same time;
+                translation requests are bounded by max_concurrent_requests
+
+        Returns:
+            List[FileProcessingResult]: Processing result per file, in input order
+        """
+        start_time = time.time()
+        results: Dict[str, FileProcessingResult] = {}
+        loaded = []
+        segment_counts: Counter = Counter()
+
+        def load(file_path: str):
+            try:
+                return self._load_file(Path(file_path)), None
+            except Exception as e:
+                return None, e
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Extract segments from all files
+            for file_path, (content, error) in zip(file_paths, executor.map(load, file_paths)):
+                if error is not None:
+                    self.logger.error(f"Failed to process: {file_path} - {error}")
+                    results[file_path] = FileProcessingResult(
+                        file_path=file_path, success=False, error_message=str(error)
+                    )
+                    continue
 
-                processor.write_file(str(translated_path), content)
-                translated_files.append(str(translated_path))
+                loaded.append((file_path, *content))
+                segment_counts.update(text for _, text in content[2])
 
-            processing_time = time.time() - start_time
+            total_segments = sum(segment_counts.values())
+            self.logger.info(
+                f"Extracted {total_segments} segments from {len(loaded)} files, "
+                f"{len(segment_counts)} unique"
+            )
+
+            # Translate each unique segment once per language
+            try:
+                shared_translations = (
+                    self.translate_content([(text, text) for text in segment_counts])
+                    if segment_counts
+                    else {}
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Translating shared segments failed, processing files one by one: {e}"
+                )
+                paths = [file_path for file_path, *_ in loaded]
+                for file_path, result in zip(
+                    paths, executor.map(lambda path: self.process_file(path, output_dir), paths)
+                ):
+                    results[file_path] = result
+                return [results[file_path] for file_path in file_paths]
+            translation_time = time.time() - start_time
+
+            # Rebuild every file from the shared result map
+            rebuilt = executor.map(
+                lambda item: self._rebuild_file(*item, shared_translations, output_dir), loaded
+            )
+            for (file_path, *_), result in zip(loaded, rebuilt):
+                results[file_path] = result
+
+        self.logger.info(
+            f"Translated {len(segment_counts)} unique segments for {len(loaded)} files "
+            f"in {translation_time:.2f}s"
+        )
+        return [results[file_path] for file_path in file_paths]
+
+    def _rebuild_file(
+        self,
+        file_path: str,
+        processor: BaseFileProcessor,
+        original_content: str,
+        translatable_content: List[Tuple[str, str]],
+        shared_translations: Dict[str, Dict[str, str]],
+        output_dir: Optional[str],
+    ) -> FileProcessingResult:
+        """Write one file's translations from the shared segment translations"""
+        file_start = time.time()
+        try:
+            if translatable_content:
+                translations = {
+                    lang: {
+                        identifier: lang_translations[text]
+                        for identifier, text in translatable_content
+                    }
+                    for lang, lang_translations in shared_translations.items()
+                }
+                translated_files = self._write_translated_files(
+                    Path(file_path), processor, original_content, translations, output_dir
+                )
+            else:
+                self.logger.warning(f"No translatable content found in {file_path}")
+                translated_files = []
 
             return FileProcessingResult(
-                file_path=str(file_path),
+                file_path=file_path,
                 success=True,
                 translated_files=translated_files,
-                processing_time=processing_time,
+                processing_time=time.time() - file_start,
                 translations_count=len(translatable_content),
             )
-
         except Exception as e:
-            processing_time = time.time() - start_time
             error_msg = f"File processing failed: {e}"
             self.logger.error(error_msg)
-
             return FileProcessingResult(
-                file_path=str(file_path),
+                file_path=file_path,
                 success=False,
-                processing_time=processing_time,
+                processing_time=time.time() - file_start,
                 error_message=error_msg,
             )
@@ -0,0 +1,191 @@
+"""
+Glossary for Multilingual Text Management System
+
+Protects brand names, product codes and legal terms from translation and
+enforces per-language translations of glossary terms. Terms are compiled
+into an Aho-Corasick automaton, so a segment is scanned once no matter how
+many terms the glossary holds.
+"""
+
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TermAutomaton:
+    """Aho-Corasick automaton over case-insensitive terms
+
+    Matches are whole words only: a term whose first or last character is
+    a letter or digit must not continue a longer word on that side. Where
+    matches overlap, the leftmost and then the longest one is kept.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Build the automaton
+
+        Args:
+            terms: Terms to recognize
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+
+        for term in terms:
+            if term:
+                self._add(term)
+        self._link()
+
+    def _add(self, term: str) -> None:
+        state = 0
+        for char in term:
+            char = char.lower()
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        if len(term) not in self._outputs[state]:
+            self._outputs[state].append(len(term))
+
+    def _link(self) -> None:
+        """Set failure links breadth-first and merge outputs along them"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = link if link != next_state else 0
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find non-overlapping whole-word term occurrences
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) spans in text order
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        candidates = []
+        state = 0
+
+        for position, char in enumerate(text):
+            char = char.lower()
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length in outputs[state]:
+                candidates.append((position + 1 - length, position + 1))
+
+        candidates.sort(key=lambda span: (span[0], -span[1]))
+        spans = []
+        covered = 0
+        for start, end in candidates:
+            if start < covered or not self._whole_word(text, start, end):
+                continue
+            spans.append((start, end))
+            covered = end
+        return spans
+
+    @staticmethod
+    def _whole_word(text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+
+class Glossary:
+    """Do-not-translate terms and forced per-language translations
+
+    Every glossary term is kept out of the backend request. Terms with a
+    forced translation for the target language are replaced by it on
+    output; all others come back exactly as written in the source.
+    """
+
+    def __init__(
+        self,
+        do_not_translate: Optional[List[str]] = None,
+        translations: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        """
+        Initialize glossary
+
+        Args:
+            do_not_translate: Terms that are never translated
+            translations: Forced translation by language code, per term
+        """
+        self.logger = logging.getLogger(__name__)
+
+        self._translations = {
+            term.lower(): dict(by_language) for term, by_language in (translations or {}).items()
+        }
+        self._terms = set(do_not_translate or []) | set(translations or {})
+        self._automaton = TermAutomaton(self._terms)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Glossary":
+        """
+        Load a glossary from a JSON file
+
+        The file holds a "do_not_translate" list of terms and a
+        "translations" object mapping terms to {language: translation}.
+
+        Args:
+            path: Glossary file path
+
+        Returns:
+            Glossary: Loaded glossary
+        """
+        with open(Path(path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        glossary = cls(data.get("do_not_translate"), data.get("translations"))
+        glossary.logger.info(f"Loaded {len(glossary)} glossary terms from {path}")
+        return glossary
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def find_terms(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find glossary terms in a text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) spans in text order
+        """
+        return self._automaton.find(text)
+
+    def target_term(self, term: str, target_language: Optional[str]) -> str:
+        """
+        Get the text a term found in the source becomes in a target language
+
+        Args:
+            term: Term as written in the source text
+            target_language: Target language code
+
+        Returns:
+            str: Forced translation, or the term unchanged
+        """
+        return self._translations.get(term.lower(), {}).get(target_language, term)
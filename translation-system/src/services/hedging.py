@@ -0,0 +1,77 @@
+"""
+Request Hedging for Multilingual Text Management System
+
+Decides when a slow translation call deserves a duplicate request, based
+on the latency observed per backend and a cap on the share of hedged calls.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+class HedgePolicy:
+    """Latency-percentile hedging with a budget on extra requests
+
+    A call still running after the chosen percentile of its backend's
+    recent latencies gets a duplicate, as long as the hedged share of all
+    calls stays under max_hedge_rate.
+    """
+
+    # Recent latencies kept per backend, and how many are needed to hedge
+    WINDOW_SIZE = 500
+    MIN_SAMPLES = 20
+
+    def __init__(self, percentile: float = 95.0, max_hedge_rate: float = 0.05):
+        """
+        Initialize hedge policy
+
+        Args:
+            percentile: Latency percentile after which a call is hedged
+            max_hedge_rate: Maximum share of calls that may be hedged
+        """
+        self.percentile = percentile
+        self.max_hedge_rate = max_hedge_rate
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+        self._calls = 0
+        self._hedges = 0
+
+    def record(self, service: str, latency: float) -> None:
+        """Record the latency of a successful call"""
+        with self._lock:
+            latencies = self._latencies.get(service)
+            if latencies is None:
+                latencies = self._latencies[service] = deque(maxlen=self.WINDOW_SIZE)
+            latencies.append(latency)
+
+    def hedge_delay(self, service: str) -> Optional[float]:
+        """
+        Count a new call and get how long to wait before hedging it
+
+        Args:
+            service: Backend the call goes to
+
+        Returns:
+            Optional[float]: Delay in seconds, or None while too few
+            latencies have been observed
+        """
+        with self._lock:
+            self._calls += 1
+            latencies = self._latencies.get(service)
+            if not latencies or len(latencies) < self.MIN_SAMPLES:
+                return None
+            ordered = sorted(latencies)
+
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget if the hedge rate allows it"""
+        with self._lock:
+            if self._hedges + 1 > self.max_hedge_rate * self._calls:
+                return False
+            self._hedges += 1
+            return True
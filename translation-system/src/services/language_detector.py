@@ -0,0 +1,208 @@
+"""
+Language Detector for Multilingual Text Management System
+
+Offline character n-gram language identification for the languages the
+system ships with, so source-language routing needs no API call.
+"""
+
+import math
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
+
+
+# Training text per language, in the register of the websites we translate
+SEED_TEXTS = {
+    "en": (
+        "Welcome to our family guesthouse in the heart of the mountains. We offer comfortable "
+        "rooms with private bathrooms, free wireless internet and a beautiful view of the "
+        "valley. Our restaurant serves traditional local dishes prepared from fresh "
+        "ingredients, and breakfast is included in the price of every stay. Guests can relax "
+        "in the garden, borrow bicycles or book a guided hiking trip with our staff. Check-in "
+        "starts at two in the afternoon and check-out is at ten in the morning. Please contact "
+        "us by phone or email if you have any questions about your reservation. We look "
+        "forward to welcoming you and your family. The weather is usually pleasant in summer, "
+        "while in winter the nearby ski resort is only a few minutes away by car. Pets are "
+        "allowed on request. Read our privacy policy and terms and conditions before booking."
+    ),
+    "sk": (
+        "Vitajte v našom rodinnom penzióne v srdci hôr. Ponúkame pohodlné izby s vlastnou "
+        "kúpeľňou, bezplatné bezdrôtové pripojenie na internet a krásny výhľad na údolie. Naša "
+        "reštaurácia podáva tradičné miestne jedlá pripravené z čerstvých surovín a raňajky sú "
+        "zahrnuté v cene každého pobytu. Hostia si môžu oddýchnuť v záhrade, požičať si "
+        "bicykle alebo si u nášho personálu objednať turistický výlet so sprievodcom. Príchod "
+        "je možný od druhej hodiny popoludní a odchod do desiatej hodiny ráno. Ak máte "
+        "akékoľvek otázky týkajúce sa vašej rezervácie, kontaktujte nás telefonicky alebo "
+        "e-mailom. Tešíme sa na vás a vašu rodinu. V lete je počasie zvyčajne príjemné, v zime "
+        "je blízke lyžiarske stredisko vzdialené len niekoľko minút autom. Domáce zvieratá sú "
+        "povolené na požiadanie. Pred rezerváciou si prečítajte zásady ochrany osobných údajov "
+        "a obchodné podmienky."
+    ),
+    "hu": (
+        "Üdvözöljük családi panziónkban, a hegyek szívében. Kényelmes szobákat kínálunk saját "
+        "fürdőszobával, ingyenes vezeték nélküli internettel és gyönyörű kilátással a völgyre. "
+        "Éttermünk friss alapanyagokból készült hagyományos helyi ételeket szolgál fel, és a "
+        "reggeli minden tartózkodás árában benne van. A vendégek pihenhetnek a kertben, "
+        "kerékpárt kölcsönözhetnek, vagy vezetett túrát foglalhatnak munkatársainknál. A "
+        "bejelentkezés délután kettő órától lehetséges, a kijelentkezés reggel tíz óráig. Ha "
+        "kérdése van a foglalásával kapcsolatban, kérjük, keressen minket telefonon vagy "
+        "e-mailben. Szeretettel várjuk Önt és családját. Nyáron az időjárás általában "
+        "kellemes, télen pedig a közeli síközpont autóval csak néhány percre van. "
+        "Háziállatokat kérésre fogadunk. Foglalás előtt olvassa el adatvédelmi szabályzatunkat "
+        "és általános szerződési feltételeinket."
+    ),
+    "de": (
+        "Willkommen in unserer familiengeführten Pension im Herzen der Berge. Wir bieten "
+        "gemütliche Zimmer mit eigenem Badezimmer, kostenloses WLAN und einen wunderschönen "
+        "Blick auf das Tal. Unser Restaurant serviert traditionelle regionale Gerichte aus "
+        "frischen Zutaten, und das Frühstück ist im Preis jedes Aufenthalts inbegriffen. Die "
+        "Gäste können sich im Garten entspannen, Fahrräder ausleihen oder bei unseren "
+        "Mitarbeitern eine geführte Wanderung buchen. Die Anreise ist ab vierzehn Uhr möglich, "
+        "die Abreise bis zehn Uhr morgens. Wenn Sie Fragen zu Ihrer Reservierung haben, "
+        "kontaktieren Sie uns bitte telefonisch oder per E-Mail. Wir freuen uns darauf, Sie "
+        "und Ihre Familie begrüßen zu dürfen. Im Sommer ist das Wetter meistens angenehm, und "
+        "im Winter ist das nahe Skigebiet nur wenige Minuten mit dem Auto entfernt. Haustiere "
+        "sind auf Anfrage erlaubt. Bitte lesen Sie vor der Buchung unsere "
+        "Datenschutzerklärung und die allgemeinen Geschäftsbedingungen."
+    ),
+    "pl": (
+        "Witamy w naszym rodzinnym pensjonacie w sercu gór. Oferujemy wygodne pokoje z własną "
+        "łazienką, bezpłatny bezprzewodowy dostęp do internetu oraz piękny widok na dolinę. "
+        "Nasza restauracja serwuje tradycyjne lokalne potrawy przygotowane ze świeżych "
+        "składników, a śniadanie jest wliczone w cenę każdego pobytu. Goście mogą odpocząć w "
+        "ogrodzie, wypożyczyć rowery lub zarezerwować u naszego personelu wycieczkę z "
+        "przewodnikiem. Zameldowanie jest możliwe od godziny czternastej, a wymeldowanie do "
+        "godziny dziesiątej rano. Jeśli mają Państwo pytania dotyczące rezerwacji, prosimy o "
+        "kontakt telefoniczny lub mailowy. Z radością powitamy Państwa i Państwa rodzinę. "
+        "Latem pogoda jest zazwyczaj przyjemna, a zimą pobliski ośrodek narciarski znajduje "
+        "się zaledwie kilka minut jazdy samochodem. Zwierzęta są akceptowane na życzenie. "
+        "Przed dokonaniem rezerwacji prosimy zapoznać się z polityką prywatności i regulaminem."
+    ),
+}
+
+
+def _words(text: str) -> List[str]:
+    """Lowercase letter runs of a text"""
+    normalized = "".join(char if char.isalpha() else " " for char in text.lower())
+    return normalized.split()
+
+
+class LanguageDetector:
+    """Character n-gram language identifier
+
+    Each language is modelled by add-one smoothed counts of the 1- to
+    3-character n-grams of its seed text, with words padded by spaces so
+    prefixes and suffixes count. A text gets the language under which its
+    n-grams are most probable. Results are cached by text hash.
+    """
+
+    # Texts with fewer letters than this are reported as unknown
+    MIN_LETTERS = 3
+
+    def __init__(
+        self,
+        seed_texts: Optional[Dict[str, str]] = None,
+        max_ngram: int = 3,
+        cache_size: int = 10000,
+    ):
+        """
+        Initialize language detector
+
+        Args:
+            seed_texts: Training text by language code (default: shipped languages)
+            max_ngram: Longest character n-gram used
+            cache_size: Number of detection results kept
+        """
+        self.max_ngram = max_ngram
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._models = {
+            language: self._train(text) for language, text in (seed_texts or SEED_TEXTS).items()
+        }
+
+    @property
+    def languages(self) -> List[str]:
+        """Language codes the detector can recognize"""
+        return list(self._models)
+
+    def _ngrams(self, text: str) -> List[str]:
+        """Character n-grams of every word of a text"""
+        grams = []
+        for word in _words(text):
+            padded = f" {word} "
+            for n in range(1, self.max_ngram + 1):
+                grams.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+        return grams
+
+    def _train(self, text: str) -> Dict[str, float]:
+        """Log-probability of each n-gram of a seed text, plus one for unseen grams"""
+        counts = Counter(self._ngrams(text))
+        total = sum(counts.values()) + len(counts) + 1
+        model = {gram: math.log((count + 1) / total) for gram, count in counts.items()}
+        model[""] = math.log(1 / total)
+        return model
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """
+        Average log-probability of the text's n-grams under each language
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Dict[str, float]: Score by language code, higher is more likely
+        """
+        grams = self._ngrams(text)
+        if not grams:
+            return {}
+
+        scores = {}
+        for language, model in self._models.items():
+            unseen = model[""]
+            scores[language] = sum(model.get(gram, unseen) for gram in grams) / len(grams)
+        return scores
+
+    def detect(self, text: str) -> str:
+        """
+        Detect the language of a text
+
+        Args:
+            text: Text to identify
+
+        Returns:
+            str: Language code, or "unknown" for texts with too few letters
+        """
+        key = hashlib.md5(text.encode("utf-8")).hexdigest()
+        with self._cache_lock:
+            language = self._cache.get(key)
+            if language is not None:
+                self._cache.move_to_end(key)
+                return language
+
+        if sum(char.isalpha() for char in text) < self.MIN_LETTERS:
+            language = "unknown"
+        else:
+            scores = self.scores(text)
+            language = max(scores, key=scores.get)
+
+        with self._cache_lock:
+            self._cache[key] = language
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+
+_detector: Optional[LanguageDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_language_detector() -> LanguageDetector:
+    """Get the detector shared by all translation services"""
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = LanguageDetector()
+        return _detector
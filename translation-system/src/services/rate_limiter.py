@@ -0,0 +1,183 @@
+"""
+Rate Limiter for Multilingual Text Management System
+
+Token-bucket request and character budgets shared by every thread that
+talks to the same translation backend, with AIMD adaptation to throttling
+responses from the provider.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Token bucket that lets callers reserve tokens ahead of time
+
+    Reservations may drive the balance negative; the caller then waits for
+    the deficit to refill. Concurrent callers therefore queue up in order
+    instead of all retrying at once.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second (0 means unlimited)
+            capacity: Maximum tokens that can accumulate
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take tokens and return how long the caller must wait for them"""
+        if self.rate <= 0:
+            return 0.0
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= amount
+
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Shared request and character budget for one translation backend
+
+    Rates adapt AIMD-style: a throttling response halves the current rate
+    and pauses all callers for the server's Retry-After, and each success
+    adds back a small fraction of the configured rate.
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_STEP = 0.01
+    MIN_FRACTION = 0.05
+
+    def __init__(self, requests_per_second: float, characters_per_second: float = 0.0):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_second: Request budget (0 means unlimited)
+            characters_per_second: Character budget (0 means unlimited)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.requests_per_second = requests_per_second
+        self.characters_per_second = characters_per_second
+
+        self._lock = threading.Lock()
+        self._fraction = 1.0
+        self._paused_until = 0.0
+        self._requests = TokenBucket(requests_per_second, max(requests_per_second, 1.0))
+        self._characters = TokenBucket(characters_per_second, characters_per_second)
+
+    @property
+    def current_fraction(self) -> float:
+        """Share of the configured rates currently in effect"""
+        return self._fraction
+
+    def acquire(self, characters: int = 0) -> float:
+        """
+        Block until one request of the given size fits the budget
+
+        Args:
+            characters: Number of characters the request will send
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self._paused_until - now,
+                self._requests.reserve(1, now),
+                self._characters.reserve(characters, now),
+                0.0,
+            )
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rates(self, requests_per_second: float, characters_per_second: float = 0.0) -> None:
+        """
+        Change the configured budgets, keeping the current throttling fraction
+
+        Args:
+            requests_per_second: Request budget (0 means unlimited)
+            characters_per_second: Character budget (0 means unlimited)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.requests_per_second = requests_per_second
+            self.characters_per_second = characters_per_second
+            self._requests.capacity = max(requests_per_second, 1.0)
+            self._characters.capacity = characters_per_second
+
+            for bucket in (self._requests, self._characters):
+                # An unlimited bucket never spent its tokens
+                if bucket.rate <= 0:
+                    bucket.tokens = bucket.capacity
+                    bucket.last_refill = now
+                bucket.tokens = min(bucket.tokens, bucket.capacity)
+            self._set_fraction(self._fraction)
+
+    def on_success(self) -> None:
+        """Additively restore the rate after a successful request"""
+        with self._lock:
+            if self._fraction < 1.0:
+                self._set_fraction(self._fraction + self.INCREASE_STEP)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicatively back off after a throttling response
+
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+        """
+        with self._lock:
+            self._set_fraction(self._fraction * self.DECREASE_FACTOR)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+        self.logger.warning(
+            f"Backend throttled, rate reduced to {self._fraction:.0%} of configured"
+            + (f", pausing {retry_after:.1f}s" if retry_after else "")
+        )
+
+    def _set_fraction(self, fraction: float) -> None:
+        """Scale both buckets to a fraction of the configured rates"""
+        self._fraction = min(1.0, max(self.MIN_FRACTION, fraction))
+        self._requests.rate = self.requests_per_second * self._fraction
+        self._characters.rate = self.characters_per_second * self._fraction
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    service: str, requests_per_second: float, characters_per_second: float = 0.0
+) -> RateLimiter:
+    """Get the rate limiter shared by all users of a backend, at the given rates"""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(service)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_second, characters_per_second)
+            _rate_limiters[service] = limiter
+        elif (limiter.requests_per_second, limiter.characters_per_second) != (
+            requests_per_second,
+            characters_per_second,
+        ):
+            limiter.logger.info(
+                f"Rate limits for {service} changed to {requests_per_second} requests/s "
+                f"and {characters_per_second} characters/s"
+            )
+            limiter.set_rates(requests_per_second, characters_per_second)
+        return limiter
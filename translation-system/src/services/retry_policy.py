@@ -0,0 +1,94 @@
+"""
+Retry Policy for Multilingual Text Management System
+
+Exponential backoff with full jitter for failed translation calls, and
+classification of errors that retrying cannot fix.
+"""
+
+import random
+from typing import Optional
+
+
+# HTTP statuses that mean the request itself is wrong or not allowed
+# (456 is DeepL's quota-exceeded status)
+FATAL_STATUS_CODES = {400, 401, 403, 404, 456}
+
+# Exception types raised by the backend libraries for the same conditions
+FATAL_ERROR_TYPES = {
+    "AuthenticationError",
+    "PermissionError",
+    "InvalidRequestError",
+    "LanguageNotSupportedException",
+    "InvalidSourceOrTargetLanguage",
+}
+
+FATAL_MESSAGES = ("invalid api key", "incorrect api key", "unauthorized", "forbidden")
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Tell whether a failed backend call may succeed when repeated
+
+    Args:
+        error: Exception raised by a backend call
+
+    Returns:
+        bool: False for authentication, permission, quota and malformed
+        request errors, True otherwise
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "http_status", None)
+    if status in FATAL_STATUS_CODES:
+        return False
+    if type(error).__name__ in FATAL_ERROR_TYPES:
+        return False
+
+    message = str(error).lower()
+    return not any(fatal in message for fatal in FATAL_MESSAGES)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter
+
+    Attempt n waits a random time between 0 and base_delay * 2**n, capped
+    at max_delay, so parallel workers that failed together do not retry
+    together. A server-provided Retry-After takes precedence.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            max_retries: Total number of attempts
+            base_delay: Backoff ceiling after the first failed attempt
+            max_delay: Largest backoff ceiling
+            jitter: Draw the delay uniformly below the ceiling
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the wait before the next attempt
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Server-provided delay in seconds, if any
+
+        Returns:
+            float: Seconds to wait
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
@@ -0,0 +1,278 @@
+"""
+Translation Memory for Multilingual Text Management System
+
+Stores previously translated segments and finds near-matches for new
+segments using a character n-gram index, so lightly edited content can
+reuse an earlier translation instead of going back to the backend.
+"""
+
+import math
+import re
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+
+@dataclass
+class MemoryMatch:
+    """Translation memory lookup result"""
+
+    source_text: str
+    translation: str
+    similarity: float
+    exact: bool = False
+
+
+class _LanguagePairIndex:
+    """In-memory n-gram index over the segments of one language pair"""
+
+    def __init__(self):
+        self.segments: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+        self.exact: Dict[str, int] = {}
+        self.grams: Dict[int, Set[str]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+
+
+class TranslationMemory:
+    """Segment-level translation memory with fuzzy matching
+
+    Each language pair gets an inverted index from character n-grams to
+    segments. Lookups use prefix filtering: with a Dice threshold ``t``, a
+    candidate must share at least ``t * n / (2 - t)`` of the query's ``n``
+    grams, so only the rarest grams of the query need to be probed. The
+    surviving candidates are scored with ``difflib.SequenceMatcher`` against
+    ``min_similarity``.
+
+    Only the ``MAX_INDEXED_SEGMENTS`` most recent segments of a pair are held
+    in memory, and only ``MAX_INDEXED_PAIRS`` pairs at a time; older segments
+    are still found by an exact lookup against the database. A fuzzy match is
+    refused when its numbers or placeholders differ from the query's.
+    """
+
+    MIN_FUZZY_LENGTH = 20
+    MAX_VERIFIED_CANDIDATES = 5
+    MAX_INDEXED_SEGMENTS = 100000
+    MAX_INDEXED_PAIRS = 8
+    PROTECTED_TOKEN_RE = re.compile(
+        r"___[A-Z]+(?:_[A-Z]+)*_\d+_\d+___|\{[^{}\s]*\}|%(?:\([^)\s]*\))?[sdf]|\d+"
+    )
+
+    def __init__(
+        self, memory_dir: str = "cache", min_similarity: float = 0.95, ngram_size: int = 3
+    ):
+        """
+        Initialize translation memory
+
+        Args:
+            memory_dir: Directory holding the memory database
+            min_similarity: Lowest similarity (0-1) accepted as a fuzzy match
+            ngram_size: Character n-gram length used for indexing
+        """
+        self.logger = logging.getLogger(__name__)
+        self.min_similarity = min_similarity
+        self.ngram_size = ngram_size
+
+        self.memory_dir = Path(memory_dir)
+        self.memory_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_file = self.memory_dir / "memory.db"
+
+        self._lock = threading.Lock()
+        self._indexes: "OrderedDict[Tuple[str, str], _LanguagePairIndex]" = OrderedDict()
+        self._conn = sqlite3.connect(
+            str(self.memory_file), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            "id INTEGER PRIMARY KEY, source_language TEXT NOT NULL, "
+            "target_language TEXT NOT NULL, source_text TEXT NOT NULL, "
+            "translation TEXT NOT NULL, "
+            "UNIQUE (source_language, target_language, source_text))"
+        )
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Collapse whitespace so formatting-only edits still match exactly"""
+        return " ".join(text.split())
+
+    @classmethod
+    def _protected_tokens(cls, text: str) -> List[str]:
+        """Get the numbers and placeholders a reused translation must keep"""
+        return sorted(cls.PROTECTED_TOKEN_RE.findall(text))
+
+    def _ngrams(self, normalized: str) -> Set[str]:
+        """Get the set of character n-grams of normalized text"""
+        padded = f" {normalized.lower()} "
+        if len(padded) <= self.ngram_size:
+            return {padded}
+        return {padded[i : i + self.ngram_size] for i in range(len(padded) - self.ngram_size + 1)}
+
+    def _index_segment(
+        self, index: _LanguagePairIndex, segment_id: int, source_text: str, translation: str
+    ) -> None:
+        """Add one segment to a language pair index"""
+        normalized = self._normalize(source_text)
+        index.segments[segment_id] = (source_text, translation)
+        index.exact[normalized] = segment_id
+
+        if len(normalized) < self.MIN_FUZZY_LENGTH:
+            return
+
+        grams = self._ngrams(normalized)
+        index.grams[segment_id] = grams
+        for gram in grams:
+            index.postings.setdefault(gram, set()).add(segment_id)
+
+        while len(index.segments) > self.MAX_INDEXED_SEGMENTS:
+            self._evict_oldest_segment(index)
+
+    @staticmethod
+    def _evict_oldest_segment(index: _LanguagePairIndex) -> None:
+        """Drop the least recently stored segment from a language pair index"""
+        segment_id, (source_text, _) = index.segments.popitem(last=False)
+        normalized = TranslationMemory._normalize(source_text)
+        if index.exact.get(normalized) == segment_id:
+            del index.exact[normalized]
+
+        for gram in index.grams.pop(segment_id, ()):
+            postings = index.postings[gram]
+            postings.discard(segment_id)
+            if not postings:
+                del index.postings[gram]
+
+    def _get_index(self, source_language: str, target_language: str) -> _LanguagePairIndex:
+        """Get the index for a language pair, building it on first use"""
+        pair = (source_language, target_language)
+        index = self._indexes.get(pair)
+        if index is not None:
+            self._indexes.move_to_end(pair)
+            return index
+
+        index = _LanguagePairIndex()
+        rows = self._conn.execute(
+            "SELECT id, source_text, translation FROM segments "
+            "WHERE source_language = ? AND target_language = ? "
+            "ORDER BY id DESC LIMIT ?",
+            (*pair, self.MAX_INDEXED_SEGMENTS),
+        ).fetchall()
+        for segment_id, source_text, translation in reversed(rows):
+            self._index_segment(index, segment_id, source_text, translation)
+
+        self._indexes[pair] = index
+        while len(self._indexes) > self.MAX_INDEXED_PAIRS:
+            self._indexes.popitem(last=False)
+        return index
+
+    def add(
+        self, text: str, translation: str, target_language: str, source_language: str = "auto"
+    ) -> None:
+        """Store a translated segment"""
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO segments "
+                    "(source_language, target_language, source_text, translation) "
+                    "VALUES (?, ?, ?, ?)",
+                    (source_language, target_language, text, translation),
+                )
+                if cursor.rowcount and (source_language, target_language) in self._indexes:
+                    self._index_segment(
+                        self._indexes[(source_language, target_language)],
+                        cursor.lastrowid,
+                        text,
+                        translation,
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not save translation memory segment: {e}")
+
+    def lookup(
+        self, text: str, target_language: str, source_language: str = "auto"
+    ) -> Optional[MemoryMatch]:
+        """
+        Find the stored segment most similar to text
+
+        Args:
+            text: Source text to look up
+            target_language: Target language code
+            source_language: Source language code
+
+        Returns:
+            Optional[MemoryMatch]: Best match at or above the similarity threshold
+        """
+        normalized = self._normalize(text)
+
+        try:
+            with self._lock:
+                index = self._get_index(source_language, target_language)
+
+                segment_id = index.exact.get(normalized)
+                if segment_id is not None:
+                    source_text, translation = index.segments[segment_id]
+                    return MemoryMatch(source_text, translation, 1.0, exact=True)
+
+                row = self._conn.execute(
+                    "SELECT translation FROM segments WHERE source_language = ? "
+                    "AND target_language = ? AND source_text = ?",
+                    (source_language, target_language, text),
+                ).fetchone()
+                if row is not None:
+                    return MemoryMatch(text, row[0], 1.0, exact=True)
+
+                if len(normalized) < self.MIN_FUZZY_LENGTH:
+                    return None
+
+                candidate_ids = self._find_candidates(index, self._ngrams(normalized))
+                candidates = [index.segments[segment_id] for segment_id in candidate_ids]
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not read translation memory: {e}")
+            return None
+
+        tokens = self._protected_tokens(normalized)
+        best = None
+        for source_text, translation in candidates:
+            if self._protected_tokens(source_text) != tokens:
+                continue
+            similarity = SequenceMatcher(None, normalized, self._normalize(source_text)).ratio()
+            if similarity >= self.min_similarity and (best is None or similarity > best.similarity):
+                best = MemoryMatch(source_text, translation, similarity)
+
+        return best
+
+    def _find_candidates(self, index: _LanguagePairIndex, grams: Set[str]) -> List[int]:
+        """Get ids of the segments most likely to pass the similarity threshold"""
+        # One edited character breaks up to ngram_size grams, so the gram-level
+        # threshold is looser than the character-level one.
+        threshold = max(0.0, 1 - self.ngram_size * (1 - self.min_similarity))
+        min_overlap = math.ceil(threshold * len(grams) / (2 - threshold))
+
+        # Any segment sharing min_overlap grams must contain one of the
+        # len(grams) - min_overlap + 1 rarest grams of the query.
+        probe = sorted(grams, key=lambda gram: len(index.postings.get(gram, ())))
+        probe = probe[: len(grams) - min_overlap + 1]
+
+        scored = []
+        seen: Set[int] = set()
+        for gram in probe:
+            for segment_id in index.postings.get(gram, ()):
+                if segment_id in seen:
+                    continue
+                seen.add(segment_id)
+
+                candidate_grams = index.grams[segment_id]
+                overlap = len(grams & candidate_grams)
+                dice = 2 * overlap / (len(grams) + len(candidate_grams))
+                if dice >= threshold:
+                    scored.append((dice, segment_id))
+
+        scored.sort(reverse=True)
+        return [segment_id for _, segment_id in scored[: self.MAX_VERIFIED_CANDIDATES]]
+
+    def close(self) -> None:
+        """Close the memory database"""
+        with self._lock:
+            self._conn.close()
@@ -6,18 +6,25 @@ and formatting preservation for various text types.
 """
 
 import re
+import math
 import time
 import json
+import random
 import logging
 import hashlib
-from typing import Dict, List, Optional, Any, Tuple
+import sqlite3
+import threading
+import dataclasses
+import concurrent.futures
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, fields
 from abc import ABC, abstractmethod
 
 # Translation libraries
+import requests
 from deep_translator import GoogleTranslator as DeepGoogleTranslator
-from deep_translator import DeeplTranslator
 
 # Optional advanced services
 try:
@@ -28,6 +35,13 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 from core.config_manager import ConfigManager, TranslationConfig
+from services.translation_memory import TranslationMemory
+from services.rate_limiter import RateLimiter, get_rate_limiter
+from services.circuit_breaker import CircuitBreaker
+from services.hedging import HedgePolicy
+from services.retry_policy import RetryPolicy, is_retryable_error
+from services.language_detector import get_language_detector
+from services.glossary import Glossary
 
 
 @dataclass
@@ -43,11 +57,261 @@ class TranslationResult:
     processing_time: float = 0.0
     cached: bool = False
     error_message: Optional[str] = None
+    throttled: bool = False
+    retry_after: Optional[float] = None
+    retryable: bool = True
+
+
+@dataclass
+class TranslationStats:
+    """Thread-safe counters for cache effectiveness and backend usage"""
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_stores: int = 0
+    cache_evictions: int = 0
+    bytes_saved: int = 0
+    memory_exact_hits: int = 0
+    memory_fuzzy_hits: int = 0
+    deduplicated_requests: int = 0
+    packed_segments: int = 0
+    packing_fallbacks: int = 0
+    hedged_requests: int = 0
+    hedge_wins: int = 0
+    placeholder_repairs: int = 0
+    placeholder_fallbacks: int = 0
+    placeholder_failures: int = 0
+    api_calls: int = 0
+    api_calls_avoided: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def increment(self, **counts: int) -> None:
+        """Add to one or more counters"""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get counters as a dictionary, including the derived hit rate"""
+        with self._lock:
+            counters = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+
+        lookups = counters["cache_hits"] + counters["cache_misses"]
+        counters["cache_hit_rate"] = counters["cache_hits"] / lookups * 100 if lookups else 0.0
+        return counters
+
+    def since(self, baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """Get counter increases since an earlier as_dict() snapshot"""
+        current = self.as_dict()
+        delta = {
+            name: value - baseline.get(name, 0)
+            for name, value in current.items()
+            if name != "cache_hit_rate"
+        }
+
+        lookups = delta["cache_hits"] + delta["cache_misses"]
+        delta["cache_hit_rate"] = delta["cache_hits"] / lookups * 100 if lookups else 0.0
+        return delta
+
+
+def throttle_details(error: Exception) -> Tuple[bool, Optional[float]]:
+    """
+    Tell whether a backend error is a throttling response
+
+    Args:
+        error: Exception raised by a backend call
+
+    Returns:
+        Tuple[bool, Optional[float]]: Whether the provider throttled the
+        request, and its Retry-After delay in seconds if it sent one
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "http_status", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None) or {}
+
+    throttled = (
+        status == 429
+        or type(error).__name__ in ("TooManyRequests", "RateLimitError")
+        or "too many requests" in str(error).lower()
+    )
+    if not throttled:
+        return False, None
+
+    try:
+        retry_after = float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        retry_after = None
+    return True, retry_after
+
+
+def split_into_batches(texts: List[str], max_items: int, max_chars: int) -> List[List[int]]:
+    """
+    Group text indices into batches within item and character limits
+
+    A text longer than max_chars on its own still gets a batch of its own.
+
+    Args:
+        texts: Texts to group
+        max_items: Maximum number of texts per batch
+        max_chars: Maximum total characters per batch
+
+    Returns:
+        List[List[int]]: Batches of indices into texts, in input order
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_chars = 0
+
+    for index, text in enumerate(texts):
+        if current and (len(current) >= max_items or current_chars + len(text) > max_chars):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(index)
+        current_chars += len(text)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# Boundaries tried in order when a text must be split: paragraphs,
+# sentences, then words
+_CHUNK_BOUNDARIES = [
+    re.compile(r"(\n\s*\n)"),
+    re.compile(r"(?<=[.!?…])(\s+)"),
+    re.compile(r"(\s+)"),
+]
+
+
+def chunk_text(text: str, max_chars: int, level: int = 0) -> List[Tuple[str, str]]:
+    """
+    Split text into chunks of at most max_chars on natural boundaries
+
+    Paragraph breaks are preferred over sentence ends, and sentence ends
+    over spaces. A word longer than max_chars is cut where it must be.
+    Whitespace-only pieces are folded into the neighbouring separators, so
+    no chunk is blank; whitespace leading the whole text stays in front of
+    the first chunk.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+        level: Boundary to start from (used when recursing)
+
+    Returns:
+        List[Tuple[str, str]]: (chunk, separator) pairs; joining every
+        chunk followed by its separator gives back the original text
+    """
+    if len(text) <= max_chars:
+        return [(text, "")]
+    if level == len(_CHUNK_BOUNDARIES):
+        return [(text[i : i + max_chars], "") for i in range(0, len(text), max_chars)]
+
+    parts = _CHUNK_BOUNDARIES[level].split(text)
+    units = parts[0::2]
+    separators = parts[1::2] + [""]
+
+    chunks: List[Tuple[str, str]] = []
+    current: Optional[str] = None
+    pending_separator = ""
+
+    for unit, separator in zip(units, separators):
+        if len(unit) > max_chars:
+            if current is not None:
+                chunks.append((current, pending_separator))
+                current = None
+            sub_chunks = chunk_text(unit, max_chars, level + 1)
+            sub_chunks[-1] = (sub_chunks[-1][0], separator)
+            chunks.extend(sub_chunks)
+        elif current is None:
+            current = unit
+        elif len(current) + len(pending_separator) + len(unit) > max_chars:
+            chunks.append((current, pending_separator))
+            current = unit
+        else:
+            current = current + pending_separator + unit
+        pending_separator = separator
+
+    if current is not None:
+        chunks.append((current, pending_separator))
+    return _merge_blank_chunks(chunks) if level == 0 else chunks
+
+
+def _merge_blank_chunks(chunks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Fold whitespace-only chunks into the separator before them"""
+    merged: List[Tuple[str, str]] = []
+    prefix = ""
+    for chunk, separator in chunks:
+        if chunk.strip():
+            merged.append((prefix + chunk, separator))
+            prefix = ""
+        elif merged:
+            merged[-1] = (merged[-1][0], merged[-1][1] + chunk + separator)
+        else:
+            prefix += chunk + separator
+    if prefix:
+        merged.append((prefix, ""))
+    return merged
+
+
+# Numbered marker put in front of each segment of a packed request
+SEGMENT_MARKER = "[[{}]]"
+_SEGMENT_MARKER_RE = re.compile(r"\s*\[\[\s*(\d+)\s*\]\]\s*")
+
+
+def pack_segments(texts: List[str]) -> str:
+    """Join segments into one text, each behind a numbered marker"""
+    return "\n".join(f"{SEGMENT_MARKER.format(i)} {text}" for i, text in enumerate(texts))
+
+
+def unpack_segments(packed: str, count: int) -> Optional[List[str]]:
+    """
+    Split a translated packed text back into its segments
+
+    Args:
+        packed: Translation of a pack_segments() text
+        count: Number of segments that were packed
+
+    Returns:
+        Optional[List[str]]: Segments in order, or None if the markers did
+        not survive translation intact
+    """
+    parts = _SEGMENT_MARKER_RE.split(packed.strip())
+    if parts[0].strip() or len(parts) != 2 * count + 1:
+        return None
+
+    indices = parts[1::2]
+    segments = [segment.strip() for segment in parts[2::2]]
+    if indices != [str(i) for i in range(count)] or not all(segments):
+        return None
+    return segments
 
 
 class BaseTranslator(ABC):
     """Abstract base class for translation services"""
 
+    # Provider limits for a single batched request
+    max_batch_items = 1
+    max_batch_chars = 5000
+
+    # Longest text the provider accepts in one request; longer texts are chunked
+    max_text_chars = 5000
+
+    # Whether short segments should be packed into one request; only worth
+    # it for backends without a real multi-text request
+    pack_segments = False
+
+    # Whether translate_batch sends a whole batch as one request; otherwise
+    # every text is its own request to the provider
+    batch_is_single_request = False
+
+    # Whether translate_multi answers every target language in one request
+    supports_multi_target = False
+
+    # Name used in error messages
+    SERVICE_LABEL = "Translation"
+
     def __init__(self, config: TranslationConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -59,6 +323,66 @@ class BaseTranslator(ABC):
         """Translate text to target language"""
         pass
 
+    def translate_batch(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """Translate texts in as few requests as the provider limits allow"""
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+
+        for indices in split_into_batches(texts, self.max_batch_items, self.max_batch_chars):
+            batch = [texts[i] for i in indices]
+            if len(batch) == 1:
+                batch_results = [self.translate(batch[0], target_language, source_language)]
+            else:
+                batch_results = self._translate_request(batch, target_language, source_language)
+
+            for index, result in zip(indices, batch_results):
+                results[index] = result
+
+        return results
+
+    def _translate_request(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """Translate one batch within provider limits in a single request"""
+        return [self.translate(text, target_language, source_language) for text in texts]
+
+    def translate_multi(
+        self, text: str, target_languages: List[str], source_language: Optional[str] = None
+    ) -> Dict[str, TranslationResult]:
+        """Translate one text into several target languages"""
+        return {
+            target_language: self.translate(text, target_language, source_language)
+            for target_language in target_languages
+        }
+
+    def _batch_failure(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str],
+        service: str,
+        error: Exception,
+        processing_time: float,
+    ) -> List[TranslationResult]:
+        """Build a failed result for every text of a batch"""
+        throttled, retry_after = throttle_details(error)
+        return [
+            TranslationResult(
+                original_text=text,
+                translated_text="",
+                source_language=source_language or "unknown",
+                target_language=target_language,
+                service_used=f"{service}_failed",
+                processing_time=processing_time,
+                error_message=f"{self.SERVICE_LABEL} failed: {error}",
+                throttled=throttled,
+                retry_after=retry_after,
+                retryable=is_retryable_error(error),
+            )
+            for text in texts
+        ]
+
     @abstractmethod
     def detect_language(self, text: str) -> str:
         """Detect language of text"""
@@ -68,10 +392,33 @@ class BaseTranslator(ABC):
 class GoogleTranslationService(BaseTranslator):
     """Google Translate service implementation using deep-translator"""
 
+    SERVICE_LABEL = "Google Translate"
+    max_batch_items = 50
+    max_batch_chars = 5000
+    max_text_chars = 5000
+    # deep-translator's batch API sends one request per text
+    pack_segments = True
+
     def __init__(self, config: TranslationConfig):
         super().__init__(config)
-        # Use deep-translator as primary
-        self.translator = DeepGoogleTranslator(source="auto", target="en")
+        # deep-translator objects keep request state on the instance, so
+        # every thread gets its own instance per language pair
+        self._local = threading.local()
+
+    def _get_translator(
+        self, target_language: str, source_language: Optional[str] = None
+    ) -> DeepGoogleTranslator:
+        """Get this thread's deep-translator instance for a language pair"""
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+
+        key = (source_language or "auto", target_language)
+        translator = translators.get(key)
+        if translator is None:
+            translator = DeepGoogleTranslator(source=key[0], target=key[1])
+            translators[key] = translator
+        return translator
 
     def translate(
         self, text: str, target_language: str, source_language: Optional[str] = None
@@ -80,11 +427,8 @@ class GoogleTranslationService(BaseTranslator):
         start_time = time.time()
 
         try:
-            # Configure translator for this request
-            self.translator.source = source_language or "auto"
-            self.translator.target = target_language
-
-            translated = self.translator.translate(text)
+            translator = self._get_translator(target_language, source_language)
+            translated = translator.translate(text)
             processing_time = time.time() - start_time
 
             return TranslationResult(
@@ -100,6 +444,7 @@ class GoogleTranslationService(BaseTranslator):
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = f"Google Translate failed: {e}"
+            throttled, retry_after = throttle_details(e)
 
             return TranslationResult(
                 original_text=text,
@@ -109,7 +454,49 @@ class GoogleTranslationService(BaseTranslator):
                 service_used="google_failed",
                 processing_time=processing_time,
                 error_message=error_msg,
+                throttled=throttled,
+                retry_after=retry_after,
+                retryable=is_retryable_error(e),
+            )
+
+    def _translate_request(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate a batch through deep-translator's batch API
+
+        TranslationService never gets here: batch_is_single_request is False,
+        so it sends Google one text per call. Only code calling translate_batch
+        on this translator directly, such as scripts and tests, uses it.
+        """
+        start_time = time.time()
+
+        try:
+            translator = self._get_translator(target_language, source_language)
+            translations = translator.translate_batch(texts)
+        except Exception as e:
+            return self._batch_failure(
+                texts,
+                target_language,
+                source_language,
+                "google",
+                e,
+                time.time() - start_time,
+            )
+
+        processing_time = (time.time() - start_time) / len(texts)
+        return [
+            TranslationResult(
+                original_text=text,
+                translated_text=translated or "",
+                source_language=source_language or "auto",
+                target_language=target_language,
+                service_used="google",
+                confidence=0.8,
+                processing_time=processing_time,
             )
+            for text, translated in zip(texts, translations)
+        ]
 
     def detect_language(self, text: str) -> str:
         """Detect language using deep-translator"""
@@ -122,26 +509,80 @@ class GoogleTranslationService(BaseTranslator):
 
 
 class DeepLTranslationService(BaseTranslator):
-    """DeepL translation service implementation"""
+    """DeepL translation service implementation using the REST API"""
+
+    SERVICE_LABEL = "DeepL translation"
+
+    # DeepL accepts up to 50 texts and 128 KiB per request
+    max_batch_items = 50
+    max_batch_chars = 30000
+    max_text_chars = 30000
+    batch_is_single_request = True
+
+    FREE_API_URL = "https://api-free.deepl.com/v2/translate"
+    PRO_API_URL = "https://api.deepl.com/v2/translate"
 
     def __init__(self, config: TranslationConfig):
         super().__init__(config)
         if not config.api_key:
             raise ValueError("DeepL API key is required")
 
-        self.translator = DeeplTranslator(api_key=config.api_key)
+        # Free-plan keys carry a ":fx" suffix and use a separate host
+        if config.api_endpoint:
+            self.api_url = config.api_endpoint
+        elif config.api_key.endswith(":fx"):
+            self.api_url = self.FREE_API_URL
+        else:
+            self.api_url = self.PRO_API_URL
+
+        # One keep-alive session per thread, so requests reuse connections
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """Get this thread's HTTP session"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["Authorization"] = f"DeepL-Auth-Key {self.config.api_key}"
+            self._local.session = session
+        return session
 
     def translate(
         self, text: str, target_language: str, source_language: Optional[str] = None
     ) -> TranslationResult:
         """Translate text using DeepL"""
+        return self._translate_request([text], target_language, source_language)[0]
+
+    def _translate_request(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """Translate a batch with one multi-text DeepL request"""
         start_time = time.time()
 
+        data = [("text", text) for text in texts]
+        data.append(("target_lang", target_language.upper()))
+        if source_language and source_language != "auto":
+            data.append(("source_lang", source_language.upper()))
+
         try:
-            translated = self.translator.translate(text, target_language)
-            processing_time = time.time() - start_time
+            response = self._get_session().post(self.api_url, data=data, timeout=30)
+            response.raise_for_status()
+            translations = [item["text"] for item in response.json()["translations"]]
+            if len(translations) != len(texts):
+                raise ValueError(f"expected {len(texts)} translations, got {len(translations)}")
+        except Exception as e:
+            return self._batch_failure(
+                texts,
+                target_language,
+                source_language,
+                "deepl",
+                e,
+                time.time() - start_time,
+            )
 
-            return TranslationResult(
+        processing_time = (time.time() - start_time) / len(texts)
+        return [
+            TranslationResult(
                 original_text=text,
                 translated_text=translated,
                 source_language=source_language or "auto",
@@ -150,33 +591,42 @@ class DeepLTranslationService(BaseTranslator):
                 confidence=0.9,  # DeepL generally high quality
                 processing_time=processing_time,
             )
-
-        except Exception as e:
-            processing_time = time.time() - start_time
-            error_msg = f"DeepL translation failed: {e}"
-
-            return TranslationResult(
-                original_text=text,
-                translated_text="",
-                source_language=source_language or "unknown",
-                target_language=target_language,
-                service_used="deepl_failed",
-                processing_time=processing_time,
-                error_message=error_msg,
-            )
+            for text, translated in zip(texts, translations)
+        ]
 
     def detect_language(self, text: str) -> str:
-        """DeepL doesn't have built-in detection, use Google as fallback"""
-        try:
-            google = GoogleTranslationService(self.config)
-            return google.detect_language(text)
-        except Exception:
-            return "unknown"
+        """DeepL has no detection endpoint, use the local detector"""
+        return get_language_detector().detect(text)
 
 
 class OpenAITranslationService(BaseTranslator):
     """OpenAI GPT-based translation service"""
 
+    SERVICE_LABEL = "OpenAI translation"
+
+    # Keep batched output comfortably inside the completion token budget
+    max_batch_items = 40
+    max_batch_chars = 4000
+    max_text_chars = 4000
+    batch_is_single_request = True
+
+    # Conservative token estimate for the supported languages, and how much
+    # longer a translation may be than its source
+    CHARS_PER_TOKEN = 3
+    OUTPUT_EXPANSION = 1.5
+    MAX_COMPLETION_TOKENS = 4096
+
+    # All target languages of a segment come back in one JSON object
+    supports_multi_target = True
+
+    LANGUAGE_NAMES = {
+        "sk": "Slovak",
+        "en": "English",
+        "hu": "Hungarian",
+        "de": "German",
+        "pl": "Polish",
+    }
+
     def __init__(self, config: TranslationConfig):
         super().__init__(config)
         if not OPENAI_AVAILABLE:
@@ -202,9 +652,10 @@ class OpenAITranslationService(BaseTranslator):
                     {"role": "system", "content": "You are a professional translator."},
                     {"role": "user", "content": prompt},
                 ],
-                max_tokens=2000,
+                max_tokens=self._completion_tokens(len(text)),
                 temperature=0.1,
             )
+            self._check_complete(response)
 
             translated_text = response.choices[0].message.content.strip()
             processing_time = time.time() - start_time
@@ -222,6 +673,7 @@ class OpenAITranslationService(BaseTranslator):
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = f"OpenAI translation failed: {e}"
+            throttled, retry_after = throttle_details(e)
 
             return TranslationResult(
                 original_text=text,
@@ -231,19 +683,161 @@ class OpenAITranslationService(BaseTranslator):
                 service_used="openai_failed",
                 processing_time=processing_time,
                 error_message=error_msg,
+                throttled=throttled,
+                retry_after=retry_after,
+                retryable=is_retryable_error(e),
+            )
+
+    def _translate_request(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """Translate a batch with one JSON-array prompt"""
+        start_time = time.time()
+
+        try:
+            prompt = self._create_batch_prompt(texts, target_language, source_language)
+
+            response = openai.ChatCompletion.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a professional translator."},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=self._completion_tokens(len(json.dumps(texts, ensure_ascii=False))),
+                temperature=0.1,
+            )
+            self._check_complete(response)
+
+            translations = json.loads(response.choices[0].message.content.strip())
+            if not isinstance(translations, list) or len(translations) != len(texts):
+                raise ValueError("response is not a JSON array matching the input")
+            if not all(isinstance(translated, str) for translated in translations):
+                raise ValueError("response array contains non-string items")
+        except Exception as e:
+            return self._batch_failure(
+                texts,
+                target_language,
+                source_language,
+                "openai",
+                e,
+                time.time() - start_time,
+            )
+
+        processing_time = (time.time() - start_time) / len(texts)
+        return [
+            TranslationResult(
+                original_text=text,
+                translated_text=translated.strip(),
+                source_language=source_language or "auto",
+                target_language=target_language,
+                service_used="openai",
+                confidence=0.85,
+                processing_time=processing_time,
+            )
+            for text, translated in zip(texts, translations)
+        ]
+
+    def translate_multi(
+        self, text: str, target_languages: List[str], source_language: Optional[str] = None
+    ) -> Dict[str, TranslationResult]:
+        """Translate one text into every target language with a single prompt"""
+        start_time = time.time()
+
+        try:
+            prompt = self._create_multi_target_prompt(text, target_languages, source_language)
+
+            response = openai.ChatCompletion.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "You are a professional translator."},
+                    {"role": "user", "content": prompt},
+                ],
+                max_tokens=self._completion_tokens(len(text) * len(target_languages)),
+                temperature=0.1,
+            )
+            self._check_complete(response)
+
+            translations = json.loads(response.choices[0].message.content.strip())
+            if not isinstance(translations, dict) or not set(target_languages) <= set(
+                translations
+            ):
+                raise ValueError("response is not a JSON object keyed by every target language")
+            if not all(isinstance(translations[lang], str) for lang in target_languages):
+                raise ValueError("response object contains non-string translations")
+        except Exception as e:
+            processing_time = time.time() - start_time
+            return {
+                target_language: self._batch_failure(
+                    [text], target_language, source_language, "openai", e, processing_time
+                )[0]
+                for target_language in target_languages
+            }
+
+        processing_time = (time.time() - start_time) / len(target_languages)
+        return {
+            target_language: TranslationResult(
+                original_text=text,
+                translated_text=translations[target_language].strip(),
+                source_language=source_language or "auto",
+                target_language=target_language,
+                service_used="openai",
+                confidence=0.85,
+                processing_time=processing_time,
             )
+            for target_language in target_languages
+        }
+
+    def _completion_tokens(self, source_chars: int) -> int:
+        """Token budget for translating source_chars characters"""
+        estimate = int(source_chars / self.CHARS_PER_TOKEN * self.OUTPUT_EXPANSION) + 100
+        return min(self.MAX_COMPLETION_TOKENS, estimate)
+
+    @staticmethod
+    def _check_complete(response) -> None:
+        """Reject completions cut off at the token limit"""
+        if getattr(response.choices[0], "finish_reason", None) == "length":
+            raise ValueError("response truncated at the completion token limit")
+
+    def _create_batch_prompt(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> str:
+        """Create a prompt translating a JSON array of texts"""
+        lang_names = self.LANGUAGE_NAMES
+        target_lang_name = lang_names.get(target_language, target_language)
+        source_info = (
+            f" from {lang_names.get(source_language, source_language)}" if source_language else ""
+        )
+
+        return f"""Translate each string in the following JSON array{source_info} to {target_lang_name}.
+Preserve all formatting, HTML tags, and special characters.
+Respond with only a JSON array of the translated strings, in the same order and with the same number of items.
+
+{json.dumps(texts, ensure_ascii=False)}"""
+
+    def _create_multi_target_prompt(
+        self, text: str, target_languages: List[str], source_language: Optional[str] = None
+    ) -> str:
+        """Create a prompt translating one text into several languages"""
+        lang_names = self.LANGUAGE_NAMES
+        targets = ", ".join(
+            f'"{lang}" ({lang_names.get(lang, lang)})' for lang in target_languages
+        )
+        source_info = (
+            f" from {lang_names.get(source_language, source_language)}" if source_language else ""
+        )
+
+        return f"""Translate the following text{source_info} into each of these languages: {targets}.
+Preserve all formatting, HTML tags, and special characters.
+Respond with only a JSON object mapping each language code to its translation.
+
+Text to translate:
+{text}"""
 
     def _create_translation_prompt(
         self, text: str, target_language: str, source_language: Optional[str] = None
     ) -> str:
         """Create translation prompt for OpenAI"""
-        lang_names = {
-            "sk": "Slovak",
-            "en": "English",
-            "hu": "Hungarian",
-            "de": "German",
-            "pl": "Polish",
-        }
+        lang_names = self.LANGUAGE_NAMES
 
         target_lang_name = lang_names.get(target_language, target_language)
         source_info = (
@@ -258,119 +852,640 @@ Text to translate:
 {text}"""
 
     def detect_language(self, text: str) -> str:
-        """Detect language using OpenAI"""
+        """Detect language locally instead of spending a completion on it"""
+        return get_language_detector().detect(text)
+
+
+class MockBackendError(Exception):
+    """Failure injected by the mock backend"""
+
+    def __init__(self, message: str, http_status: int):
+        super().__init__(message)
+        self.http_status = http_status
+
+
+class MockTranslationService(BaseTranslator):
+    """Offline backend for benchmarks and load tests
+
+    Translations are deterministic: every non-empty line gets the target
+    language appended, so formatting placeholders and segment markers
+    survive. Each request sleeps for a log-normal latency and fails with
+    the configured throttling and error rates, drawn from a seeded
+    generator so runs can be repeated.
+    """
+
+    SERVICE_LABEL = "Mock"
+    max_batch_items = 50
+    max_batch_chars = 5000
+    max_text_chars = 5000
+    batch_is_single_request = True
+
+    def __init__(self, config: TranslationConfig):
+        super().__init__(config)
+        self._random = random.Random(config.mock_seed)
+        self._random_lock = threading.Lock()
+
+    @staticmethod
+    def mock_translation(text: str, target_language: str) -> str:
+        """Deterministic stand-in for the translation of a text"""
+        return "\n".join(
+            f"{line} [{target_language}]" if line.strip() else line for line in text.split("\n")
+        )
+
+    def _simulate_request(self) -> None:
+        """Wait out one request's latency and raise the failure it was drawn to have"""
+        with self._random_lock:
+            latency = self.config.mock_latency_seconds * math.exp(
+                self.config.mock_latency_sigma * self._random.gauss(0, 1)
+            )
+            roll = self._random.random()
+
+        time.sleep(latency)
+        if roll < self.config.mock_throttle_rate:
+            raise MockBackendError("429 Too Many Requests", 429)
+        if roll < self.config.mock_throttle_rate + self.config.mock_failure_rate:
+            raise MockBackendError("503 Service Unavailable", 503)
+
+    def translate(
+        self, text: str, target_language: str, source_language: Optional[str] = None
+    ) -> TranslationResult:
+        """Translate text with the mock backend"""
+        return self._translate_request([text], target_language, source_language)[0]
+
+    def _translate_request(
+        self, texts: List[str], target_language: str, source_language: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """Translate a batch as one simulated request"""
+        start_time = time.time()
+
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a language detection expert."},
-                    {
-                        "role": "user",
-                        "content": f"What language is this text written in? Respond with only the language code (en, sk, hu, de, pl, etc.): {text[:200]}",
-                    },
-                ],
-                max_tokens=10,
-                temperature=0,
+            self._simulate_request()
+        except MockBackendError as e:
+            processing_time = time.time() - start_time
+            return self._batch_failure(
+                texts, target_language, source_language, "mock", e, processing_time
             )
 
-            return response.choices[0].message.content.strip().lower()
-        except Exception:
-            return "unknown"
+        processing_time = (time.time() - start_time) / len(texts)
+        return [
+            TranslationResult(
+                original_text=text,
+                translated_text=self.mock_translation(text, target_language),
+                source_language=source_language or "auto",
+                target_language=target_language,
+                service_used="mock",
+                confidence=1.0,
+                processing_time=processing_time,
+            )
+            for text in texts
+        ]
+
+    def detect_language(self, text: str) -> str:
+        """Detect language with the local detector"""
+        return get_language_detector().detect(text)
 
 
 class TranslationCache:
-    """Simple file-based cache for translations"""
+    """Persistent translation cache backed by SQLite in WAL mode
+
+    Every ``set`` is a single-row upsert appended to the write-ahead log, so
+    caching a segment costs the same no matter how large the cache grows.
+    The log is checkpointed periodically, the database is compacted after
+    every COMPACT_INTERVAL writes, and SQLite's journal recovery discards
+    any half-written transaction left behind by a crash.
+
+    The cache is safe to share between threads and between processes on the
+    same host: each thread gets its own connection, WAL lets readers run
+    alongside a writer, and writes are serialized by SQLite's file lock.
+    """
+
+    CHECKPOINT_INTERVAL = 1000
+    COMPACT_INTERVAL = 50000
+    BUSY_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        cache_dir: str = "cache",
+        max_memory_entries: int = 10000,
+        stats: Optional[TranslationStats] = None,
+    ):
+        """
+        Initialize translation cache
 
-    def __init__(self, cache_dir: str = "cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.cache_file = self.cache_dir / "translations.json"
-        self.cache = self._load_cache()
+        Args:
+            cache_dir: Directory holding the cache database
+            max_memory_entries: Size of the in-memory LRU tier (0 disables it)
+            stats: Counters to record hits, misses, stores and evictions in
+        """
         self.logger = logging.getLogger(__name__)
+        self.stats = stats or TranslationStats()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_file = self.cache_dir / "translations.db"
+        self.legacy_cache_file = self.cache_dir / "translations.json"
+
+        # Recently used entries stay in memory; everything else is looked up
+        # on disk, so memory use is bounded regardless of cache size.
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._writes_since_checkpoint = 0
+        self._writes_since_compact = 0
+
+        self._open_database()
+        self._migrate_legacy_cache()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database"""
+        conn = sqlite3.connect(
+            str(self.cache_file),
+            timeout=self.BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, translation TEXT NOT NULL)"
+        )
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _open_database(self) -> None:
+        """Open the cache database, starting fresh if the file is unreadable"""
+        try:
+            conn = self._connection()
+            if conn.execute("PRAGMA quick_check").fetchone()[0] == "ok":
+                return
+            reason = "integrity check failed"
+        except sqlite3.DatabaseError as e:
+            reason = str(e)
+
+        self.close()
+
+        # A damaged cache is not worth failing a workflow over; keep it for
+        # inspection and rebuild from scratch. Another process may have
+        # already done so, in which case the file is simply gone.
+        corrupt_file = self.cache_file.with_suffix(f".corrupt-{int(time.time())}")
+        self.logger.warning(
+            f"Translation cache {self.cache_file} is unreadable ({reason}), "
+            f"moving it to {corrupt_file}"
+        )
+        try:
+            self.cache_file.rename(corrupt_file)
+        except FileNotFoundError:
+            pass
+        for suffix in ("-wal", "-shm"):
+            Path(f"{self.cache_file}{suffix}").unlink(missing_ok=True)
+        self._connection()
+
+    def _migrate_legacy_cache(self) -> None:
+        """Import entries from the old whole-file JSON cache, if present"""
+        if not self.legacy_cache_file.exists():
+            return
 
-    def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from file"""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                self.logger.warning(f"Could not load translation cache: {e}")
-        return {}
-
-    def _save_cache(self) -> None:
-        """Save cache to file"""
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            with open(self.legacy_cache_file, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except FileNotFoundError:
+            return  # Migrated by a concurrent process
         except Exception as e:
-            self.logger.warning(f"Could not save translation cache: {e}")
+            self.logger.warning(f"Could not load legacy translation cache: {e}")
+            return
+
+        self._write(
+            "INSERT OR IGNORE INTO translations (key, translation) VALUES (?, ?)",
+            list(legacy.items()),
+        )
 
-    def _get_cache_key(self, text: str, target_language: str, source_language: str = "auto") -> str:
+        try:
+            self.legacy_cache_file.rename(self.legacy_cache_file.with_suffix(".json.migrated"))
+            self.logger.info(f"Migrated {len(legacy)} entries from {self.legacy_cache_file}")
+        except FileNotFoundError:
+            pass
+
+    def _write(self, statement: str, rows: List[Tuple[str, str]]) -> None:
+        """Apply rows in one transaction holding the database write lock"""
+        conn = self._connection()
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+        # queue on the busy timeout instead of failing on lock upgrade.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(statement, rows)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        with self._connections_lock:
+            self._writes_since_checkpoint += len(rows)
+            self._writes_since_compact += len(rows)
+            compact = self._writes_since_compact >= self.COMPACT_INTERVAL
+            checkpoint = compact or self._writes_since_checkpoint >= self.CHECKPOINT_INTERVAL
+            if checkpoint:
+                self._writes_since_checkpoint = 0
+            if compact:
+                self._writes_since_compact = 0
+        if compact:
+            try:
+                self.compact()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not compact translation cache: {e}")
+        elif checkpoint:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    @staticmethod
+    def _get_cache_key(text: str, target_language: str, source_language: str = "auto") -> str:
         """Generate cache key for text and language pair"""
         content = f"{text}|{source_language}|{target_language}"
         return hashlib.md5(content.encode()).hexdigest()
 
+    def _remember(self, key: str, translation: str) -> None:
+        """Put entry in the memory tier, evicting the least recently used"""
+        if self.max_memory_entries <= 0:
+            return
+
+        evicted = 0
+        with self._memory_lock:
+            self._memory[key] = translation
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                evicted += 1
+
+        if evicted:
+            self.stats.increment(cache_evictions=evicted)
+
     def get(self, text: str, target_language: str, source_language: str = "auto") -> Optional[str]:
         """Get cached translation"""
         key = self._get_cache_key(text, target_language, source_language)
-        return self.cache.get(key)
+
+        with self._memory_lock:
+            translation = self._memory.get(key)
+            if translation is not None:
+                self._memory.move_to_end(key)
+
+        if translation is not None:
+            self.stats.increment(cache_hits=1)
+            return translation
+
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT translation FROM translations WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not read translation cache: {e}")
+            row = None
+
+        if not row:
+            self.stats.increment(cache_misses=1)
+            return None
+
+        self.stats.increment(cache_hits=1)
+        self._remember(key, row[0])
+        return row[0]
 
     def set(
         self, text: str, target_language: str, translation: str, source_language: str = "auto"
     ) -> None:
         """Cache translation"""
-        key = self._get_cache_key(text, target_language, source_language)
-        self.cache[key] = translation
-        self._save_cache()
+        self.set_many([(text, target_language, translation, source_language)])
+
+    def set_many(self, entries: List[Tuple[str, str, str, str]]) -> None:
+        """
+        Cache several translations in a single transaction
+
+        Args:
+            entries: (text, target_language, translation, source_language) tuples
+        """
+        rows = [
+            (self._get_cache_key(text, target_language, source_language), translation)
+            for text, target_language, translation, source_language in entries
+        ]
+        if not rows:
+            return
+
+        try:
+            self._write(
+                "INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)", rows
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not save translation cache: {e}")
+            return
+
+        self.stats.increment(cache_stores=len(rows))
+        for key, translation in rows:
+            self._remember(key, translation)
+
+    def compact(self) -> None:
+        """Fold the write-ahead log into the database and reclaim free pages"""
+        conn = self._connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def close(self) -> None:
+        """Close every connection opened by this cache"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
 
 
 class FormattingPreserver:
-    """Preserve formatting during translation"""
+    """Preserve formatting during translation
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    All patterns are combined into one compiled alternation, so a text is
+    tokenized in a single left-to-right pass; where two patterns could
+    match at the same position the earlier one wins. Placeholders are
+    restored in a single pass as well. Extraction results are memoized by
+    segment hash, since the same segments recur across languages and pages.
+    Glossary terms in the remaining text are protected the same way and
+    come back as their forced translation for the target language.
+    """
 
-        # Patterns to preserve
-        self.preserve_patterns = [
-            (r"(<[^>]+>)", "HTML_TAG"),  # HTML tags
-            (r"(\{[^}]+\})", "PLACEHOLDER"),  # Template placeholders
-            (r"(\[[^\]]+\])", "BRACKET"),  # Markdown links
-            (r"(\*\*[^*]+\*\*)", "BOLD"),  # Bold markdown
-            (r"(\*[^*]+\*)", "ITALIC"),  # Italic markdown
-            (r"(`[^`]+`)", "CODE"),  # Code markdown
-            (r"(https?://[^\s]+)", "URL"),  # URLs
-            (r"(\w+@\w+\.\w+)", "EMAIL"),  # Email addresses
-        ]
+    # Prefix of glossary term placeholders
+    TERM_PREFIX = "TERM"
 
-    def extract_formatting(self, text: str) -> Tuple[str, Dict[str, str]]:
+    # Extraction results kept in the memo, and the characters they may hold
+    MEMO_SIZE = 10000
+    MEMO_MAX_CHARS = 2_000_000
+
+    # Longer segments rarely recur and are extracted without memoizing
+    MEMO_MAX_SEGMENT_CHARS = 2000
+
+    # Placeholders produced by extract_formatting: ___{prefix}_{i}_{j}___
+    PLACEHOLDER_RE = re.compile(r"___[A-Z]+(?:_[A-Z]+)*_\d+_\d+___")
+
+    # Placeholders as backends mangle them: other case, spaces or dashes for
+    # underscores, translated or dropped prefix; the indices identify them
+    DAMAGED_PLACEHOLDER_RE = re.compile(
+        r"_+\s*(?:[^\W\d_]+(?:[\s_-]+[^\W\d_]+)*[\s_-]+)?(\d+)[\s_-]+(\d+)\s*_{1,3}"
+    )
+
+    def __init__(self, glossary: Optional[Glossary] = None):
+        """
+        Initialize formatting preserver
+
+        Args:
+            glossary: Terms to protect from translation (optional)
+        """
+        self.glossary = glossary
+        self.logger = logging.getLogger(__name__)
+
+        # Patterns to preserve
+        self.preserve_patterns = [
+            (r"<[^>]+>", "HTML_TAG"),  # HTML tags
+            (r"\{[^}]+\}", "PLACEHOLDER"),  # Template placeholders
+            (r"\[[^\]]+\]", "BRACKET"),  # Markdown links
+            (r"\*\*[^*]+\*\*", "BOLD"),  # Bold markdown
+            (r"\*[^*]+\*", "ITALIC"),  # Italic markdown
+            (r"`[^`]+`", "CODE"),  # Code markdown
+            (r"https?://[^\s<]+", "URL"),  # URLs, stopping at a following tag
+            (r"\w+@\w+\.\w+", "EMAIL"),  # Email addresses
+        ]
+        self._tokenizer = re.compile(
+            "|".join(
+                f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(self.preserve_patterns)
+            )
+        )
+
+        self._memo: "OrderedDict[str, Tuple[str, Dict[str, str]]]" = OrderedDict()
+        self._memo_chars = 0
+        self._memo_lock = threading.Lock()
+
+    def extract_formatting(self, text: str) -> Tuple[str, Dict[str, str]]:
         """Extract formatting elements and return clean text with mapping"""
+        return self.extract_formatting_batch([text])[0]
+
+    def extract_formatting_batch(self, texts: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Extract formatting elements from many segments at once
+
+        Segments already extracted, earlier or within the batch, are answered
+        from the memo; the memo lock is taken once for lookups and once for
+        storing the new results. The memo is bounded by entries and by
+        characters, and segments over MEMO_MAX_SEGMENT_CHARS are not kept.
+
+        Args:
+            texts: Segments to extract formatting from
+
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: Clean text and placeholder
+            mapping per segment, in input order
+        """
+        keys = [hashlib.md5(text.encode("utf-8")).hexdigest() for text in texts]
+        extracted: Dict[str, Tuple[str, Dict[str, str]]] = {}
+
+        with self._memo_lock:
+            for key in keys:
+                if key not in extracted and key in self._memo:
+                    self._memo.move_to_end(key)
+                    extracted[key] = self._memo[key]
+
+        new = {}
+        for key, text in zip(keys, texts):
+            if key not in extracted and key not in new:
+                new[key] = self._extract(text)
+
+        memoize = {
+            key: entry
+            for key, entry in new.items()
+            if self._memo_cost(entry) <= self.MEMO_MAX_SEGMENT_CHARS
+        }
+        if memoize:
+            with self._memo_lock:
+                for key, entry in memoize.items():
+                    if key not in self._memo:
+                        self._memo[key] = entry
+                        self._memo_chars += self._memo_cost(entry)
+                while len(self._memo) > self.MEMO_SIZE or self._memo_chars > self.MEMO_MAX_CHARS:
+                    self._memo_chars -= self._memo_cost(self._memo.popitem(last=False)[1])
+        extracted.update(new)
+
+        # Callers get their own mapping, the memo keeps the original
+        return [(extracted[key][0], dict(extracted[key][1])) for key in keys]
+
+    @staticmethod
+    def _memo_cost(entry: Tuple[str, Dict[str, str]]) -> int:
+        """Characters a memo entry holds: clean text and preserved originals"""
+        clean_text, placeholders = entry
+        return len(clean_text) + sum(len(original) for original in placeholders.values())
+
+    def _extract(self, text: str) -> Tuple[str, Dict[str, str]]:
+        """Tokenize one segment, replacing formatting with placeholders"""
         placeholders = {}
-        clean_text = text
+        counts = [0] * len(self.preserve_patterns)
+
+        def protect(match: "re.Match") -> str:
+            i = int(match.lastgroup[1:])
+            placeholder = f"___{self.preserve_patterns[i][1]}_{i}_{counts[i]}___"
+            counts[i] += 1
+            placeholders[placeholder] = match.group()
+            return placeholder
+
+        if not self.glossary:
+            return self._tokenizer.sub(protect, text), placeholders
+
+        # Glossary terms are looked up only in the text between formatting spans
+        parts = []
+        term_count = 0
+        for part, match in self._tokens(text):
+            if match:
+                parts.append(protect(match))
+                continue
+            spans = self.glossary.find_terms(part)
+            position = 0
+            for start, end in spans:
+                placeholder = (
+                    f"___{self.TERM_PREFIX}_{len(self.preserve_patterns)}_{term_count}___"
+                )
+                term_count += 1
+                placeholders[placeholder] = part[start:end]
+                parts.append(part[position:start])
+                parts.append(placeholder)
+                position = end
+            parts.append(part[position:])
+        return "".join(parts), placeholders
+
+    def split_formatting(
+        self, text: str, target_language: Optional[str] = None
+    ) -> List[Tuple[str, bool]]:
+        """
+        Split text into translatable runs and protected formatting spans
 
-        for i, (pattern, prefix) in enumerate(self.preserve_patterns):
-            matches = re.finditer(pattern, clean_text)
-            for j, match in enumerate(matches):
-                original = match.group(1)
-                placeholder = f"___{prefix}_{i}_{j}___"
-                placeholders[placeholder] = original
-                clean_text = clean_text.replace(original, placeholder, 1)
+        Glossary terms are protected spans as well and are given as the text
+        they become in the target language.
 
-        return clean_text, placeholders
+        Args:
+            text: Text to split
+            target_language: Target language code for glossary terms
 
-    def restore_formatting(self, translated_text: str, placeholders: Dict[str, str]) -> str:
-        """Restore formatting elements in translated text"""
-        result = translated_text
+        Returns:
+            List[Tuple[str, bool]]: (part, is_protected) pairs in text order
+        """
+        parts = []
+        for part, match in self._tokens(text):
+            if match or not self.glossary:
+                parts.append((part, match is not None))
+                continue
+            position = 0
+            for start, end in self.glossary.find_terms(part):
+                if start > position:
+                    parts.append((part[position:start], False))
+                parts.append((self.glossary.target_term(part[start:end], target_language), True))
+                position = end
+            if position < len(part):
+                parts.append((part[position:], False))
+        return parts
+
+    def _tokens(self, text: str) -> Iterator[Tuple[str, Optional["re.Match"]]]:
+        """Text runs paired with None and formatting spans paired with their match"""
+        position = 0
+        for match in self._tokenizer.finditer(text):
+            if match.start() > position:
+                yield text[position : match.start()], None
+            yield match.group(), match
+            position = match.end()
+        if position < len(text):
+            yield text[position:], None
+
+    def repair_placeholders(
+        self, translated_text: str, placeholders: Dict[str, str]
+    ) -> Tuple[str, bool]:
+        """
+        Check that every placeholder came back exactly once, fixing mangled ones
 
-        for placeholder, original in placeholders.items():
-            result = result.replace(placeholder, original)
+        Args:
+            translated_text: Backend output for a text with placeholders
+            placeholders: Mapping returned by extract_formatting
 
-        return result
+        Returns:
+            Tuple[str, bool]: Text with mangled placeholders normalized, and
+            whether each placeholder now occurs exactly once
+        """
+        if self._placeholders_intact(translated_text, placeholders):
+            return translated_text, True
+
+        by_index = {}
+        for placeholder in placeholders:
+            i, j = placeholder.strip("_").rsplit("_", 2)[1:]
+            by_index[(int(i), int(j))] = placeholder
+
+        repaired = self.DAMAGED_PLACEHOLDER_RE.sub(
+            lambda match: by_index.get(
+                (int(match.group(1)), int(match.group(2))), match.group()
+            ),
+            translated_text,
+        )
+        return repaired, self._placeholders_intact(repaired, placeholders)
+
+    def _placeholders_intact(self, text: str, placeholders: Dict[str, str]) -> bool:
+        counts = Counter(self.PLACEHOLDER_RE.findall(text))
+        return len(counts) == len(placeholders) and all(
+            counts[placeholder] == 1 for placeholder in placeholders
+        )
+
+    def restore_formatting(
+        self,
+        translated_text: str,
+        placeholders: Dict[str, str],
+        target_language: Optional[str] = None,
+    ) -> str:
+        """Restore formatting elements and glossary terms in translated text"""
+        if not placeholders:
+            return translated_text
+
+        term_prefix = f"___{self.TERM_PREFIX}_"
+
+        def restore(match: "re.Match") -> str:
+            placeholder = match.group()
+            original = placeholders.get(placeholder)
+            if original is None:
+                return placeholder
+            if self.glossary and placeholder.startswith(term_prefix):
+                return self.glossary.target_term(original, target_language)
+            return original
+
+        return self.PLACEHOLDER_RE.sub(restore, translated_text)
+
+
+class _InFlightTranslation:
+    """Backend call that concurrent requests for the same segment wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[TranslationResult] = None
 
 
 class TranslationService:
     """Main translation service with multiple backends and caching"""
 
+    # Segments longer than this are never packed with others
+    PACKED_SEGMENT_MAX_CHARS = 200
+
+    # Backends that cannot be called without an API key of their own
+    KEYED_SERVICES = ("deepl", "openai")
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize translation service
@@ -381,28 +1496,176 @@ class TranslationService:
         self.config = config_manager.translation_config
         self.logger = logging.getLogger(__name__)
 
+        # Counters shared by the cache and the translation paths
+        self.stats = TranslationStats()
+
         # Initialize cache if enabled
-        self.cache = TranslationCache() if self.config.cache_enabled else None
+        self.cache = (
+            TranslationCache(max_memory_entries=self.config.cache_memory_entries, stats=self.stats)
+            if self.config.cache_enabled
+            else None
+        )
+
+        # Initialize translation memory for near-match reuse if enabled
+        self.memory = (
+            TranslationMemory(min_similarity=self.config.translation_memory_threshold)
+            if self.config.translation_memory_enabled
+            else None
+        )
+
+        # Initialize formatting preserver, protecting glossary terms if configured
+        self.formatter = FormattingPreserver(
+            Glossary.from_file(self.config.glossary_file) if self.config.glossary_file else None
+        )
 
-        # Initialize formatting preserver
-        self.formatter = FormattingPreserver()
+        # Offline language identification, shared by all services
+        self.language_detector = get_language_detector()
+
+        # Set while a thread translates around lost placeholders, so the
+        # runs it sends never fall back again
+        self._fallback_state = threading.local()
+
+        # Outstanding backend calls by cache key, for single-flight requests
+        self._in_flight: Dict[str, _InFlightTranslation] = {}
+        self._in_flight_lock = threading.Lock()
 
         # Initialize translator based on service
         self.translator = self._create_translator()
 
-    def _create_translator(self) -> BaseTranslator:
+        # Request and character budget shared by every thread using this backend
+        self.rate_limiter = self._create_rate_limiter(self.config.service.lower())
+
+        # Backoff between attempts, tuned for the primary backend
+        self.retry_policy = self._create_retry_policy(self.config.service.lower())
+
+        # Backends to fail over to, each with its own backoff, and a circuit
+        # breaker per backend
+        self.fallbacks = self._create_fallbacks()
+        self.retry_policies: Dict[str, RetryPolicy] = {
+            service: self._create_retry_policy(service) for service, _, _ in self.fallbacks
+        }
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+        # Optional duplicate requests for calls stuck in the latency tail
+        self.hedge_policy = (
+            HedgePolicy(self.config.hedge_percentile, self.config.hedge_max_rate)
+            if self.config.hedge_requests
+            else None
+        )
+        self._hedge_executor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=2 * self.config.max_concurrent_requests,
+                thread_name_prefix="translation-hedge",
+            )
+            if self.hedge_policy
+            else None
+        )
+
+    def _create_translator(self, service: Optional[str] = None) -> BaseTranslator:
         """Create translator instance based on configuration"""
-        service = self.config.service.lower()
+        config = self.config
+        if service is None:
+            service = self.config.service.lower()
+        else:
+            # Fallback backends use their own API key and default endpoint; the
+            # primary's key belongs to another provider and is never sent
+            config = dataclasses.replace(
+                self.config,
+                service=service,
+                api_key=(self.config.service_api_keys or {}).get(service),
+                api_endpoint=None,
+            )
 
         if service == "google":
-            return GoogleTranslationService(self.config)
+            return GoogleTranslationService(config)
         elif service == "deepl":
-            return DeepLTranslationService(self.config)
+            return DeepLTranslationService(config)
         elif service == "openai" and OPENAI_AVAILABLE:
-            return OpenAITranslationService(self.config)
+            return OpenAITranslationService(config)
+        elif service == "mock":
+            return MockTranslationService(config)
         else:
             self.logger.warning(f"Unknown service '{service}', falling back to Google")
-            return GoogleTranslationService(self.config)
+            return GoogleTranslationService(config)
+
+    def _create_rate_limiter(self, service: str) -> RateLimiter:
+        """Get the rate limiter shared by every user of a backend"""
+        return get_rate_limiter(
+            service,
+            self.config.rate_limit_requests_per_second,
+            self.config.rate_limit_characters_per_second,
+        )
+
+    def _create_retry_policy(self, service: str) -> RetryPolicy:
+        """Create the retry policy for a backend, applying its overrides"""
+        overrides = (self.config.retry_policies or {}).get(service, {})
+        return RetryPolicy(
+            max_retries=int(overrides.get("max_retries", self.config.max_retries)),
+            base_delay=overrides.get("retry_delay", self.config.retry_delay),
+            max_delay=overrides.get("retry_max_delay", self.config.retry_max_delay),
+        )
+
+    def _get_retry_policy(self, service: str) -> RetryPolicy:
+        """Get the retry policy of a backend in the failover chain"""
+        if service == self.config.service.lower():
+            return self.retry_policy
+        policy = self.retry_policies.get(service)
+        if policy is None:
+            policy = self.retry_policies[service] = self._create_retry_policy(service)
+        return policy
+
+    def _create_fallbacks(self) -> List[Tuple[str, BaseTranslator, RateLimiter]]:
+        """Create the configured fallback backends that can be set up"""
+        fallbacks = []
+        primary = self.config.service.lower()
+        api_keys = self.config.service_api_keys or {}
+
+        for service in self.config.fallback_services or []:
+            service = service.lower()
+            if service == primary or any(name == service for name, _, _ in fallbacks):
+                continue
+            if service not in ("google", "deepl", "openai", "mock"):
+                self.logger.warning(f"Unknown fallback service '{service}' ignored")
+                continue
+            if service in self.KEYED_SERVICES and not api_keys.get(service):
+                self.logger.warning(
+                    f"Fallback service '{service}' skipped: no API key for it in service_api_keys"
+                )
+                continue
+
+            try:
+                translator = self._create_translator(service)
+            except (ImportError, ValueError) as e:
+                self.logger.warning(f"Fallback service '{service}' unavailable: {e}")
+                continue
+            fallbacks.append((service, translator, self._create_rate_limiter(service)))
+
+        return fallbacks
+
+    def _backends(self) -> List[Tuple[str, BaseTranslator, RateLimiter]]:
+        """Backends in the order traffic should be sent to them"""
+        return [(self.config.service.lower(), self.translator, self.rate_limiter)] + list(
+            self.fallbacks
+        )
+
+    def _get_breaker(self, service: str) -> CircuitBreaker:
+        """Get the circuit breaker tracking a backend"""
+        with self._breakers_lock:
+            breaker = self.breakers.get(service)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    service,
+                    error_rate_threshold=self.config.circuit_error_rate,
+                    slow_call_seconds=self.config.circuit_slow_call_seconds,
+                    open_seconds=self.config.circuit_open_seconds,
+                )
+                self.breakers[service] = breaker
+            return breaker
+
+    def _max_text_chars(self) -> int:
+        """Longest text every backend in the chain accepts"""
+        return min(translator.max_text_chars for _, translator, _ in self._backends())
 
     def translate_text(
         self, text: str, target_language: str, source_language: Optional[str] = None
@@ -418,6 +1681,223 @@ class TranslationService:
         Returns:
             TranslationResult: Translation result
         """
+        stored = self._lookup_stored(text, target_language, source_language)
+        if stored:
+            return stored
+
+        # Concurrent requests for the same segment share one backend call
+        key = TranslationCache._get_cache_key(text, target_language, source_language or "auto")
+        in_flight, leader = self._join_in_flight([key])[0]
+        if not leader:
+            return self._follow_in_flight(in_flight, text, target_language, source_language)
+
+        result = None
+        try:
+            result = self._translate_uncached(text, target_language, source_language)
+            return result
+        finally:
+            self._finish_in_flight(key, in_flight, result)
+
+    def _join_in_flight(self, keys: List[str]) -> List[Tuple[_InFlightTranslation, bool]]:
+        """
+        Lead the backend call for each key nobody is translating yet
+
+        Args:
+            keys: Cache keys of the segments about to be translated
+
+        Returns:
+            List[Tuple[_InFlightTranslation, bool]]: Outstanding call per key,
+            and whether the caller leads it and must finish it
+        """
+        claims = []
+        with self._in_flight_lock:
+            for key in keys:
+                in_flight = self._in_flight.get(key)
+                leader = in_flight is None
+                if leader:
+                    in_flight = _InFlightTranslation()
+                    self._in_flight[key] = in_flight
+                claims.append((in_flight, leader))
+        return claims
+
+    def _finish_in_flight(
+        self, key: str, in_flight: _InFlightTranslation, result: Optional[TranslationResult]
+    ) -> None:
+        """Hand a led call's result to its followers"""
+        in_flight.result = result
+        with self._in_flight_lock:
+            del self._in_flight[key]
+        in_flight.done.set()
+
+    def _follow_in_flight(
+        self,
+        in_flight: _InFlightTranslation,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """Wait for another caller's backend call, translating alone if it failed"""
+        in_flight.done.wait()
+        if in_flight.result is not None and not in_flight.result.error_message:
+            self.stats.increment(deduplicated_requests=1, api_calls_avoided=1)
+            return dataclasses.replace(in_flight.result)
+        return self._translate_uncached(text, target_language, source_language)
+
+    @property
+    def supports_multi_target(self) -> bool:
+        """Whether the primary backend translates into all languages in one request"""
+        return self.translator.supports_multi_target
+
+    def translate_text_multi(
+        self, text: str, target_languages: List[str], source_language: Optional[str] = None
+    ) -> Dict[str, TranslationResult]:
+        """
+        Translate text into several target languages
+
+        Languages not answered by the cache are requested together when the
+        primary backend supports it. Languages missing from that reply go
+        through translate_text one by one.
+
+        Args:
+            text: Text to translate
+            target_languages: Target language codes
+            source_language: Source language code (auto-detect if None)
+
+        Returns:
+            Dict[str, TranslationResult]: Translation result by target language
+        """
+        results: Dict[str, TranslationResult] = {}
+        pending = []
+        for target_language in target_languages:
+            stored = self._lookup_stored(text, target_language, source_language)
+            if stored:
+                results[target_language] = stored
+            else:
+                pending.append(target_language)
+
+        if len(pending) > 1 and self.supports_multi_target:
+            results.update(self._translate_multi_target(text, pending, source_language))
+
+        for target_language in target_languages:
+            if target_language not in results:
+                results[target_language] = self.translate_text(
+                    text, target_language, source_language
+                )
+
+        return {target_language: results[target_language] for target_language in target_languages}
+
+    def _translate_multi_target(
+        self, text: str, target_languages: List[str], source_language: Optional[str]
+    ) -> Dict[str, TranslationResult]:
+        """Request every target language from the primary backend at once"""
+        clean_text = text
+        placeholders = {}
+        if self.config.preserve_formatting:
+            clean_text, placeholders = self.formatter.extract_formatting(text)
+
+        breaker = self._get_breaker(self.config.service.lower())
+        if len(clean_text) > self._max_text_chars() or not breaker.allow_request():
+            return {}
+
+        self.rate_limiter.acquire(len(clean_text))
+        self.stats.increment(api_calls=1)
+        start_time = time.monotonic()
+        try:
+            backend_results = self.translator.translate_multi(
+                clean_text, target_languages, source_language
+            )
+        except Exception as e:
+            breaker.record_failure(str(e))
+            self.logger.warning(f"Multi-target translation failed, translating one by one: {e}")
+            return {}
+
+        if not backend_results:
+            return {}
+        self._report_to_rate_limiter(next(iter(backend_results.values())))
+        self._record_primary_outcome(list(backend_results.values()), time.monotonic() - start_time)
+
+        return {
+            target_language: self._finish_translation(
+                text, result, placeholders, target_language, source_language
+            )
+            for target_language, result in backend_results.items()
+            if target_language in target_languages
+            and not result.error_message
+            and result.translated_text
+        }
+
+    def _translate_uncached(
+        self, text: str, target_language: str, source_language: Optional[str]
+    ) -> TranslationResult:
+        """Translate a segment that is not in the cache through the backend"""
+        # Extract formatting if enabled
+        clean_text = text
+        placeholders = {}
+
+        if self.config.preserve_formatting:
+            clean_text, placeholders = self.formatter.extract_formatting(text)
+
+        if len(clean_text) > self._max_text_chars():
+            return self._translate_chunked(
+                text, clean_text, placeholders, target_language, source_language
+            )
+
+        return self._translate_with_retry(
+            text, clean_text, placeholders, target_language, source_language
+        )
+
+    def _translate_chunked(
+        self,
+        text: str,
+        clean_text: str,
+        placeholders: Dict[str, str],
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """Translate a text over the backend's size limit chunk by chunk"""
+        # Surrounding whitespace is kept out of the chunks and put back after
+        body = clean_text.strip()
+        leading = clean_text[: len(clean_text) - len(clean_text.lstrip())]
+        trailing = clean_text[len(clean_text.rstrip()) :]
+        chunks = chunk_text(body, self._max_text_chars())
+        self.logger.info(f"Splitting {len(clean_text)} characters into {len(chunks)} chunks")
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(chunks), self.config.max_concurrent_requests)
+        ) as executor:
+            chunk_results = list(
+                executor.map(
+                    lambda chunk: self._call_with_retry(chunk, target_language, source_language),
+                    [chunk for chunk, _ in chunks],
+                )
+            )
+
+        failed = next((r for r in chunk_results if r.error_message), None)
+        if failed:
+            failed.original_text = text
+            return failed
+
+        translated = "".join(
+            chunk_result.translated_text + separator
+            for chunk_result, (_, separator) in zip(chunk_results, chunks)
+        )
+        result = TranslationResult(
+            original_text=text,
+            translated_text=leading + translated + trailing,
+            source_language=chunk_results[0].source_language,
+            target_language=target_language,
+            service_used=chunk_results[0].service_used,
+            confidence=min(r.confidence for r in chunk_results),
+            processing_time=sum(r.processing_time for r in chunk_results),
+        )
+        return self._finish_translation(
+            text, result, placeholders, target_language, source_language
+        )
+
+    def _lookup_stored(
+        self, text: str, target_language: str, source_language: Optional[str]
+    ) -> Optional[TranslationResult]:
+        """Answer from empty input, the cache or translation memory, if possible"""
         if not text or not text.strip():
             return TranslationResult(
                 original_text=text,
@@ -432,6 +1912,9 @@ class TranslationService:
         if self.cache:
             cached_translation = self.cache.get(text, target_language, source_language or "auto")
             if cached_translation:
+                self.stats.increment(
+                    bytes_saved=len(text.encode("utf-8")), api_calls_avoided=1
+                )
                 return TranslationResult(
                     original_text=text,
                     translated_text=cached_translation,
@@ -442,45 +1925,209 @@ class TranslationService:
                     cached=True,
                 )
 
-        # Extract formatting if enabled
-        clean_text = text
-        placeholders = {}
+        # Fall back to near-matches from translation memory
+        if self.memory:
+            match = self.memory.lookup(text, target_language, source_language or "auto")
+            if match:
+                if match.exact:
+                    self.stats.increment(memory_exact_hits=1)
+                else:
+                    self.stats.increment(memory_fuzzy_hits=1)
+                self.stats.increment(bytes_saved=len(text.encode("utf-8")), api_calls_avoided=1)
 
-        if self.config.preserve_formatting:
-            clean_text, placeholders = self.formatter.extract_formatting(text)
+                return TranslationResult(
+                    original_text=text,
+                    translated_text=match.translation,
+                    source_language=source_language or "auto",
+                    target_language=target_language,
+                    service_used="translation_memory",
+                    confidence=0.9 * match.similarity,
+                    cached=True,
+                )
+
+        return None
+
+    def _finish_translation(
+        self,
+        text: str,
+        result: TranslationResult,
+        placeholders: Dict[str, str],
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """Restore formatting on a successful backend result and store it"""
+        result.original_text = text
+
+        # Restore formatting, repairing placeholders the backend mangled
+        if self.config.preserve_formatting and placeholders:
+            translated, intact = self.formatter.repair_placeholders(
+                result.translated_text, placeholders
+            )
+            if intact:
+                if translated != result.translated_text:
+                    self.stats.increment(placeholder_repairs=1)
+                result.translated_text = self.formatter.restore_formatting(
+                    translated, placeholders, target_language
+                )
+            elif getattr(self._fallback_state, "active", False):
+                self.stats.increment(placeholder_failures=1)
+                return self._placeholder_failure(
+                    text, result, target_language, "already translating around formatting"
+                )
+            else:
+                result = self._translate_around_formatting(
+                    text, result, target_language, source_language
+                )
+                if result.error_message:
+                    return result
+
+        # Cache successful translation
+        if self.cache and result.translated_text:
+            self.cache.set(text, target_language, result.translated_text, result.source_language)
+        if self.memory and result.translated_text:
+            self.memory.add(
+                text, result.translated_text, target_language, source_language or "auto"
+            )
+
+        return result
 
-        # Translate with retry logic
+    def _translate_around_formatting(
+        self,
+        text: str,
+        result: TranslationResult,
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """
+        Retranslate a text whose placeholders were lost, without placeholders
+
+        The runs of text between formatting spans are translated on their
+        own and put back between the original spans, so the formatting is
+        kept verbatim at the cost of some sentence context. Glossary terms
+        are cut out of the runs the same way, so the runs carry no
+        placeholders and this fallback never nests.
+        """
+        self.stats.increment(placeholder_fallbacks=1)
+        self.logger.warning(
+            f"Placeholders lost translating '{text[:50]}...', translating around formatting"
+        )
+
+        parts = self.formatter.split_formatting(text, target_language)
+        runs = [
+            index
+            for index, (part, is_protected) in enumerate(parts)
+            if not is_protected and any(char.isalpha() for char in part)
+        ]
+        self._fallback_state.active = True
+        try:
+            run_results = self.translate_batch(
+                [parts[index][0].strip() for index in runs], target_language, source_language
+            )
+        finally:
+            self._fallback_state.active = False
+
+        failed = next((r for r in run_results if r.error_message or not r.translated_text), None)
+        if failed:
+            self.stats.increment(placeholder_failures=1)
+            return self._placeholder_failure(
+                text,
+                result,
+                target_language,
+                f"translating around them failed: {failed.error_message or 'empty translation'}",
+            )
+
+        translated_parts = [part for part, _ in parts]
+        for index, run_result in zip(runs, run_results):
+            part = parts[index][0]
+            leading = part[: len(part) - len(part.lstrip())]
+            trailing = part[len(part.rstrip()) :]
+            translated_parts[index] = leading + run_result.translated_text + trailing
+
+        result.translated_text = "".join(translated_parts)
+        result.processing_time += sum(r.processing_time for r in run_results)
+        return result
+
+    def _placeholder_failure(
+        self, text: str, result: TranslationResult, target_language: str, reason: str
+    ) -> TranslationResult:
+        """Build the failed result for a text whose placeholders could not be kept"""
+        return TranslationResult(
+            original_text=text,
+            translated_text="",
+            source_language=result.source_language,
+            target_language=target_language,
+            service_used=f"{result.service_used}_failed",
+            processing_time=result.processing_time,
+            error_message=f"Formatting placeholders were lost and {reason}",
+        )
+
+    def _translate_with_retry(
+        self,
+        text: str,
+        clean_text: str,
+        placeholders: Dict[str, str],
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """Translate one segment through the backends and restore and store it"""
+        result = self._call_with_retry(clean_text, target_language, source_language)
+        if result.error_message:
+            result.original_text = text
+            return result
+        return self._finish_translation(
+            text, result, placeholders, target_language, source_language
+        )
+
+    def _call_with_retry(
+        self, text: str, target_language: str, source_language: Optional[str]
+    ) -> TranslationResult:
+        """
+        Send text to the backends, retrying failed attempts
+
+        Each backend is tried at most as often as its own retry policy
+        allows, and the wait before the next attempt follows the policy of
+        the backend that failed last. The result is returned as the backend
+        gave it: chunks of a longer segment go through here without being
+        cached on their own.
+
+        Args:
+            text: Formatting-free text to translate
+            target_language: Target language code
+            source_language: Source language code
+
+        Returns:
+            TranslationResult: Successful result, or the last failure
+        """
+        tried: List[str] = []
         last_error = None
-        for attempt in range(self.config.max_retries):
+        attempts = 0
+
+        while self._retryable_backends(tried):
+            attempts += 1
             try:
-                result = self.translator.translate(clean_text, target_language, source_language)
+                result = self._call_backends(text, target_language, source_language, tried)
 
                 if result.error_message:
                     last_error = result.error_message
-                    if attempt < self.config.max_retries - 1:
-                        time.sleep(self.config.retry_delay * (attempt + 1))
+                    if not result.retryable:
+                        self.logger.error(f"Translation failed, not retrying: {last_error}")
+                        return result
+                    if self._retryable_backends(tried):
+                        # A Retry-After from the server already pauses the rate limiter
+                        if result.retry_after is None:
+                            time.sleep(self._retry_delay(tried))
                         continue
-                    return result
-
-                # Restore formatting
-                if self.config.preserve_formatting and placeholders:
-                    result.translated_text = self.formatter.restore_formatting(
-                        result.translated_text, placeholders
-                    )
-
-                # Cache successful translation
-                if self.cache and result.translated_text:
-                    self.cache.set(
-                        text, target_language, result.translated_text, result.source_language
-                    )
 
                 return result
 
             except Exception as e:
                 last_error = str(e)
-                if attempt < self.config.max_retries - 1:
-                    self.logger.warning(f"Translation attempt {attempt + 1} failed: {e}")
-                    time.sleep(self.config.retry_delay * (attempt + 1))
+                if not is_retryable_error(e):
+                    self.logger.error(f"Translation failed, not retrying: {e}")
+                    break
+                if self._retryable_backends(tried):
+                    self.logger.warning(f"Translation attempt {attempts} failed: {e}")
+                    time.sleep(self._retry_delay(tried, throttle_details(e)[1]))
                 else:
                     self.logger.error(f"All translation attempts failed: {e}")
 
@@ -491,39 +2138,525 @@ class TranslationService:
             source_language=source_language or "unknown",
             target_language=target_language,
             service_used=self.config.service,
-            error_message=f"Translation failed after {self.config.max_retries} attempts: {last_error}",
+            error_message=f"Translation failed after {attempts} attempts: {last_error}",
+        )
+
+    def _retryable_backends(
+        self, tried: List[str]
+    ) -> List[Tuple[str, BaseTranslator, RateLimiter]]:
+        """Backends of the chain that have attempts left under their retry policy"""
+        return [
+            backend
+            for backend in self._backends()
+            if tried.count(backend[0]) < self._get_retry_policy(backend[0]).max_retries
+        ]
+
+    def _retry_delay(self, tried: List[str], retry_after: Optional[float] = None) -> float:
+        """Backoff before the next attempt, by the policy of the backend that failed last"""
+        service = tried[-1]
+        return self._get_retry_policy(service).delay(tried.count(service) - 1, retry_after)
+
+    def _call_backends(
+        self,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        tried: Optional[List[str]] = None,
+    ) -> TranslationResult:
+        """
+        Send a segment to the first healthy backend, failing over down the chain
+
+        When every earlier backend was skipped, the last one is called even
+        with its breaker open: with nowhere left to fail over to, rejecting
+        the segment would only turn a possible translation into an error.
+
+        Args:
+            text: Formatting-free text to translate
+            target_language: Target language code
+            source_language: Source language code
+            tried: Backends called so far for this text; backends out of
+                retries are skipped and each call made is appended
+
+        Returns:
+            TranslationResult: First successful result, or the last failure
+        """
+        result = None
+        last_exception = None
+        if tried is None:
+            tried = []
+        backends = self._retryable_backends(tried)
+
+        for index, (service, translator, rate_limiter) in enumerate(backends):
+            last_resort = index == len(backends) - 1 and result is None and last_exception is None
+            if not self._get_breaker(service).allow_request() and not last_resort:
+                continue
+
+            tried.append(service)
+            try:
+                if self.hedge_policy:
+                    result = self._call_hedged(
+                        backends, index, text, target_language, source_language
+                    )
+                else:
+                    result = self._call_backend(
+                        service, translator, rate_limiter, text, target_language, source_language
+                    )
+            except Exception as e:
+                last_exception = e
+                self.logger.warning(f"Backend {service} failed: {e}")
+                continue
+
+            if result.error_message:
+                continue
+            return result
+
+        if result is None:
+            raise last_exception
+        return result
+
+    def _call_backend(
+        self,
+        service: str,
+        translator: BaseTranslator,
+        rate_limiter: RateLimiter,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+        acquire: bool = True,
+    ) -> TranslationResult:
+        """
+        Make one backend call and record its outcome
+
+        Args:
+            acquire: Wait for the backend's rate limiter first; False when
+                the caller already holds the token
+        """
+        return self._timed_call(
+            service,
+            rate_limiter,
+            len(text),
+            service,
+            acquire,
+            lambda: [translator.translate(text, target_language, source_language)],
+        )[0]
+
+    def _call_backend_batch(
+        self,
+        service: str,
+        translator: BaseTranslator,
+        rate_limiter: RateLimiter,
+        texts: List[str],
+        target_language: str,
+        source_language: Optional[str],
+        acquire: bool = True,
+    ) -> List[TranslationResult]:
+        """Make one batched backend call and record its outcome"""
+        return self._timed_call(
+            service,
+            rate_limiter,
+            sum(len(text) for text in texts),
+            self._latency_key(service, len(texts)),
+            acquire,
+            lambda: translator.translate_batch(texts, target_language, source_language),
+        )
+
+    @staticmethod
+    def _latency_key(service: str, count: int) -> str:
+        """Hedge latency series of a request: batches are tracked apart from single texts"""
+        return service if count == 1 else f"{service}:batch"
+
+    def _timed_call(
+        self,
+        service: str,
+        rate_limiter: RateLimiter,
+        characters: int,
+        latency_key: str,
+        acquire: bool,
+        call: Callable[[], List[TranslationResult]],
+    ) -> List[TranslationResult]:
+        """Run one backend request, feeding its outcome to the breaker, limiter and hedging"""
+        breaker = self._get_breaker(service)
+        if acquire:
+            rate_limiter.acquire(characters)
+        self.stats.increment(api_calls=1)
+
+        start_time = time.monotonic()
+        try:
+            results = call()
+        except Exception as e:
+            breaker.record_failure(str(e))
+            raise
+        latency = time.monotonic() - start_time
+
+        if not results:
+            return results
+        self._report_to_rate_limiter(results[0], rate_limiter)
+        if all(result.error_message for result in results):
+            breaker.record_failure(results[0].error_message)
+        else:
+            breaker.record_success(latency)
+            if self.hedge_policy:
+                self.hedge_policy.record(latency_key, latency)
+        return results
+
+    def _call_hedged(
+        self,
+        backends: List[Tuple[str, BaseTranslator, RateLimiter]],
+        index: int,
+        text: str,
+        target_language: str,
+        source_language: Optional[str],
+    ) -> TranslationResult:
+        """Call a backend for one text, hedging to the next healthy backend in the chain"""
+        return self._hedged(
+            backends[index],
+            backends[index + 1 :],
+            len(text),
+            backends[index][0],
+            lambda backend, acquire: [
+                self._call_backend(*backend, text, target_language, source_language, acquire)
+            ],
+        )[0]
+
+    def _call_primary_batch(
+        self, texts: List[str], target_language: str, source_language: Optional[str]
+    ) -> List[TranslationResult]:
+        """Send one batch request to the primary backend, hedged if configured"""
+        backends = self._backends()
+
+        def call(backend, acquire):
+            return self._call_backend_batch(
+                *backend, texts, target_language, source_language, acquire
+            )
+
+        if not self.hedge_policy:
+            return call(backends[0], True)
+        # A lone text fits any backend; a longer batch is sized for the primary
+        return self._hedged(
+            backends[0],
+            backends[1:] if len(texts) == 1 else [],
+            sum(len(text) for text in texts),
+            self._latency_key(backends[0][0], len(texts)),
+            call,
         )
 
+    def _hedged(
+        self,
+        backend: Tuple[str, BaseTranslator, RateLimiter],
+        hedge_backends: List[Tuple[str, BaseTranslator, RateLimiter]],
+        characters: int,
+        latency_key: str,
+        call: Callable[[Tuple[str, BaseTranslator, RateLimiter], bool], List[TranslationResult]],
+    ) -> List[TranslationResult]:
+        """
+        Make a backend request, duplicating it if it runs into the latency tail
+
+        The duplicate goes to the first healthy backend of hedge_backends, or
+        to the same backend when there is none. Whichever request succeeds
+        first wins; the other is left to finish in the background. The
+        primary's rate limiter token is taken before the hedge timer starts,
+        so time spent queueing for the budget never triggers a hedge.
+
+        Args:
+            backend: Backend to send the request to
+            hedge_backends: Backends the duplicate may go to, in order
+            characters: Characters the request sends
+            latency_key: Latency series the hedge delay is taken from
+            call: Makes the request to a backend, told whether the rate
+                limiter still has to be acquired
+
+        Returns:
+            List[TranslationResult]: Results of the winning request
+        """
+        service = backend[0]
+        backend[2].acquire(characters)
+        primary = self._hedge_executor.submit(call, backend, False)
+
+        delay = self.hedge_policy.hedge_delay(latency_key)
+        if delay is None:
+            return primary.result()
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        if not self.hedge_policy.try_hedge():
+            return primary.result()
+        hedge_backend = next(
+            (b for b in hedge_backends if self._get_breaker(b[0]).allow_request()), backend
+        )
+
+        self.stats.increment(hedged_requests=1)
+        self.logger.debug(f"Hedging {service} call after {delay:.2f}s to {hedge_backend[0]}")
+        hedge = self._hedge_executor.submit(call, hedge_backend, True)
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None and not all(
+                    result.error_message for result in future.result()
+                ):
+                    if future is hedge:
+                        self.stats.increment(hedge_wins=1)
+                    return future.result()
+
+        return primary.result()
+
+    def _report_to_rate_limiter(
+        self, result: TranslationResult, rate_limiter: Optional[RateLimiter] = None
+    ) -> None:
+        """Adapt the shared rate to the outcome of a backend request"""
+        rate_limiter = rate_limiter or self.rate_limiter
+        if result.throttled:
+            rate_limiter.on_throttle(result.retry_after)
+        elif not result.error_message:
+            rate_limiter.on_success()
+
+    def _record_primary_outcome(self, results: List[TranslationResult], latency: float) -> None:
+        """Feed the outcome of a batched primary-backend request to its breaker"""
+        breaker = self._get_breaker(self.config.service.lower())
+        failure = next((r.error_message for r in results if r.error_message), None)
+        if failure and all(r.error_message for r in results):
+            breaker.record_failure(failure)
+        else:
+            breaker.record_success(latency)
+
     def translate_batch(
         self, texts: List[str], target_language: str, source_language: Optional[str] = None
     ) -> List[TranslationResult]:
         """
         Translate multiple texts
 
+        Segments not answered by the cache are sent to the backend in as few
+        requests as its batch limits allow, with short segments packed into
+        one text for backends lacking a real multi-text request. Segments
+        that fail inside a batch go through the single-segment retry path.
+        Segments another caller is already translating are not requested
+        again; their results are awaited once this batch is done.
+
         Args:
             texts: List of texts to translate
             target_language: Target language code
             source_language: Source language code
 
         Returns:
-            List[TranslationResult]: List of translation results
+            List[TranslationResult]: Translation results in input order
         """
-        results = []
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+
+        misses = []
+        for index, text in enumerate(texts):
+            stored = self._lookup_stored(text, target_language, source_language)
+            if stored:
+                results[index] = stored
+            else:
+                misses.append(index)
+
+        # Runs of a fallback never wait on other callers, whose own fallbacks
+        # could be waiting on this one
+        if getattr(self._fallback_state, "active", False):
+            self._translate_misses(texts, misses, results, target_language, source_language)
+            return results
+
+        keys = [
+            TranslationCache._get_cache_key(texts[i], target_language, source_language or "auto")
+            for i in misses
+        ]
+        led = []
+        followed = []
+        for index, key, (in_flight, leader) in zip(misses, keys, self._join_in_flight(keys)):
+            if leader:
+                led.append((index, key, in_flight))
+            else:
+                followed.append((index, in_flight))
 
-        for text in texts:
-            result = self.translate_text(text, target_language, source_language)
-            results.append(result)
+        try:
+            self._translate_misses(
+                texts, [i for i, _, _ in led], results, target_language, source_language
+            )
+        finally:
+            for index, key, in_flight in led:
+                self._finish_in_flight(key, in_flight, results[index])
 
-            # Small delay between requests to avoid rate limiting
-            if not result.cached:
-                time.sleep(0.1)
+        for index, in_flight in followed:
+            results[index] = self._follow_in_flight(
+                in_flight, texts[index], target_language, source_language
+            )
 
         return results
 
+    def _translate_misses(
+        self,
+        texts: List[str],
+        misses: List[int],
+        results: List[Optional[TranslationResult]],
+        target_language: str,
+        source_language: Optional[str],
+    ) -> None:
+        """
+        Translate the batch segments the cache could not answer
+
+        Args:
+            texts: Segments of the batch
+            misses: Indices of the segments to translate
+            results: Result per segment, filled in for the misses
+            target_language: Target language code
+            source_language: Source language code
+        """
+        pending: List[Tuple[int, str, Dict[str, str]]] = []
+
+        if self.config.preserve_formatting:
+            extracted = self.formatter.extract_formatting_batch([texts[i] for i in misses])
+        else:
+            extracted = [(texts[i], {}) for i in misses]
+
+        for index, (clean_text, placeholders) in zip(misses, extracted):
+            text = texts[index]
+            if len(clean_text) > self._max_text_chars():
+                results[index] = self._translate_chunked(
+                    text, clean_text, placeholders, target_language, source_language
+                )
+                continue
+            pending.append((index, clean_text, placeholders))
+
+        if not pending:
+            return
+
+        clean_texts = [clean_text for _, clean_text, _ in pending]
+        batch_results = self._translate_packed(clean_texts, target_language, source_language)
+        unanswered = [i for i, result in enumerate(batch_results) if result is None]
+        breaker = self._get_breaker(self.config.service.lower())
+
+        # Backends that send a request per text get one text per call, so each
+        # of those requests is paced and counted
+        max_batch_items = (
+            self.translator.max_batch_items if self.translator.batch_is_single_request else 1
+        )
+        for batch_indices in split_into_batches(
+            [clean_texts[i] for i in unanswered], max_batch_items, self.translator.max_batch_chars
+        ):
+            # Segments of skipped batches fail over one by one below
+            if not breaker.allow_request():
+                continue
+
+            indices = [unanswered[i] for i in batch_indices]
+            batch = [clean_texts[i] for i in indices]
+            try:
+                results_for_batch = self._call_primary_batch(
+                    batch, target_language, source_language
+                )
+            except Exception as e:
+                self.logger.warning(f"Batch translation failed, translating one by one: {e}")
+                continue
+
+            for index, result in zip(indices, results_for_batch):
+                batch_results[index] = result
+
+        for (index, clean_text, placeholders), result in zip(pending, batch_results):
+            text = texts[index]
+            if result is None or result.error_message or not result.translated_text:
+                results[index] = self._translate_with_retry(
+                    text, clean_text, placeholders, target_language, source_language
+                )
+            else:
+                results[index] = self._finish_translation(
+                    text, result, placeholders, target_language, source_language
+                )
+
+    def _translate_packed(
+        self, texts: List[str], target_language: str, source_language: Optional[str]
+    ) -> List[Optional[TranslationResult]]:
+        """
+        Translate short segments packed together into single requests
+
+        Args:
+            texts: Formatting-free segments to translate
+            target_language: Target language code
+            source_language: Source language code
+
+        Returns:
+            List[Optional[TranslationResult]]: Result per segment, None for
+            segments that were not packed or whose pack did not split back
+        """
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        if not self.config.pack_max_chars or not self.translator.pack_segments:
+            return results
+
+        packable = [
+            i
+            for i, text in enumerate(texts)
+            if len(text) <= self.PACKED_SEGMENT_MAX_CHARS and "[[" not in text
+        ]
+        groups = split_into_batches(
+            [texts[i] for i in packable],
+            self.translator.max_batch_items,
+            self.config.pack_max_chars,
+        )
+
+        breaker = self._get_breaker(self.config.service.lower())
+        for group in groups:
+            if len(group) < 2 or not breaker.allow_request():
+                continue
+            indices = [packable[i] for i in group]
+            segments = [texts[i] for i in indices]
+            packed = pack_segments(segments)
+
+            backends = self._backends()
+            try:
+                if self.hedge_policy:
+                    result = self._call_hedged(
+                        backends, 0, packed, target_language, source_language
+                    )
+                else:
+                    result = self._call_backend(
+                        *backends[0], packed, target_language, source_language
+                    )
+            except Exception as e:
+                self.logger.warning(f"Packed translation failed: {e}")
+                continue
+
+            translations = (
+                unpack_segments(result.translated_text, len(segments))
+                if not result.error_message
+                else None
+            )
+            if translations is None:
+                self.stats.increment(packing_fallbacks=1)
+                self.logger.debug(
+                    f"Packed request of {len(segments)} segments did not split back, "
+                    "translating them separately"
+                )
+                continue
+
+            self.stats.increment(packed_segments=len(segments))
+            for index, segment, translation in zip(indices, segments, translations):
+                results[index] = TranslationResult(
+                    original_text=segment,
+                    translated_text=translation,
+                    source_language=result.source_language,
+                    target_language=target_language,
+                    service_used=result.service_used,
+                    confidence=result.confidence,
+                    processing_time=result.processing_time / len(segments),
+                )
+
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and backend usage counters"""
+        return self.stats.as_dict()
+
     def detect_language(self, text: str) -> str:
-        """Detect language of text"""
-        try:
-            return self.translator.detect_language(text)
-        except Exception as e:
-            self.logger.warning(f"Language detection failed: {e}")
-            return "unknown"
+        """
+        Detect language of text with the offline n-gram detector
+
+        Args:
+            text: Text to identify
+
+        Returns:
+            str: Language code, or "unknown" for texts with too few letters
+        """
+        return self.language_detector.detect(text)
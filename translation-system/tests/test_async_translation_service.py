@@ -0,0 +1,160 @@
+"""
+Unit tests for Async Translation Service
+
+Tests concurrent translation, ordering and the in-flight limit.
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.async_translation_service import AsyncTranslationService
+from services.translation_service import TranslationResult
+from core.config_manager import TranslationConfig
+
+
+class SlowTranslationService:
+    """Stand-in for TranslationService with a fixed per-call latency"""
+
+    def __init__(self, latency: float):
+        self.config = TranslationConfig(max_concurrent_requests=4)
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def translate_text(self, text, target_language, source_language=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        return TranslationResult(
+            original_text=text,
+            translated_text=f"{text} [{target_language}]",
+            source_language=source_language or "auto",
+            target_language=target_language,
+            service_used="slow",
+        )
+
+    def translate_batch(self, texts, target_language, source_language=None):
+        return [self.translate_text(text, target_language, source_language) for text in texts]
+
+    def translate_text_multi(self, text, target_languages, source_language=None):
+        return {
+            lang: self.translate_text(text, lang, source_language) for lang in target_languages
+        }
+
+
+class TestAsyncTranslationService:
+    """Test suite for AsyncTranslationService"""
+
+    def test_translate_text(self):
+        """Test a single async translation"""
+        service = AsyncTranslationService(SlowTranslationService(0))
+
+        result = asyncio.run(service.translate_text("Hello", "sk", "en"))
+        service.close()
+
+        assert result.translated_text == "Hello [sk]"
+
+    def test_translate_batch(self):
+        """Test that a batch is translated in one worker call"""
+        service = AsyncTranslationService(SlowTranslationService(0))
+
+        results = asyncio.run(service.translate_batch(["Hello", "World"], "sk", "en"))
+        service.close()
+
+        assert [r.translated_text for r in results] == ["Hello [sk]", "World [sk]"]
+
+    def test_translate_text_multi(self):
+        """Test that several languages are translated in one worker call"""
+        service = AsyncTranslationService(SlowTranslationService(0))
+
+        results = asyncio.run(service.translate_text_multi("Hello", ["sk", "de"], "en"))
+        service.close()
+
+        assert {lang: r.translated_text for lang, r in results.items()} == {
+            "sk": "Hello [sk]",
+            "de": "Hello [de]",
+        }
+
+    def test_translate_many_keeps_order(self):
+        """Test that results come back in request order"""
+        service = AsyncTranslationService(SlowTranslationService(0.01))
+        requests = [(f"Text {i}", lang, "en") for i in range(5) for lang in ("sk", "de")]
+
+        results = asyncio.run(service.translate_many(requests))
+        service.close()
+
+        assert [r.translated_text for r in results] == [
+            f"{text} [{lang}]" for text, lang, _ in requests
+        ]
+
+    def test_in_flight_limit(self):
+        """Test that concurrency is used but never exceeds the limit"""
+        backend = SlowTranslationService(0.05)
+        service = AsyncTranslationService(backend, max_concurrency=4)
+        requests = [(f"Text {i}", "sk", "en") for i in range(12)]
+
+        start = time.monotonic()
+        asyncio.run(service.translate_many(requests))
+        elapsed = time.monotonic() - start
+        service.close()
+
+        assert backend.max_in_flight == 4
+        # 12 requests, 4 at a time, 50ms each: about 150ms instead of 600ms
+        assert elapsed < 0.45
+
+    def test_default_limit_from_config(self):
+        """Test that the in-flight limit defaults to the configuration"""
+        service = AsyncTranslationService(SlowTranslationService(0))
+
+        assert service.max_concurrency == 4
+        service.close()
+
+    def test_reuse_across_event_loops(self):
+        """Test that one service can serve several asyncio.run calls"""
+        service = AsyncTranslationService(SlowTranslationService(0.01), max_concurrency=2)
+        requests = [(f"Text {i}", "sk", "en") for i in range(6)]
+
+        first = asyncio.run(service.translate_many(requests))
+        second = asyncio.run(service.translate_many(requests))
+        service.close()
+
+        assert len(first) == len(second) == 6
+
+    def test_exit_does_not_block_event_loop(self):
+        """Test that leaving the context drains workers off the event loop"""
+        service = AsyncTranslationService(SlowTranslationService(0), max_concurrency=2)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.005)
+
+        async def run():
+            ticker = asyncio.create_task(tick())
+            async with service:
+                service._executor.submit(time.sleep, 0.1)
+                await asyncio.sleep(0)
+                started = len(ticks)
+            exiting = len(ticks) - started
+            ticker.cancel()
+            return exiting
+
+        # The loop keeps ticking while the 100ms worker drains
+        assert asyncio.run(run()) >= 5
+        assert service._executor._shutdown
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,91 @@
+"""
+Unit tests for Circuit Breaker
+
+Tests tripping on errors and slow calls, and half-open recovery probes.
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker"""
+
+    def test_stays_closed_below_threshold(self):
+        """Test that occasional failures do not open the breaker"""
+        breaker = CircuitBreaker("test", error_rate_threshold=0.5)
+
+        for _ in range(8):
+            breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_opens_on_error_rate(self):
+        """Test that a high error rate opens the breaker and rejects calls"""
+        breaker = CircuitBreaker("test", error_rate_threshold=0.5, open_seconds=60)
+
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.record_failure("HTTP 429")
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+    def test_slow_calls_count_as_failures(self):
+        """Test that calls over the latency threshold trip the breaker"""
+        breaker = CircuitBreaker("test", slow_call_seconds=1.0, open_seconds=60)
+
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.record_success(latency=5.0)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_half_open_probe_closes_on_success(self):
+        """Test that one probe is allowed after the open time and success closes"""
+        breaker = CircuitBreaker("test", open_seconds=0.05)
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.record_failure()
+
+        time.sleep(0.06)
+
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Only one probe at a time
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe opens the breaker again"""
+        breaker = CircuitBreaker("test", open_seconds=0.05)
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.record_failure()
+
+        time.sleep(0.06)
+        assert breaker.allow_request()
+        breaker.record_failure("still down")
+
+        assert not breaker.allow_request()
+
+    def test_success_while_open_closes(self):
+        """Test that a call forced through an open breaker closes it on success"""
+        breaker = CircuitBreaker("test", open_seconds=60)
+        for _ in range(CircuitBreaker.MIN_CALLS):
+            breaker.record_failure()
+
+        breaker.record_failure("still down")
+        assert breaker.state == CircuitBreaker.OPEN
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
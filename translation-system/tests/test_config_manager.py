@@ -184,6 +184,32 @@ class TestConfigManager:
             assert config.ftp_config.host == 'env-host.com'
             assert config.ftp_config.port == 9999
     
+    def test_fallback_services_and_keys(self):
+        """Test that the fallback chain and per-backend keys load from the environment"""
+        with patch.dict(os.environ, {
+            'FTP_HOST': 'test.com',
+            'FTP_USERNAME': 'testuser',
+            'FTP_PASSWORD': 'testpass',
+            'TRANSLATION_FALLBACK_SERVICES': 'deepl, openai',
+            'DEEPL_API_KEY': 'deepl-key',
+            'OPENAI_API_KEY': ''
+        }):
+            config = ConfigManager(self.config_file)
+            
+            assert config.translation_config.fallback_services == ['deepl', 'openai']
+            assert config.translation_config.service_api_keys == {'deepl': 'deepl-key'}
+    
+    def test_missing_glossary_file_fails_validation(self):
+        """Test that a configured glossary file must exist"""
+        with patch.dict(os.environ, {
+            'FTP_HOST': 'test.com',
+            'FTP_USERNAME': 'testuser',
+            'FTP_PASSWORD': 'testpass',
+            'TRANSLATION_GLOSSARY_FILE': os.path.join(self.temp_dir, 'missing.json')
+        }):
+            with pytest.raises(ValueError, match="Glossary file not found"):
+                ConfigManager(self.config_file)
+    
     def test_invalid_config_file(self):
         """Test handling of invalid configuration file"""
         with open(self.config_file, 'w') as f:
@@ -0,0 +1,361 @@
+"""
+Unit tests for File Processor
+
+Tests content extraction, concurrent translation and rebuilding of files.
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bs4 import BeautifulSoup
+
+from services.file_processor import FileProcessorManager, HTMLFileProcessor
+from services.translation_service import TranslationResult, TranslationService
+from core.config_manager import TranslationConfig
+
+
+class MockConfigManager:
+    """Minimal configuration manager for file processing"""
+
+    def __init__(self, target_languages, max_concurrent_requests=8):
+        self.translation_config = TranslationConfig(
+            source_language="en",
+            target_languages=target_languages,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+    def is_supported_file(self, path):
+        return path.endswith((".txt", ".md", ".html", ".json"))
+
+    def get_translated_filename(self, original, lang):
+        if lang == "en":
+            return original
+        base, ext = os.path.splitext(original)
+        return f"{base}_{lang}{ext}"
+
+
+class MockTranslationService:
+    """Translation service tagging text with its target language"""
+
+    supports_multi_target = False
+
+    def __init__(self, latency=0.0, fail_text=None):
+        self.latency = latency
+        self.fail_text = fail_text
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def translate_text(self, text, target_lang, source_lang=None):
+        with self._lock:
+            self.calls.append((text, target_lang))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+
+        if text == self.fail_text:
+            return TranslationResult(
+                original_text=text,
+                translated_text="",
+                source_language=source_lang or "en",
+                target_language=target_lang,
+                service_used="mock_failed",
+                error_message="Mock failure",
+            )
+
+        return TranslationResult(
+            original_text=text,
+            translated_text=f"[{target_lang}] {text}",
+            source_language=source_lang or "en",
+            target_language=target_lang,
+            service_used="mock",
+        )
+
+    def translate_batch(self, texts, target_lang, source_lang=None):
+        return [self.translate_text(text, target_lang, source_lang) for text in texts]
+
+
+class MockMultiTargetService(MockTranslationService):
+    """Translation service answering all target languages in one call"""
+
+    supports_multi_target = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.multi_calls = []
+
+    def translate_text_multi(self, text, target_langs, source_lang=None):
+        with self._lock:
+            self.multi_calls.append((text, tuple(target_langs)))
+        return {lang: self.translate_text(text, lang, source_lang) for lang in target_langs}
+
+
+class TestFileProcessorManager:
+    """Test suite for FileProcessorManager"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Cleanup test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = Path(self.temp_dir) / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def test_translate_content_fills_every_language(self):
+        """Test that every segment is translated into every target language"""
+        manager = FileProcessorManager(
+            MockConfigManager(["en", "sk", "de"]), MockTranslationService()
+        )
+
+        translations = manager.translate_content([("p_0", "Hello"), ("p_1", "World")])
+
+        assert translations == {
+            "sk": {"p_0": "[sk] Hello", "p_1": "[sk] World"},
+            "de": {"p_0": "[de] Hello", "p_1": "[de] World"},
+        }
+
+    def test_translate_content_runs_concurrently(self):
+        """Test that the language x segment matrix is translated in parallel"""
+        service = MockTranslationService(latency=0.05)
+        manager = FileProcessorManager(
+            MockConfigManager(["sk", "hu", "de", "pl"], max_concurrent_requests=8), service
+        )
+        segments = [(f"p_{i}", f"Text {i}") for i in range(4)]
+
+        start = time.monotonic()
+        manager.translate_content(segments)
+        elapsed = time.monotonic() - start
+
+        assert len(service.calls) == 16
+        assert 1 < service.max_in_flight <= 8
+        assert elapsed < 0.5
+
+    def test_failed_segment_keeps_original(self):
+        """Test that a failed segment falls back to the original text"""
+        manager = FileProcessorManager(
+            MockConfigManager(["sk"]), MockTranslationService(fail_text="World")
+        )
+
+        translations = manager.translate_content([("p_0", "Hello"), ("p_1", "World")])
+
+        assert translations["sk"] == {"p_0": "[sk] Hello", "p_1": "World"}
+
+    def test_concurrent_pages_share_backend_calls(self):
+        """Test that pages translated concurrently request a shared footer once"""
+        config_manager = MockConfigManager(["sk", "de"])
+        config_manager.translation_config = TranslationConfig(
+            service="mock",
+            source_language="en",
+            target_languages=["sk", "de"],
+            cache_enabled=False,
+            mock_latency_seconds=0.2,
+            mock_latency_sigma=0.0,
+        )
+        service = TranslationService(config_manager)
+        manager = FileProcessorManager(config_manager, service)
+        barrier = threading.Barrier(4)
+        translations = []
+
+        def translate_page():
+            barrier.wait()
+            translations.append(manager.translate_content([("footer", "Contact us")]))
+
+        threads = [threading.Thread(target=translate_page) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = {"sk": {"footer": "Contact us [sk]"}, "de": {"footer": "Contact us [de]"}}
+        assert translations == [expected] * 4
+        # One backend call per language, the other pages wait for it
+        assert service.get_stats()["api_calls"] == 2
+        assert service.get_stats()["deduplicated_requests"] == 6
+
+    def test_slow_batches_are_hedged(self):
+        """Test that batch requests of the file workflow are hedged like single texts"""
+        config_manager = MockConfigManager(["sk"])
+        config_manager.translation_config = TranslationConfig(
+            service="mock",
+            source_language="en",
+            target_languages=["sk"],
+            cache_enabled=False,
+            rate_limit_requests_per_second=0,
+            hedge_requests=True,
+            hedge_max_rate=1.0,
+            mock_latency_seconds=0.001,
+            mock_latency_sigma=0.0,
+        )
+        service = TranslationService(config_manager)
+        manager = FileProcessorManager(config_manager, service)
+
+        # Learn the usual batch latency, then let the backend stall
+        for page in range(20):
+            manager.translate_content([("h1", f"Page {page}"), ("p", f"Text {page}")])
+        assert service.get_stats()["hedged_requests"] == 0
+        config_manager.translation_config.mock_latency_seconds = 0.2
+
+        translations = manager.translate_content([("h1", "Rooms"), ("p", "Our rooms")])
+
+        assert translations == {"sk": {"h1": "Rooms [sk]", "p": "Our rooms [sk]"}}
+        assert service.get_stats()["hedged_requests"] == 1
+
+    def test_translate_content_multi_target(self):
+        """Test that multi-target backends get one request per segment"""
+        service = MockMultiTargetService(fail_text="World")
+        manager = FileProcessorManager(MockConfigManager(["en", "sk", "de"]), service)
+
+        translations = manager.translate_content([("p_0", "Hello"), ("p_1", "World")])
+
+        assert sorted(service.multi_calls) == [("Hello", ("sk", "de")), ("World", ("sk", "de"))]
+        assert translations == {
+            "sk": {"p_0": "[sk] Hello", "p_1": "World"},
+            "de": {"p_0": "[de] Hello", "p_1": "World"},
+        }
+
+    def test_process_html_file(self):
+        """Test end-to-end processing of an HTML file"""
+        file_path = self._write(
+            "page.html",
+            "<html><head><title>Welcome</title></head>"
+            "<body><h1>Our rooms</h1><img src='a.jpg' alt='Mountain view'></body></html>",
+        )
+        manager = FileProcessorManager(MockConfigManager(["en", "sk"]), MockTranslationService())
+        output_dir = os.path.join(self.temp_dir, "out")
+
+        result = manager.process_file(file_path, output_dir)
+
+        assert result.success
+        assert result.translations_count == 3
+        translated = Path(output_dir, "page_sk.html").read_text(encoding="utf-8")
+        assert "<title>[sk] Welcome</title>" in translated
+        assert "<h1>[sk] Our rooms</h1>" in translated
+        assert 'alt="[sk] Mountain view"' in translated
+
+    def test_process_files_translates_shared_segments_once(self):
+        """Test that segments repeated across files are translated once per language"""
+        service = MockTranslationService()
+        manager = FileProcessorManager(MockConfigManager(["sk", "de"]), service)
+        files = [
+            self._write(f"page{i}.txt", f"Welcome\n\nPage {i}\n\nContact us")
+            for i in range(3)
+        ]
+        output_dir = os.path.join(self.temp_dir, "out")
+
+        results = manager.process_files(files, output_dir)
+
+        assert [r.file_path for r in results] == files
+        assert all(r.success and r.translations_count == 3 for r in results)
+        # 2 shared + 3 distinct segments, 2 languages
+        assert len(service.calls) == 10
+        translated = Path(output_dir, "page1_de.txt").read_text(encoding="utf-8")
+        assert "[de] Welcome" in translated
+        assert "[de] Page 1" in translated
+        assert "[de] Contact us" in translated
+
+    def test_process_files_isolates_translation_errors(self):
+        """Test that a failing shared translation falls back to per-file processing"""
+
+        class ExplodingService(MockTranslationService):
+            def translate_batch(self, texts, target_lang, source_lang=None):
+                if "Boom" in texts:
+                    raise RuntimeError("backend exploded")
+                return super().translate_batch(texts, target_lang, source_lang)
+
+        manager = FileProcessorManager(MockConfigManager(["sk"]), ExplodingService())
+        files = [self._write("a.txt", "Hello"), self._write("b.txt", "Boom")]
+        output_dir = os.path.join(self.temp_dir, "out")
+
+        results = manager.process_files(files, output_dir, max_workers=2)
+
+        assert results[0].success
+        assert Path(output_dir, "a_sk.txt").read_text(encoding="utf-8") == "[sk] Hello"
+        assert not results[1].success
+        assert "backend exploded" in results[1].error_message
+
+    def test_process_files_reports_missing_file(self):
+        """Test that a missing file fails without stopping the others"""
+        manager = FileProcessorManager(MockConfigManager(["sk"]), MockTranslationService())
+        files = [self._write("a.txt", "Hello"), os.path.join(self.temp_dir, "missing.txt")]
+
+        results = manager.process_files(files, os.path.join(self.temp_dir, "out"))
+
+        assert results[0].success
+        assert not results[1].success
+        assert "does not exist" in results[1].error_message
+
+
+class TestHTMLFileProcessor:
+    """Test suite for HTMLFileProcessor"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.processor = HTMLFileProcessor(MockConfigManager(["en", "sk", "de", "pl"]), None)
+
+    def test_parses_each_document_once(self):
+        """Test that every language is rebuilt from the parse done at extraction"""
+        content = "<html><body><h1>Rooms</h1><p>Breakfast included</p></body></html>"
+
+        with patch("services.file_processor.BeautifulSoup", wraps=BeautifulSoup) as parser:
+            items = self.processor.extract_translatable_content(content)
+            rebuilt = self.processor.rebuild_content(
+                content,
+                {lang: {i: f"[{lang}] {t}" for i, t in items} for lang in ("sk", "de", "pl")},
+            )
+
+        assert parser.call_count == 1
+        assert rebuilt["en"] == content
+        assert rebuilt["pl"] == (
+            "<html><body><h1>[pl] Rooms</h1><p>[pl] Breakfast included</p></body></html>"
+        )
+
+    def test_untranslated_slots_keep_original_markup(self):
+        """Test escaping of translations and untouched originals"""
+        content = (
+            "<p>Fish &amp; chips</p><p><!-- note --></p>"
+            "<a title='Say \"hi\"' href='/x'>Link text</a>"
+        )
+        items = dict(self.processor.extract_translatable_content(content))
+
+        rebuilt = self.processor.rebuild_content(
+            content, {"sk": {"p_0": "Ryba <a> hranolky", "title_attr_0": 'Povedz "ahoj"'}}
+        )
+
+        assert items["p_1"] == "note"
+        assert rebuilt["sk"] == (
+            "<p>Ryba &lt;a&gt; hranolky</p><p><!-- note --></p>"
+            "<a href=\"/x\" title='Povedz \"ahoj\"'>Link text</a>"
+        )
+
+    def test_nested_elements_share_a_text_node(self):
+        """Test that an outer element's translation wins for a shared text node"""
+        content = "<div><p>Hello</p></div>"
+        items = self.processor.extract_translatable_content(content)
+
+        rebuilt = self.processor.rebuild_content(
+            content, {"sk": {"p_0": "Ahoj", "div_0": "Zdravím"}}
+        )
+
+        assert items == [("p_0", "Hello"), ("div_0", "Hello")]
+        assert rebuilt["sk"] == "<div><p>Zdravím</p></div>"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,195 @@
+"""
+Unit tests for Glossary
+
+Tests term matching, forced translations and protection during translation.
+"""
+
+import json
+import re
+import shutil
+import tempfile
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.glossary import Glossary, TermAutomaton
+from services.translation_service import (
+    FormattingPreserver,
+    TranslationResult,
+    TranslationService,
+)
+from core.config_manager import TranslationConfig
+
+
+class TestTermAutomaton:
+    """Test suite for TermAutomaton"""
+
+    def test_finds_terms_ignoring_case(self):
+        """Test that every occurrence is found regardless of case"""
+        automaton = TermAutomaton(["Vila Mlynica", "Wi-Fi"])
+        text = "Welcome to VILA MLYNICA, free wi-fi in Vila Mlynica."
+
+        spans = automaton.find(text)
+
+        assert [text[start:end] for start, end in spans] == [
+            "VILA MLYNICA", "wi-fi", "Vila Mlynica"
+        ]
+
+    def test_whole_words_only(self):
+        """Test that terms inside longer words are ignored"""
+        automaton = TermAutomaton(["spa", "SKU-1"])
+        text = "Our spacious spa, SKU-12 and SKU-1."
+
+        spans = automaton.find(text)
+
+        assert [text[start:end] for start, end in spans] == ["spa", "SKU-1"]
+
+    def test_leftmost_longest_match(self):
+        """Test that overlapping terms resolve to the leftmost, longest one"""
+        automaton = TermAutomaton(["half board", "board", "half board plus", "plus size"])
+        text = "Book half board plus size rooms"
+
+        spans = automaton.find(text)
+
+        assert [text[start:end] for start, end in spans] == ["half board plus"]
+
+    def test_failure_links_find_suffix_terms(self):
+        """Test that terms are found after a partial match of a longer term"""
+        automaton = TermAutomaton(["abcd", "bc x"])
+        text = "abc x"
+
+        spans = automaton.find(text)
+
+        assert spans == []
+        assert TermAutomaton(["abcd", "c"]).find("ab c") == [(3, 4)]
+
+    def test_many_terms(self):
+        """Test matching with thousands of terms"""
+        terms = [f"Product {i:04d}" for i in range(5000)]
+        automaton = TermAutomaton(terms)
+        text = " ".join(f"see product {i:04d}" for i in range(0, 5000, 7))
+
+        assert len(automaton.find(text)) == len(range(0, 5000, 7))
+
+
+class TestGlossary:
+    """Test suite for Glossary"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Cleanup test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_from_file(self):
+        """Test loading terms and translations from JSON"""
+        path = Path(self.temp_dir) / "glossary.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "do_not_translate": ["Vila Mlynica"],
+                    "translations": {"Half board": {"sk": "polpenzia"}},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        glossary = Glossary.from_file(str(path))
+
+        assert len(glossary) == 2
+        assert glossary.target_term("half board", "sk") == "polpenzia"
+        assert glossary.target_term("half board", "de") == "half board"
+        assert glossary.target_term("Vila Mlynica", "sk") == "Vila Mlynica"
+
+    def test_terms_protected_and_restored_per_language(self):
+        """Test that terms become placeholders and come back per language"""
+        glossary = Glossary(["Vila Mlynica"], {"half board": {"sk": "polpenzia"}})
+        formatter = FormattingPreserver(glossary)
+
+        clean_text, placeholders = formatter.extract_formatting(
+            "<b>Vila Mlynica</b> offers Half Board"
+        )
+
+        assert clean_text == (
+            "___HTML_TAG_0_0______TERM_8_0______HTML_TAG_0_1___ offers ___TERM_8_1___"
+        )
+        assert formatter.restore_formatting(clean_text, placeholders, "sk") == (
+            "<b>Vila Mlynica</b> offers polpenzia"
+        )
+        assert formatter.restore_formatting(clean_text, placeholders, "de") == (
+            "<b>Vila Mlynica</b> offers Half Board"
+        )
+
+    def test_translation_service_keeps_terms_from_backend(self):
+        """Test that the backend never sees glossary terms"""
+        path = Path(self.temp_dir) / "glossary.json"
+        path.write_text(
+            json.dumps(
+                {"do_not_translate": ["Vila Mlynica"], "translations": {"sauna": {"sk": "saunu"}}}
+            ),
+            encoding="utf-8",
+        )
+        config = TranslationConfig(
+            service="mock", mock_latency_seconds=0.0, glossary_file=str(path), cache_enabled=False
+        )
+        service = TranslationService(type("ConfigManager", (), {"translation_config": config})())
+
+        result = service.translate_text("Vila Mlynica has a sauna", "sk", "en")
+
+        assert result.translated_text == "Vila Mlynica has a saunu [sk]"
+
+    def test_split_formatting_protects_terms(self):
+        """Test that terms are protected spans given in the target language"""
+        formatter = FormattingPreserver(Glossary(["Acme"], {"sauna": {"sk": "saunu"}}))
+
+        parts = formatter.split_formatting("<b>Acme</b> has a sauna today", "sk")
+
+        assert parts == [
+            ("<b>", True), ("Acme", True), ("</b>", True), (" has a ", False),
+            ("saunu", True), (" today", False),
+        ]
+
+    def test_dropped_term_falls_back_once(self):
+        """Test that a backend dropping term placeholders does not recurse"""
+        config = TranslationConfig(service="mock", mock_latency_seconds=0.0, cache_enabled=False)
+        service = TranslationService(type("ConfigManager", (), {"translation_config": config})())
+        service.formatter = FormattingPreserver(Glossary(["Acme"]))
+        service.rate_limiter = Mock()
+
+        def translate(text, target_lang, source_lang):
+            return TranslationResult(
+                original_text=text,
+                translated_text=re.sub(r"___\w+?___", "", text) + f" [{target_lang}]",
+                source_language="en",
+                target_language=target_lang,
+                service_used="mock",
+            )
+
+        translator = Mock()
+        translator.max_text_chars = 5000
+        translator.max_batch_items = 50
+        translator.max_batch_chars = 5000
+        translator.pack_segments = False
+        translator.translate.side_effect = translate
+        translator.translate_batch.side_effect = lambda texts, target, source: [
+            translate(text, target, source) for text in texts
+        ]
+        service.translator = translator
+
+        result = service.translate_text("Welcome to Acme hotel", "sk", "en")
+
+        assert not result.error_message
+        assert result.translated_text == "Welcome to [sk] Acme hotel [sk]"
+        assert translator.translate.call_count + translator.translate_batch.call_count <= 3
+        stats = service.get_stats()
+        assert stats["placeholder_fallbacks"] == 1
+        assert stats["placeholder_failures"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
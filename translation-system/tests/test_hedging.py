@@ -0,0 +1,129 @@
+"""
+Unit tests for Request Hedging
+
+Tests latency percentiles, the hedge budget and hedged service calls.
+"""
+
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.hedging import HedgePolicy
+from services.translation_service import TranslationService, TranslationResult
+from core.config_manager import TranslationConfig
+
+
+class TestHedgePolicy:
+    """Test suite for HedgePolicy"""
+
+    def test_no_delay_until_enough_samples(self):
+        """Test that calls are not hedged before latencies are known"""
+        policy = HedgePolicy(percentile=95, max_hedge_rate=1.0)
+        for _ in range(HedgePolicy.MIN_SAMPLES - 1):
+            policy.record("google", 0.1)
+
+        assert policy.hedge_delay("google") is None
+
+    def test_delay_is_latency_percentile(self):
+        """Test that the hedge delay follows the configured percentile"""
+        policy = HedgePolicy(percentile=90, max_hedge_rate=1.0)
+        for i in range(1, 101):
+            policy.record("google", i / 100)
+
+        assert policy.hedge_delay("google") == pytest.approx(0.9)
+        assert policy.hedge_delay("deepl") is None
+
+    def test_hedge_rate_is_capped(self):
+        """Test that at most max_hedge_rate of calls are hedged"""
+        policy = HedgePolicy(max_hedge_rate=0.1)
+
+        hedges = 0
+        for _ in range(100):
+            policy.hedge_delay("google")
+            hedges += policy.try_hedge()
+
+        assert hedges == 10
+
+
+class TestHedgedTranslation:
+    """Test suite for hedged calls in TranslationService"""
+
+    def _result(self, text, translated, service):
+        return TranslationResult(
+            original_text=text,
+            translated_text=translated,
+            source_language="en",
+            target_language="sk",
+            service_used=service,
+        )
+
+    def test_stalled_call_is_hedged_to_fallback(self):
+        """Test that a call stuck past the percentile is won by the hedge"""
+        config_manager = Mock()
+        config_manager.translation_config = TranslationConfig(
+            service="google", cache_enabled=False, hedge_requests=True, hedge_max_rate=1.0
+        )
+        service = TranslationService(config_manager)
+        for _ in range(HedgePolicy.MIN_SAMPLES):
+            service.hedge_policy.record("google", 0.01)
+
+        primary = Mock()
+        primary.max_text_chars = 5000
+        primary.translate.side_effect = lambda text, target, source: (
+            time.sleep(1.0) or self._result(text, "pomaly", "google")
+        )
+        fallback = Mock()
+        fallback.max_text_chars = 5000
+        fallback.translate.side_effect = lambda text, target, source: self._result(
+            text, "Ahoj", "deepl"
+        )
+        service.translator = primary
+        service.fallbacks = [("deepl", fallback, Mock())]
+
+        start = time.monotonic()
+        result = service.translate_text("Hello", "sk", "en")
+        elapsed = time.monotonic() - start
+
+        assert result.translated_text == "Ahoj"
+        assert result.service_used == "deepl"
+        assert elapsed < 0.5
+        stats = service.get_stats()
+        assert stats["hedged_requests"] == 1
+        assert stats["hedge_wins"] == 1
+
+    def test_rate_limiter_queueing_is_not_hedged(self):
+        """Test that waiting for the rate limiter does not count toward the hedge delay"""
+        config_manager = Mock()
+        config_manager.translation_config = TranslationConfig(
+            service="google", cache_enabled=False, hedge_requests=True, hedge_max_rate=1.0
+        )
+        service = TranslationService(config_manager)
+        for _ in range(HedgePolicy.MIN_SAMPLES):
+            service.hedge_policy.record("google", 0.05)
+
+        primary = Mock()
+        primary.max_text_chars = 5000
+        primary.translate.side_effect = lambda text, target, source: self._result(
+            text, "Ahoj", "google"
+        )
+        fallback = Mock()
+        fallback.max_text_chars = 5000
+        service.translator = primary
+        service.rate_limiter = Mock()
+        service.rate_limiter.acquire.side_effect = lambda characters: time.sleep(0.3)
+        service.fallbacks = [("deepl", fallback, Mock())]
+
+        result = service.translate_text("Hello", "sk", "en")
+
+        assert result.translated_text == "Ahoj"
+        service.rate_limiter.acquire.assert_called_once_with(5)
+        fallback.translate.assert_not_called()
+        assert service.get_stats()["hedged_requests"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
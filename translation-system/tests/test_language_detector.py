@@ -0,0 +1,88 @@
+"""
+Unit tests for Language Detector
+
+Tests offline identification of the shipped languages and result caching.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.language_detector import LanguageDetector, get_language_detector
+from services.translation_service import TranslationService
+from core.config_manager import TranslationConfig
+
+
+SAMPLES = {
+    "en": ["Book your stay today", "Our rooms have a balcony", "Free parking for guests"],
+    "sk": ["Rezervujte si pobyt ešte dnes", "Naše izby majú balkón", "Kontaktujte nás"],
+    "hu": ["Foglalja le szállását még ma", "Szobáink erkéllyel rendelkeznek", "Lépjen kapcsolatba velünk"],
+    "de": ["Buchen Sie Ihren Aufenthalt noch heute", "Unsere Zimmer haben einen Balkon", "Kontaktieren Sie uns"],
+    "pl": ["Zarezerwuj swój pobyt już dziś", "Nasze pokoje mają balkon", "Bezpłatny parking dla gości"],
+}
+
+
+class TestLanguageDetector:
+    """Test suite for LanguageDetector"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.detector = LanguageDetector()
+
+    @pytest.mark.parametrize(
+        "language,text", [(lang, text) for lang, texts in SAMPLES.items() for text in texts]
+    )
+    def test_detects_shipped_languages(self, language, text):
+        """Test that short website strings are identified correctly"""
+        assert self.detector.detect(text) == language
+
+    def test_too_few_letters_is_unknown(self):
+        """Test that numbers and symbols are not assigned a language"""
+        assert self.detector.detect("2024 - 15 €") == "unknown"
+        assert self.detector.detect("") == "unknown"
+
+    def test_results_are_cached(self):
+        """Test that repeated texts are answered from the cache"""
+        self.detector.detect("Naše izby majú balkón")
+        self.detector.scores = Mock(side_effect=AssertionError("not cached"))
+
+        assert self.detector.detect("Naše izby majú balkón") == "sk"
+
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts the oldest results"""
+        detector = LanguageDetector(cache_size=2)
+        for text in ["Contact us", "Kontaktujte nás", "Kontaktieren Sie uns"]:
+            detector.detect(text)
+
+        assert len(detector._cache) == 2
+
+    def test_custom_seed_texts(self):
+        """Test that the detector can be trained on other languages"""
+        detector = LanguageDetector(
+            {"es": "Bienvenidos a nuestra casa rural en las montañas", "en": SAMPLES["en"][0]}
+        )
+
+        assert detector.languages == ["es", "en"]
+        assert detector.detect("Bienvenidos a las montañas") == "es"
+
+
+class TestServiceDetection:
+    """Test suite for TranslationService.detect_language"""
+
+    def test_detection_needs_no_backend(self):
+        """Test that detection is answered locally"""
+        config_manager = Mock()
+        config_manager.translation_config = TranslationConfig(service="google", cache_enabled=False)
+        service = TranslationService(config_manager)
+        service.translator = Mock()
+
+        assert service.detect_language("Unsere Zimmer haben einen Balkon") == "de"
+        assert service.language_detector is get_language_detector()
+        service.translator.detect_language.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
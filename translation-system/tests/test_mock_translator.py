@@ -0,0 +1,91 @@
+"""
+Unit tests for the mock translation backend
+
+Tests deterministic output and injected latency and failures.
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.translation_service import (
+    MockTranslationService, TranslationService, pack_segments, unpack_segments
+)
+from core.config_manager import TranslationConfig
+
+
+def _config(**overrides):
+    settings = dict(service="mock", mock_latency_seconds=0.0, mock_seed=7)
+    settings.update(overrides)
+    return TranslationConfig(**settings)
+
+
+class TestMockTranslationService:
+    """Test suite for MockTranslationService"""
+
+    def test_translation_is_deterministic(self):
+        """Test that every non-empty line is tagged with the target language"""
+        service = MockTranslationService(_config())
+
+        result = service.translate("Hello\n\nWorld", "sk", "en")
+
+        assert result.translated_text == "Hello [sk]\n\nWorld [sk]"
+        assert result.service_used == "mock"
+        assert not result.error_message
+
+    def test_packed_segments_survive(self):
+        """Test that segment markers come back intact"""
+        service = MockTranslationService(_config())
+
+        result = service.translate(pack_segments(["Hello", "World"]), "de", "en")
+
+        assert unpack_segments(result.translated_text, 2) == ["Hello [de]", "World [de]"]
+
+    def test_batch_is_one_request(self):
+        """Test that a batch is answered with one latency sample"""
+        service = MockTranslationService(_config(mock_latency_seconds=0.05, mock_latency_sigma=0))
+
+        start = time.monotonic()
+        results = service.translate_batch(["Hello", "World", "Again"], "sk", "en")
+        elapsed = time.monotonic() - start
+
+        assert [r.translated_text for r in results] == ["Hello [sk]", "World [sk]", "Again [sk]"]
+        assert 0.05 <= elapsed < 0.1
+
+    def test_injected_throttling(self):
+        """Test that throttled requests are reported as retryable 429s"""
+        service = MockTranslationService(_config(mock_throttle_rate=1.0))
+
+        result = service.translate("Hello", "sk", "en")
+
+        assert result.throttled
+        assert result.retryable
+        assert result.service_used == "mock_failed"
+
+    def test_failure_rate_is_repeatable(self):
+        """Test that the same seed injects the same failures"""
+        def failures(seed):
+            service = MockTranslationService(_config(mock_failure_rate=0.3, mock_seed=seed))
+            return [bool(service.translate("Hello", "sk").error_message) for _ in range(50)]
+
+        outcome = failures(1)
+        assert outcome == failures(1)
+        assert 5 < sum(outcome) < 25
+
+    def test_selected_by_service_name(self):
+        """Test that the translation service creates the mock backend"""
+        config_manager = type("ConfigManager", (), {"translation_config": _config()})()
+        service = TranslationService(config_manager)
+        service.cache = None
+
+        result = service.translate_text("Hello", "sk", "en")
+
+        assert isinstance(service.translator, MockTranslationService)
+        assert result.translated_text == "Hello [sk]"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
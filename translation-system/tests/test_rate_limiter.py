@@ -0,0 +1,123 @@
+"""
+Unit tests for Rate Limiter
+
+Tests token-bucket budgets, AIMD adaptation and per-backend sharing.
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.rate_limiter import TokenBucket, RateLimiter, get_rate_limiter
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def test_burst_within_capacity(self):
+        """Test that reservations within capacity do not wait"""
+        bucket = TokenBucket(rate=10, capacity=10)
+        now = time.monotonic()
+
+        waits = [bucket.reserve(1, now) for _ in range(10)]
+
+        assert all(wait == 0 for wait in waits)
+
+    def test_deficit_waits_for_refill(self):
+        """Test that reservations beyond capacity wait proportionally"""
+        bucket = TokenBucket(rate=10, capacity=1)
+        now = time.monotonic()
+
+        assert bucket.reserve(1, now) == 0
+        assert bucket.reserve(1, now) == pytest.approx(0.1)
+        assert bucket.reserve(1, now) == pytest.approx(0.2)
+
+    def test_unlimited_rate(self):
+        """Test that a zero rate never waits"""
+        bucket = TokenBucket(rate=0, capacity=0)
+
+        assert bucket.reserve(1000, time.monotonic()) == 0
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+
+    def test_request_budget(self):
+        """Test that requests beyond the budget are spread out"""
+        limiter = RateLimiter(requests_per_second=50)
+
+        start = time.monotonic()
+        for _ in range(60):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # 50 burst tokens, then 10 more at 50/s
+        assert elapsed >= 0.15
+
+    def test_character_budget(self):
+        """Test that the character budget limits large requests"""
+        limiter = RateLimiter(requests_per_second=0, characters_per_second=1000)
+
+        assert limiter.acquire(1000) == 0
+        assert limiter.acquire(100) == pytest.approx(0.1, abs=0.02)
+
+    def test_throttle_halves_rate_and_success_recovers(self):
+        """Test AIMD adaptation of the current rate"""
+        limiter = RateLimiter(requests_per_second=10)
+
+        limiter.on_throttle()
+        assert limiter.current_fraction == pytest.approx(0.5)
+
+        limiter.on_throttle()
+        assert limiter.current_fraction == pytest.approx(0.25)
+
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.current_fraction == pytest.approx(0.35)
+
+    def test_retry_after_pauses_callers(self):
+        """Test that Retry-After blocks the next acquire"""
+        limiter = RateLimiter(requests_per_second=0)
+
+        limiter.on_throttle(retry_after=0.1)
+        waited = limiter.acquire()
+
+        assert waited == pytest.approx(0.1, abs=0.02)
+
+    def test_shared_per_backend(self):
+        """Test that the registry returns one limiter per backend"""
+        first = get_rate_limiter("test_backend_shared", 5)
+        second = get_rate_limiter("test_backend_shared", 5)
+        other = get_rate_limiter("test_backend_other", 5)
+
+        assert first is second
+        assert first is not other
+
+    def test_registry_applies_new_rates(self):
+        """Test that a later configuration changes the shared limiter's rates"""
+        first = get_rate_limiter("test_backend_rates", 5, 100)
+        second = get_rate_limiter("test_backend_rates", 20, 0)
+
+        assert first is second
+        assert second.requests_per_second == 20
+        assert second.characters_per_second == 0
+        assert second.acquire(10000) == 0.0
+
+    def test_set_rates_keeps_throttling(self):
+        """Test that new rates are scaled by the current AIMD fraction"""
+        limiter = RateLimiter(requests_per_second=10)
+        limiter.on_throttle()
+
+        limiter.set_rates(40, 1000)
+
+        assert limiter.current_fraction == 0.5
+        assert limiter._requests.rate == 20
+        assert limiter._characters.rate == 500
+        assert limiter.acquire(500) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
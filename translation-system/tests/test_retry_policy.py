@@ -0,0 +1,159 @@
+"""
+Unit tests for Retry Policy
+
+Tests jittered exponential backoff, Retry-After and error classification.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.retry_policy import RetryPolicy, is_retryable_error
+from services.translation_service import TranslationService, TranslationResult
+from core.config_manager import TranslationConfig
+
+
+class HTTPError(Exception):
+    """Exception carrying an HTTP response like requests.HTTPError"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = Mock(status_code=status_code, headers={})
+
+
+class TestRetryPolicy:
+    """Test suite for RetryPolicy"""
+
+    def test_exponential_ceiling_without_jitter(self):
+        """Test that the delay doubles per attempt up to the maximum"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_full_jitter_stays_below_ceiling(self):
+        """Test that jittered delays spread out between zero and the ceiling"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=30.0)
+
+        delays = [policy.delay(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 100
+
+    def test_retry_after_takes_precedence(self):
+        """Test that a server-provided Retry-After is used as is"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        assert policy.delay(0, retry_after=12.0) == 12.0
+
+
+class TestErrorClassification:
+    """Test suite for retryable error classification"""
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 456])
+    def test_client_errors_are_fatal(self, status):
+        """Test that auth, quota and request errors are not retried"""
+        assert not is_retryable_error(HTTPError(status))
+
+    @pytest.mark.parametrize("status", [429, 500, 503])
+    def test_server_errors_are_retryable(self, status):
+        """Test that throttling and server errors are retried"""
+        assert is_retryable_error(HTTPError(status))
+
+    def test_auth_error_by_type_and_message(self):
+        """Test classification of library exceptions without a response"""
+        AuthenticationError = type("AuthenticationError", (Exception,), {})
+
+        assert not is_retryable_error(AuthenticationError("bad key"))
+        assert not is_retryable_error(Exception("Incorrect API key provided"))
+        assert is_retryable_error(ConnectionError("Connection reset by peer"))
+
+
+class TestServiceRetries:
+    """Test suite for the retry loop in TranslationService"""
+
+    def _service(self, **config):
+        config_manager = Mock()
+        config_manager.translation_config = TranslationConfig(
+            service="google", cache_enabled=False, **config
+        )
+        service = TranslationService(config_manager)
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        return service
+
+    @patch('services.translation_service.time.sleep')
+    def test_fatal_error_is_not_retried(self, mock_sleep):
+        """Test that an authentication failure returns after one attempt"""
+        service = self._service(max_retries=5)
+        service.translator.translate.return_value = TranslationResult(
+            original_text="Hello",
+            translated_text="",
+            source_language="en",
+            target_language="sk",
+            service_used="google_failed",
+            error_message="Google Translate failed: HTTP 403",
+            retryable=False,
+        )
+
+        result = service.translate_text("Hello", "sk", "en")
+
+        assert result.error_message
+        assert service.translator.translate.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('services.translation_service.time.sleep')
+    def test_backoff_between_attempts(self, mock_sleep):
+        """Test that failed attempts back off up to the retry limit"""
+        service = self._service(max_retries=3, retry_delay=0.5, retry_max_delay=10)
+        service.translator.translate.side_effect = ConnectionError("Connection reset")
+
+        result = service.translate_text("Hello", "sk", "en")
+
+        assert "after 3 attempts" in result.error_message
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 0.5 and 0 <= delays[1] <= 1.0
+
+    @patch('services.translation_service.time.sleep')
+    def test_fallback_uses_its_own_policy(self, mock_sleep):
+        """Test that each backend in the chain is retried under its own policy"""
+        service = self._service(
+            max_retries=3,
+            retry_policies={
+                "google": {"max_retries": 1},
+                "deepl": {"max_retries": 4, "retry_delay": 0.01, "retry_max_delay": 0.05},
+            },
+        )
+        service.rate_limiter = Mock()
+        service.translator.translate.side_effect = ConnectionError("Connection reset")
+        fallback = Mock()
+        fallback.max_text_chars = 5000
+        fallback.translate.side_effect = ConnectionError("Connection reset")
+        service.fallbacks = [("deepl", fallback, Mock())]
+
+        result = service.translate_text("Hello", "sk", "en")
+
+        assert "after 4 attempts" in result.error_message
+        assert service.translator.translate.call_count == 1
+        assert fallback.translate.call_count == 4
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert all(0 <= delay <= 0.05 for delay in delays)
+
+    def test_per_backend_overrides(self):
+        """Test that a backend's retry overrides replace the defaults"""
+        service = self._service(
+            max_retries=3,
+            retry_policies={"google": {"max_retries": 6, "retry_max_delay": 60}},
+        )
+
+        assert service.retry_policy.max_retries == 6
+        assert service.retry_policy.max_delay == 60
+        assert service.retry_policy.base_delay == 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
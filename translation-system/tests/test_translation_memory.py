@@ -0,0 +1,187 @@
+"""
+Unit tests for Translation Memory
+
+Tests segment storage, exact and fuzzy lookup, and persistence.
+"""
+
+import pytest
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from services.translation_memory import TranslationMemory
+from services.translation_service import TranslationService, TranslationResult
+from core.config_manager import TranslationConfig
+
+
+PARAGRAPH = (
+    "Our guesthouse offers comfortable rooms with a view of the mountains, "
+    "a restaurant serving local dishes and free parking for all guests."
+)
+
+
+class TestTranslationMemory:
+    """Test suite for TranslationMemory"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.memory = TranslationMemory(self.temp_dir, min_similarity=0.9)
+
+    def teardown_method(self):
+        """Cleanup test environment"""
+        self.memory.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_exact_match_ignores_whitespace(self):
+        """Test that whitespace-only differences are exact matches"""
+        self.memory.add("Hello  world", "Ahoj svet", "sk", "en")
+
+        match = self.memory.lookup("Hello world", "sk", "en")
+
+        assert match is not None
+        assert match.exact is True
+        assert match.translation == "Ahoj svet"
+
+    def test_fuzzy_match_after_small_edit(self):
+        """Test that a lightly edited paragraph finds its earlier translation"""
+        self.memory.add(PARAGRAPH, "Preklad odseku", "sk", "en")
+        edited = PARAGRAPH.replace("local dishes", "local meals")
+
+        match = self.memory.lookup(edited, "sk", "en")
+
+        assert match is not None
+        assert match.exact is False
+        assert match.similarity >= 0.9
+        assert match.translation == "Preklad odseku"
+
+    def test_dissimilar_text_does_not_match(self):
+        """Test that unrelated text is not returned"""
+        self.memory.add(PARAGRAPH, "Preklad odseku", "sk", "en")
+
+        match = self.memory.lookup(
+            "Check-in starts at two in the afternoon and check-out is at ten.", "sk", "en"
+        )
+
+        assert match is None
+
+    def test_short_text_needs_exact_match(self):
+        """Test that short segments are never fuzzy matched"""
+        self.memory.add("Book now", "Rezervujte", "sk", "en")
+
+        assert self.memory.lookup("Book new", "sk", "en") is None
+
+    def test_language_pairs_are_separate(self):
+        """Test that matches are scoped to a language pair"""
+        self.memory.add(PARAGRAPH, "Preklad odseku", "sk", "en")
+
+        assert self.memory.lookup(PARAGRAPH, "de", "en") is None
+
+    def test_persistence(self):
+        """Test that segments survive a new instance"""
+        self.memory.add(PARAGRAPH, "Preklad odseku", "sk", "en")
+
+        memory = TranslationMemory(self.temp_dir, min_similarity=0.9)
+        match = memory.lookup(PARAGRAPH.replace("free", "paid"), "sk", "en")
+        memory.close()
+
+        assert match is not None
+        assert match.translation == "Preklad odseku"
+
+    def test_changed_numbers_are_not_reused(self):
+        """Test that a fuzzy match must keep the query's numbers"""
+        source = "Please pay 10 EUR at the reception desk on arrival."
+        self.memory.add(source, "Zaplatte 10 EUR na recepcii", "sk", "en")
+
+        match = self.memory.lookup(source.replace("10", "100"), "sk", "en")
+
+        assert match is None
+
+    def test_changed_placeholders_are_not_reused(self):
+        """Test that a fuzzy match must keep the query's placeholders"""
+        self.memory.add(f"{PARAGRAPH} {{name}}", "Preklad odseku {name}", "sk", "en")
+
+        match = self.memory.lookup(f"{PARAGRAPH} {{city}}", "sk", "en")
+
+        assert match is None
+
+    def test_index_is_bounded(self):
+        """Test that old segments leave the index but still match exactly"""
+        self.memory.MAX_INDEXED_SEGMENTS = 2
+        texts = [f"{PARAGRAPH} Room {number}." for number in ("one", "two", "three")]
+        self.memory.lookup(PARAGRAPH, "sk", "en")
+        for i, text in enumerate(texts):
+            self.memory.add(text, f"Preklad {i}", "sk", "en")
+
+        index = self.memory._indexes[("en", "sk")]
+        assert len(index.segments) == 2
+        assert len(index.grams) == 2
+        assert all(len(ids) <= 2 for ids in index.postings.values())
+
+        match = self.memory.lookup(texts[0], "sk", "en")
+        assert match is not None
+        assert match.exact is True
+        assert match.translation == "Preklad 0"
+
+    def test_language_pair_indexes_are_bounded(self):
+        """Test that only the most recently used language pairs stay indexed"""
+        self.memory.MAX_INDEXED_PAIRS = 2
+        for target in ("sk", "de", "fr"):
+            self.memory.lookup(PARAGRAPH, target, "en")
+
+        assert list(self.memory._indexes) == [("en", "de"), ("en", "fr")]
+
+
+class TestTranslationServiceMemory:
+    """Test suite for the translation memory lookup stage"""
+
+    def setup_method(self):
+        """Setup test environment"""
+        self.temp_dir = tempfile.mkdtemp()
+
+        self.mock_config_manager = Mock()
+        self.mock_config_manager.translation_config = TranslationConfig(
+            service="google",
+            cache_enabled=False,
+            translation_memory_threshold=0.9,
+        )
+
+    def teardown_method(self):
+        """Cleanup test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_fuzzy_hit_skips_backend(self):
+        """Test that a fuzzy hit is served without calling the backend"""
+        service = TranslationService(self.mock_config_manager)
+        service.memory = TranslationMemory(self.temp_dir, min_similarity=0.9)
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        service.translator.translate.return_value = TranslationResult(
+            original_text=PARAGRAPH,
+            translated_text="Preklad odseku",
+            source_language="en",
+            target_language="sk",
+            service_used="google",
+        )
+
+        service.translate_text(PARAGRAPH, "sk", "en")
+        result = service.translate_text(PARAGRAPH.replace("free", "paid"), "sk", "en")
+
+        assert result.translated_text == "Preklad odseku"
+        assert result.service_used == "translation_memory"
+        assert result.cached is True
+        assert service.translator.translate.call_count == 1
+
+        stats = service.get_stats()
+        assert stats["memory_fuzzy_hits"] == 1
+        assert stats["memory_exact_hits"] == 0
+        assert stats["api_calls_avoided"] == 1
+        service.memory.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -16,11 +16,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from services.translation_service import (
     TranslationService, GoogleTranslationService, TranslationResult,
-    TranslationCache, FormattingPreserver
+    TranslationCache, FormattingPreserver, TranslationStats,
+    DeepLTranslationService, OpenAITranslationService, split_into_batches,
+    throttle_details, pack_segments, unpack_segments, chunk_text
 )
 from core.config_manager import ConfigManager, TranslationConfig
 
 
+def _fill_cache(cache_dir, worker_id, count):
+    """Write entries to a shared cache from a separate process"""
+    cache = TranslationCache(cache_dir)
+    for i in range(count):
+        cache.set(f"Text {worker_id}-{i}", "sk", f"Preklad {worker_id}-{i}", "en")
+    cache.close()
+
+
 class TestTranslationResult:
     """Test suite for TranslationResult dataclass"""
     
@@ -44,6 +54,54 @@ class TestTranslationResult:
         assert result.error_message is None
 
 
+class TestTranslationStats:
+    """Test suite for TranslationStats counters"""
+    
+    def test_increment_and_hit_rate(self):
+        """Test counters and derived hit rate"""
+        stats = TranslationStats()
+        stats.increment(cache_hits=3, cache_misses=1)
+        
+        counters = stats.as_dict()
+        assert counters["cache_hits"] == 3
+        assert counters["cache_misses"] == 1
+        assert counters["cache_hit_rate"] == 75.0
+    
+    def test_since_baseline(self):
+        """Test per-workflow deltas against a snapshot"""
+        stats = TranslationStats()
+        stats.increment(cache_hits=5, api_calls=2)
+        baseline = stats.as_dict()
+        
+        stats.increment(cache_hits=1, cache_misses=1, api_calls=1)
+        delta = stats.since(baseline)
+        
+        assert delta["cache_hits"] == 1
+        assert delta["cache_misses"] == 1
+        assert delta["api_calls"] == 1
+        assert delta["cache_hit_rate"] == 50.0
+    
+    def test_cache_records_stats(self):
+        """Test that the cache records hits, misses, stores and evictions"""
+        temp_dir = tempfile.mkdtemp()
+        stats = TranslationStats()
+        cache = TranslationCache(temp_dir, max_memory_entries=1, stats=stats)
+        
+        cache.get("Hello", "sk", "en")
+        cache.set("Hello", "sk", "Ahoj", "en")
+        cache.set("World", "sk", "Svet", "en")
+        cache.get("Hello", "sk", "en")
+        
+        counters = stats.as_dict()
+        assert counters["cache_misses"] == 1
+        assert counters["cache_stores"] == 2
+        assert counters["cache_hits"] == 1
+        assert counters["cache_evictions"] == 2
+        
+        import shutil
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 class TestFormattingPreserver:
     """Test suite for FormattingPreserver"""
     
@@ -115,6 +173,114 @@ class TestFormattingPreserver:
         # Restore should match original
         restored = self.formatter.restore_formatting(clean_text, placeholders)
         assert restored == text
+    
+    def test_placeholder_numbering(self):
+        """Test that placeholders are numbered per pattern in text order"""
+        text = "<p>Hi {name}, see <a>this</a> or mail info@example.com</p>"
+        clean_text, placeholders = self.formatter.extract_formatting(text)
+        
+        assert clean_text == (
+            "___HTML_TAG_0_0___Hi ___PLACEHOLDER_1_0___, see ___HTML_TAG_0_1___this"
+            "___HTML_TAG_0_2___ or mail ___EMAIL_7_0______HTML_TAG_0_3___"
+        )
+        assert placeholders["___HTML_TAG_0_3___"] == "</p>"
+    
+    def test_overlapping_spans_round_trip(self):
+        """Test that a span enclosing another pattern is protected whole"""
+        text = "*Stay <b>three</b> nights* and see [our rooms](https://example.com/{id})"
+        clean_text, placeholders = self.formatter.extract_formatting(text)
+        
+        assert "<b>" not in clean_text and "*" not in clean_text
+        assert self.formatter.restore_formatting(clean_text, placeholders) == text
+    
+    def test_repair_mangled_placeholders(self):
+        """Test that respaced, recased and translated placeholders are normalized"""
+        clean_text, placeholders = self.formatter.extract_formatting(
+            "Book <b>now</b> at {site}"
+        )
+        mangled = "Rezervujte ___html_tag_0_0___teraz__ ZNAČKA 0 1 ___ na ___PLACEHOLDER_1_0___"
+        
+        repaired, intact = self.formatter.repair_placeholders(mangled, placeholders)
+        
+        assert intact
+        assert self.formatter.restore_formatting(repaired, placeholders) == (
+            "Rezervujte <b>teraz</b> na {site}"
+        )
+    
+    def test_lost_placeholder_is_not_intact(self):
+        """Test that dropped or duplicated placeholders are detected"""
+        clean_text, placeholders = self.formatter.extract_formatting("<b>Hi</b> there")
+        
+        assert self.formatter.repair_placeholders(clean_text, placeholders) == (clean_text, True)
+        assert not self.formatter.repair_placeholders("Ahoj ___HTML_TAG_0_0___", placeholders)[1]
+        assert not self.formatter.repair_placeholders(
+            "___HTML_TAG_0_0___Ahoj___HTML_TAG_0_1______HTML_TAG_0_1___", placeholders
+        )[1]
+    
+    def test_extract_formatting_batch(self):
+        """Test batch extraction in input order with repeated segments tokenized once"""
+        texts = ["<b>Rooms</b>", "Plain text", "<b>Rooms</b>", "Mail info@example.com"]
+        
+        with patch.object(self.formatter, "_extract", wraps=self.formatter._extract) as extract:
+            batch = self.formatter.extract_formatting_batch(texts)
+            again = self.formatter.extract_formatting_batch(texts)
+        
+        assert extract.call_count == 3
+        assert batch == again
+        assert batch[0] == batch[2]
+        assert batch[1] == ("Plain text", {})
+        assert batch[3][0] == "Mail ___EMAIL_7_0___"
+    
+    def test_memoized_placeholders_are_copies(self):
+        """Test that changing a returned mapping does not affect the memo"""
+        clean_text, placeholders = self.formatter.extract_formatting("<b>Hi</b>")
+        placeholders.clear()
+        
+        assert self.formatter.extract_formatting("<b>Hi</b>")[1] == {
+            "___HTML_TAG_0_0___": "<b>", "___HTML_TAG_0_1___": "</b>"
+        }
+    
+    def test_memo_is_bounded(self):
+        """Test that the memo evicts the least recently used segments"""
+        self.formatter.MEMO_SIZE = 3
+        self.formatter.extract_formatting_batch([f"<i>{i}</i>" for i in range(5)])
+        
+        assert len(self.formatter._memo) == 3
+    
+    def test_memo_is_bounded_by_characters(self):
+        """Test that the memo skips long segments and evicts past its character budget"""
+        self.formatter.MEMO_MAX_SEGMENT_CHARS = 60
+        self.formatter.MEMO_MAX_CHARS = 120
+        
+        long_text = "<b>" + "x" * 60 + "</b>"
+        assert self.formatter.extract_formatting(long_text)[1]["___HTML_TAG_0_0___"] == "<b>"
+        assert not self.formatter._memo
+        
+        self.formatter.extract_formatting_batch([f"<i>Segment {i}</i>" for i in range(5)])
+        
+        # Each short segment holds 52 characters, so two fit
+        assert len(self.formatter._memo) == 2
+        assert self.formatter._memo_chars == 104
+    
+    def test_split_formatting(self):
+        """Test splitting into translatable runs and formatting spans"""
+        parts = self.formatter.split_formatting("Book <b>now</b>, call {phone}")
+        
+        assert parts == [
+            ("Book ", False), ("<b>", True), ("now", False), ("</b>", True),
+            (", call ", False), ("{phone}", True),
+        ]
+    
+    def test_large_markup_round_trip(self):
+        """Test a 100 KB markup-heavy document in one pass"""
+        line = "<p class='room'>Room **{n}** with <b>view</b>, `wifi` and https://x.sk/r</p>\n"
+        text = line * 1500
+        clean_text, placeholders = self.formatter.extract_formatting(text)
+        
+        assert len(text) > 100_000
+        assert len(placeholders) == 1500 * 7
+        assert "<" not in clean_text
+        assert self.formatter.restore_formatting(clean_text, placeholders) == text
 
 
 class TestTranslationCache:
@@ -173,6 +339,135 @@ class TestTranslationCache:
         assert sk_result == "Ahoj"
         assert de_result == "Hallo"
 
+    def test_cache_overwrite(self):
+        """Test that setting an existing key replaces the translation"""
+        self.cache.set("Hello", "sk", "Ahoj", "en")
+        self.cache.set("Hello", "sk", "Dobry den", "en")
+        
+        assert self.cache.get("Hello", "sk", "en") == "Dobry den"
+    
+    def test_legacy_json_cache_migration(self):
+        """Test that an old translations.json cache is imported"""
+        legacy_dir = tempfile.mkdtemp()
+        key = self.cache._get_cache_key("Hello", "sk", "en")
+        with open(Path(legacy_dir) / "translations.json", "w", encoding="utf-8") as f:
+            json.dump({key: "Ahoj"}, f)
+        
+        cache = TranslationCache(legacy_dir)
+        
+        assert cache.get("Hello", "sk", "en") == "Ahoj"
+        assert not (Path(legacy_dir) / "translations.json").exists()
+        
+        import shutil
+        shutil.rmtree(legacy_dir, ignore_errors=True)
+    
+    def test_corrupt_cache_recovery(self):
+        """Test that an unreadable cache file is replaced with a fresh one"""
+        corrupt_dir = tempfile.mkdtemp()
+        with open(Path(corrupt_dir) / "translations.db", "wb") as f:
+            f.write(b"this is not a sqlite database" * 100)
+        
+        cache = TranslationCache(corrupt_dir)
+        cache.set("Hello", "sk", "Ahoj", "en")
+        
+        assert cache.get("Hello", "sk", "en") == "Ahoj"
+        assert list(Path(corrupt_dir).glob("translations.corrupt-*"))
+        
+        import shutil
+        shutil.rmtree(corrupt_dir, ignore_errors=True)
+    
+    def test_cache_compaction(self):
+        """Test that compaction keeps all entries"""
+        for i in range(50):
+            self.cache.set(f"Text {i}", "sk", f"Text {i} sk", "en")
+        
+        self.cache.compact()
+        
+        assert self.cache.get("Text 42", "sk", "en") == "Text 42 sk"
+    
+    def test_compaction_runs_on_write_schedule(self):
+        """Test that the cache compacts itself after COMPACT_INTERVAL writes"""
+        self.cache.COMPACT_INTERVAL = 3
+        
+        with patch.object(self.cache, "compact", wraps=self.cache.compact) as compact:
+            for i in range(7):
+                self.cache.set(f"Text {i}", "sk", f"Text {i} sk", "en")
+        
+        assert compact.call_count == 2
+        assert self.cache.get("Text 6", "sk", "en") == "Text 6 sk"
+
+    def test_memory_tier_is_bounded(self):
+        """Test that the LRU tier evicts old entries but disk still serves them"""
+        cache = TranslationCache(self.temp_dir, max_memory_entries=2)
+        cache.set("One", "sk", "Jeden", "en")
+        cache.set("Two", "sk", "Dva", "en")
+        cache.set("Three", "sk", "Tri", "en")
+        
+        assert len(cache._memory) == 2
+        assert cache._get_cache_key("One", "sk", "en") not in cache._memory
+        
+        # Evicted entry is read back from disk and promoted
+        assert cache.get("One", "sk", "en") == "Jeden"
+        assert cache._get_cache_key("One", "sk", "en") in cache._memory
+        assert cache._get_cache_key("Two", "sk", "en") not in cache._memory
+    
+    def test_memory_tier_disabled(self):
+        """Test cache works from disk alone when the memory tier is disabled"""
+        cache = TranslationCache(self.temp_dir, max_memory_entries=0)
+        cache.set("Hello", "sk", "Ahoj", "en")
+        
+        assert len(cache._memory) == 0
+        assert cache.get("Hello", "sk", "en") == "Ahoj"
+
+    def test_concurrent_thread_writes(self):
+        """Test that parallel threads sharing one cache lose no entries"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def fill(worker_id):
+            for i in range(50):
+                self.cache.set(f"Text {worker_id}-{i}", "sk", f"Preklad {worker_id}-{i}", "en")
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(fill, range(8)))
+        
+        fresh_cache = TranslationCache(self.temp_dir, max_memory_entries=0)
+        for worker_id in range(8):
+            for i in range(50):
+                assert fresh_cache.get(f"Text {worker_id}-{i}", "sk", "en") == (
+                    f"Preklad {worker_id}-{i}"
+                )
+    
+    def test_concurrent_process_writes(self):
+        """Test that several processes can write to one cache directory"""
+        import multiprocessing
+        
+        processes = [
+            multiprocessing.Process(target=_fill_cache, args=(self.temp_dir, worker_id, 30))
+            for worker_id in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+        
+        fresh_cache = TranslationCache(self.temp_dir, max_memory_entries=0)
+        for worker_id in range(4):
+            for i in range(30):
+                assert fresh_cache.get(f"Text {worker_id}-{i}", "sk", "en") == (
+                    f"Preklad {worker_id}-{i}"
+                )
+    
+    def test_set_many(self):
+        """Test caching several translations in one transaction"""
+        self.cache.set_many([
+            ("Hello", "sk", "Ahoj", "en"),
+            ("Hello", "de", "Hallo", "en"),
+        ])
+        
+        assert self.cache.get("Hello", "sk", "en") == "Ahoj"
+        assert self.cache.get("Hello", "de", "en") == "Hallo"
+
 
 class TestGoogleTranslationService:
     """Test suite for GoogleTranslationService"""
@@ -182,29 +477,31 @@ class TestGoogleTranslationService:
         self.config = TranslationConfig(service="google")
         self.service = GoogleTranslationService(self.config)
     
-    def test_successful_translation(self):
+    @patch('services.translation_service.DeepGoogleTranslator')
+    def test_successful_translation(self, mock_translator_class):
         """Test successful translation"""
-        # Mock the translator directly
         service = GoogleTranslationService(self.config)
         
         # Mock the translate method
-        service.translator.translate = Mock(return_value="Hola")
+        mock_translator_class.return_value.translate = Mock(return_value="Hola")
         
         # Test translation
         result = service.translate("Hello", "es", "en")
         
+        mock_translator_class.assert_called_once_with(source="en", target="es")
         assert result.translated_text == "Hola"
         assert result.source_language == "en"
         assert result.target_language == "es"
         assert result.confidence == 0.8
         assert result.service_used == "google"
     
-    def test_translation_failure(self):
+    @patch('services.translation_service.DeepGoogleTranslator')
+    def test_translation_failure(self, mock_translator_class):
         """Test translation failure handling"""
         service = GoogleTranslationService(self.config)
         
         # Mock translator to fail
-        service.translator.translate = Mock(side_effect=Exception("API Error"))
+        mock_translator_class.return_value.translate = Mock(side_effect=Exception("API Error"))
         
         result = service.translate("Hello", "es", "en")
         
@@ -213,6 +510,26 @@ class TestGoogleTranslationService:
         assert result.error_message is not None
         assert "API Error" in result.error_message
     
+    def test_translators_are_per_thread_and_language_pair(self):
+        """Test that no translator instance is shared between threads or pairs"""
+        import threading
+        
+        service = GoogleTranslationService(self.config)
+        sk = service._get_translator("sk", "en")
+        
+        assert service._get_translator("sk", "en") is sk
+        assert service._get_translator("de", "en") is not sk
+        
+        other_thread = []
+        thread = threading.Thread(
+            target=lambda: other_thread.append(service._get_translator("sk", "en"))
+        )
+        thread.start()
+        thread.join()
+        
+        assert other_thread[0] is not sk
+        assert (sk.source, sk.target) == ("en", "sk")
+    
     def test_language_detection(self):
         """Test language detection"""
         service = GoogleTranslationService(self.config)
@@ -221,6 +538,266 @@ class TestGoogleTranslationService:
         assert detected_lang == "auto"
 
 
+class TestBatchSplitting:
+    """Test suite for batch splitting and backend batch requests"""
+    
+    def test_split_respects_item_limit(self):
+        """Test that batches never exceed the item limit"""
+        batches = split_into_batches(["a"] * 5, max_items=2, max_chars=100)
+        
+        assert batches == [[0, 1], [2, 3], [4]]
+    
+    def test_split_respects_char_limit(self):
+        """Test that batches never exceed the character limit"""
+        batches = split_into_batches(["aaaa", "bbbb", "cc", "dddddddddd"], max_items=10, max_chars=8)
+        
+        assert batches == [[0, 1], [2], [3]]
+    
+    @patch('services.translation_service.DeepGoogleTranslator')
+    def test_google_batch_maps_results_in_order(self, mock_translator_class):
+        """Test that batched Google results map back to their inputs"""
+        service = GoogleTranslationService(TranslationConfig(service="google"))
+        translator = mock_translator_class.return_value
+        translator.translate_batch = Mock(return_value=["Ahoj", "Svet"])
+        
+        results = service.translate_batch(["Hello", "World"], "sk", "en")
+        
+        translator.translate_batch.assert_called_once_with(["Hello", "World"])
+        assert [r.translated_text for r in results] == ["Ahoj", "Svet"]
+        assert [r.original_text for r in results] == ["Hello", "World"]
+    
+    @patch('services.translation_service.requests.Session')
+    def test_deepl_batch_sends_one_request(self, mock_session_class):
+        """Test that DeepL batches are sent as one multi-text request"""
+        mock_post = mock_session_class.return_value.post
+        mock_post.return_value.json.return_value = {
+            "translations": [{"text": "Ahoj"}, {"text": "Svet"}]
+        }
+        service = DeepLTranslationService(TranslationConfig(service="deepl", api_key="key:fx"))
+        
+        results = service.translate_batch(["Hello", "World"], "sk", "en")
+        
+        mock_post.assert_called_once()
+        data = mock_post.call_args.kwargs["data"]
+        assert ("text", "Hello") in data and ("text", "World") in data
+        assert ("target_lang", "SK") in data
+        assert mock_post.call_args.args[0] == DeepLTranslationService.FREE_API_URL
+        assert [r.translated_text for r in results] == ["Ahoj", "Svet"]
+    
+    @patch('services.translation_service.requests.Session')
+    def test_deepl_reuses_session_per_thread(self, mock_session_class):
+        """Test that consecutive DeepL requests share one keep-alive session"""
+        mock_session_class.return_value.post.return_value.json.return_value = {
+            "translations": [{"text": "Ahoj"}]
+        }
+        service = DeepLTranslationService(TranslationConfig(service="deepl", api_key="key"))
+        
+        service.translate("Hello", "sk", "en")
+        service.translate("Hello", "de", "en")
+        
+        mock_session_class.assert_called_once()
+        assert mock_session_class.return_value.post.call_count == 2
+    
+    @patch('services.translation_service.requests.Session')
+    def test_deepl_batch_count_mismatch_fails(self, mock_session_class):
+        """Test that a DeepL response of the wrong length fails the batch"""
+        mock_post = mock_session_class.return_value.post
+        mock_post.return_value.json.return_value = {"translations": [{"text": "Ahoj"}]}
+        service = DeepLTranslationService(TranslationConfig(service="deepl", api_key="key"))
+        
+        results = service.translate_batch(["Hello", "World"], "sk", "en")
+        
+        assert all(r.error_message for r in results)
+
+
+class TestOpenAIMultiTarget:
+    """Test suite for translating into several languages with one prompt"""
+    
+    def _service(self, mock_openai, content, finish_reason="stop"):
+        choice = Mock(finish_reason=finish_reason)
+        choice.message.content = content
+        mock_openai.ChatCompletion.create.return_value = Mock(choices=[choice])
+        return OpenAITranslationService(TranslationConfig(service="openai", api_key="key"))
+    
+    @patch('services.translation_service.OPENAI_AVAILABLE', True)
+    @patch('services.translation_service.openai', create=True)
+    def test_splits_json_reply_per_language(self, mock_openai):
+        """Test that one reply yields a result per target language"""
+        service = self._service(mock_openai, '{"sk": "Ahoj ", "de": "Hallo", "fr": "Salut"}')
+        
+        results = service.translate_multi("Hello", ["sk", "de"], "en")
+        
+        mock_openai.ChatCompletion.create.assert_called_once()
+        assert list(results) == ["sk", "de"]
+        assert results["sk"].translated_text == "Ahoj"
+        assert results["de"].target_language == "de"
+        assert not results["de"].error_message
+    
+    @patch('services.translation_service.OPENAI_AVAILABLE', True)
+    @patch('services.translation_service.openai', create=True)
+    def test_missing_language_fails_every_result(self, mock_openai):
+        """Test that a reply without every requested language is rejected"""
+        service = self._service(mock_openai, '{"sk": "Ahoj"}')
+        
+        results = service.translate_multi("Hello", ["sk", "de"], "en")
+        
+        assert all(r.error_message and not r.translated_text for r in results.values())
+
+
+class TestTextChunking:
+    """Test suite for splitting oversize texts"""
+    
+    def _rejoin(self, chunks):
+        return "".join(chunk + separator for chunk, separator in chunks)
+    
+    def test_short_text_is_one_chunk(self):
+        """Test that text within the limit is not split"""
+        assert chunk_text("Hello world.", 100) == [("Hello world.", "")]
+    
+    def test_prefers_paragraph_boundaries(self):
+        """Test that paragraphs are kept whole when they fit"""
+        text = "First paragraph here.\n\nSecond paragraph here."
+        
+        chunks = chunk_text(text, 30)
+        
+        assert [chunk for chunk, _ in chunks] == ["First paragraph here.", "Second paragraph here."]
+        assert self._rejoin(chunks) == text
+    
+    def test_splits_long_paragraph_on_sentences(self):
+        """Test that a paragraph over the limit is split between sentences"""
+        text = "One sentence here. Another one follows! A third? Yes."
+        
+        chunks = chunk_text(text, 25)
+        
+        assert all(len(chunk) <= 25 for chunk, _ in chunks)
+        assert chunks[0][0] == "One sentence here."
+        assert self._rejoin(chunks) == text
+    
+    def test_round_trip_and_limits_on_long_document(self):
+        """Test that every chunk fits and the document reassembles exactly"""
+        paragraph = " ".join(f"Sentence number {i} is here." for i in range(40))
+        text = "\n\n".join([paragraph] * 5) + "\n\n" + "x" * 250
+        
+        chunks = chunk_text(text, 100)
+        
+        assert all(0 < len(chunk) <= 100 for chunk, _ in chunks)
+        assert self._rejoin(chunks) == text
+    
+    def test_no_blank_chunks(self):
+        """Test that whitespace-only pieces never become chunks of their own"""
+        import random
+        
+        rng = random.Random(7)
+        pieces = ["Word.", "Sentence here.", " ", "  ", "\n", "\n\n", "\n \n", "\t", "x" * 30]
+        for _ in range(500):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 40)))
+            if not text.strip():
+                continue
+            max_chars = rng.randint(5, 40)
+            
+            chunks = chunk_text(text, max_chars)
+            
+            assert self._rejoin(chunks) == text
+            assert all(chunk.strip() for chunk, _ in chunks)
+            assert all(len(chunk) <= max_chars for chunk, _ in chunk_text(text.lstrip(), max_chars))
+
+
+class TestSegmentPacking:
+    """Test suite for packing short segments into one request"""
+    
+    def test_pack_round_trip(self):
+        """Test that packed segments split back in order"""
+        segments = ["Book now", "Contact us", "Rooms\nand suites"]
+        
+        packed = pack_segments(segments)
+        
+        assert unpack_segments(packed, 3) == segments
+    
+    def test_unpack_tolerates_marker_spacing(self):
+        """Test that whitespace the backend adds around markers is ignored"""
+        translated = "[[0]] Rezervujte teraz\n[[ 1 ]]Kontaktujte nás"
+        
+        assert unpack_segments(translated, 2) == ["Rezervujte teraz", "Kontaktujte nás"]
+    
+    def test_unpack_rejects_damaged_markers(self):
+        """Test that lost, reordered or extra markers are detected"""
+        assert unpack_segments("[[0]] Rezervujte [1] Kontakt", 2) is None
+        assert unpack_segments("[[1]] Kontakt\n[[0]] Rezervujte", 2) is None
+        assert unpack_segments("Úvod [[0]] Rezervujte\n[[1]] Kontakt", 2) is None
+        assert unpack_segments("[[0]] Rezervujte\n[[1]]", 2) is None
+    
+    def _service(self, translate):
+        config_manager = Mock()
+        config_manager.translation_config = TranslationConfig(
+            service="google", cache_enabled=False, preserve_formatting=False
+        )
+        service = TranslationService(config_manager)
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        service.translator.pack_segments = True
+        service.translator.max_batch_items = 50
+        service.translator.max_batch_chars = 5000
+        service.translator.translate.side_effect = translate
+        service.translator.translate_batch.side_effect = lambda texts, target, source: [
+            translate(text, target, source) for text in texts
+        ]
+        return service
+    
+    def test_short_segments_share_one_request(self):
+        """Test that short segments are sent as one packed request"""
+        words = {"Home": "Domov", "Rooms": "Izby", "Contact": "Kontakt"}
+        
+        def translate(text, target_lang, source_lang):
+            for source, target in words.items():
+                text = text.replace(source, target)
+            return TranslationResult(text, text, source_lang, target_lang, "google")
+        
+        service = self._service(translate)
+        
+        results = service.translate_batch(["Home", "Rooms", "Contact"], "sk", "en")
+        
+        assert [r.translated_text for r in results] == ["Domov", "Izby", "Kontakt"]
+        assert service.translator.translate.call_count == 1
+        service.translator.translate_batch.assert_not_called()
+        assert service.get_stats()["packed_segments"] == 3
+    
+    def test_damaged_pack_falls_back_per_segment(self):
+        """Test that a pack that does not split back is translated separately"""
+        def translate(text, target_lang, source_lang):
+            translated = text.replace("[[1]]", "[1]") + " (sk)"
+            return TranslationResult(text, translated, source_lang, target_lang, "google")
+        
+        service = self._service(translate)
+        
+        results = service.translate_batch(["Home", "Rooms"], "sk", "en")
+        
+        assert [r.translated_text for r in results] == ["Home (sk)", "Rooms (sk)"]
+        service.translator.translate_batch.assert_called_once()
+        assert service.get_stats()["packing_fallbacks"] == 1
+
+
+class TestThrottleDetails:
+    """Test suite for throttling error classification"""
+    
+    def test_http_429_with_retry_after(self):
+        """Test that HTTP 429 responses are throttling with their delay"""
+        error = Exception("Too many requests")
+        error.response = Mock(status_code=429, headers={"Retry-After": "7"})
+        
+        assert throttle_details(error) == (True, 7.0)
+    
+    def test_named_rate_limit_error(self):
+        """Test that provider rate-limit exception types are recognised"""
+        class RateLimitError(Exception):
+            pass
+        
+        assert throttle_details(RateLimitError("slow down")) == (True, None)
+    
+    def test_other_errors_are_not_throttling(self):
+        """Test that ordinary failures are not treated as throttling"""
+        assert throttle_details(ValueError("bad input")) == (False, None)
+
+
 class TestTranslationService:
     """Test suite for main TranslationService"""
     
@@ -288,6 +865,8 @@ class TestTranslationService:
         assert result.translated_text == "Ahoj"
         assert result.cached is True
         assert result.confidence == 0.9
+        assert service.get_stats()["api_calls_avoided"] == 1
+        assert service.get_stats()["bytes_saved"] == len("Hello")
         
         # Should not call translator
         mock_google_service.return_value.translate.assert_not_called()
@@ -301,6 +880,7 @@ class TestTranslationService:
         """Test translation with retry logic"""
         # Mock translator to fail first attempt, succeed second
         mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
         mock_google_service.return_value = mock_translator
         
         call_count = 0
@@ -334,12 +914,179 @@ class TestTranslationService:
         assert result.translated_text == "Ahoj"
         assert call_count == 2  # Should retry once
     
+    @patch('services.translation_service.time.sleep')
+    @patch('services.translation_service.GoogleTranslationService')
+    def test_throttled_retry_backs_off_in_rate_limiter(self, mock_google_service, mock_sleep):
+        """Test that throttled attempts adapt the rate limiter instead of sleeping"""
+        mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_google_service.return_value = mock_translator
+        mock_translator.translate.side_effect = [
+            TranslationResult(
+                original_text="Hello",
+                translated_text="",
+                source_language="en",
+                target_language="sk",
+                service_used="google_failed",
+                error_message="Too many requests",
+                throttled=True,
+                retry_after=2.0
+            ),
+            TranslationResult(
+                original_text="Hello",
+                translated_text="Ahoj",
+                source_language="en",
+                target_language="sk",
+                service_used="google"
+            ),
+        ]
+        
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        
+        result = service.translate_text("Hello", "sk", "en")
+        
+        assert result.translated_text == "Ahoj"
+        service.rate_limiter.on_throttle.assert_called_once_with(2.0)
+        service.rate_limiter.on_success.assert_called_once()
+        assert service.rate_limiter.acquire.call_count == 2
+        mock_sleep.assert_not_called()
+    
+    @patch('services.translation_service.time.sleep')
+    def test_failover_to_next_backend(self, mock_sleep):
+        """Test that a tripped primary sends traffic to the fallback backend"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        service.translator.translate.return_value = TranslationResult(
+            original_text="Hello",
+            translated_text="",
+            source_language="en",
+            target_language="sk",
+            service_used="google_failed",
+            error_message="Service unavailable"
+        )
+        fallback = Mock()
+        fallback.max_text_chars = 5000
+        fallback.translate.side_effect = lambda text, target, source: TranslationResult(
+            original_text=text,
+            translated_text="Ahoj",
+            source_language=source,
+            target_language=target,
+            service_used="deepl"
+        )
+        service.fallbacks = [("deepl", fallback, Mock())]
+        
+        results = [service.translate_text(f"Hello {i}", "sk", "en") for i in range(10)]
+        
+        assert all(r.translated_text == "Ahoj" for r in results)
+        assert all(r.service_used == "deepl" for r in results)
+        # The primary is skipped once its breaker opens
+        assert service.translator.translate.call_count == 5
+        assert service.breakers["google"].state == "open"
+        mock_sleep.assert_not_called()
+    
+    def test_fallback_never_gets_primary_api_key(self):
+        """Test that a keyed fallback without its own key is skipped, not given the primary's"""
+        config = self.mock_config_manager.translation_config
+        config.api_key = "primary-key"
+        config.fallback_services = ["deepl", "mock"]
+        
+        service = TranslationService(self.mock_config_manager)
+        assert [name for name, _, _ in service.fallbacks] == ["mock"]
+        assert service.fallbacks[0][1].config.api_key is None
+        
+        config.service_api_keys = {"deepl": "deepl-key"}
+        service = TranslationService(self.mock_config_manager)
+        assert [name for name, _, _ in service.fallbacks] == ["deepl", "mock"]
+        assert service.fallbacks[0][1].config.api_key == "deepl-key"
+    
+    @patch('services.translation_service.time.sleep')
+    def test_only_backend_is_tried_with_open_breaker(self, mock_sleep):
+        """Test that an open breaker does not lock out the only backend"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        service.translator.translate.return_value = TranslationResult(
+            original_text="Hello",
+            translated_text="",
+            source_language="en",
+            target_language="sk",
+            service_used="google_failed",
+            error_message="Service unavailable"
+        )
+        
+        for i in range(3):
+            service.translate_text(f"Hello {i}", "sk", "en")
+        assert service.breakers["google"].state == "open"
+        
+        # The backend recovers long before the breaker would probe it
+        service.translator.translate.return_value = TranslationResult(
+            original_text="Hello",
+            translated_text="Ahoj",
+            source_language="en",
+            target_language="sk",
+            service_used="google"
+        )
+        result = service.translate_text("Hello again", "sk", "en")
+        
+        assert result.translated_text == "Ahoj"
+        assert not result.error_message
+        assert service.breakers["google"].state == "closed"
+    
+    def test_single_flight_deduplicates_concurrent_requests(self):
+        """Test that concurrent identical requests share one backend call"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.translator = Mock()
+        service.translator.max_text_chars = 5000
+        
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_translate(text, target_lang, source_lang):
+            started.set()
+            release.wait(timeout=5)
+            return TranslationResult(
+                original_text=text,
+                translated_text="Pätička",
+                source_language=source_lang,
+                target_language=target_lang,
+                service_used="google"
+            )
+        
+        service.translator.translate.side_effect = slow_translate
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(service.translate_text, "Footer", "sk", "en")
+            started.wait(timeout=5)
+            followers = [
+                executor.submit(service.translate_text, "Footer", "sk", "en") for _ in range(4)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+        
+        assert service.translator.translate.call_count == 1
+        assert all(r.translated_text == "Pätička" for r in results)
+        assert service.get_stats()["deduplicated_requests"] == 4
+        assert not service._in_flight
+    
     def test_batch_translation(self):
         """Test batch translation"""
         service = TranslationService(self.mock_config_manager)
         
         # Mock the translator
         mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
         service.translator = mock_translator
         
         def mock_translate(text, target_lang, source_lang):
@@ -357,6 +1104,13 @@ class TestTranslationService:
             )
         
         mock_translator.translate.side_effect = mock_translate
+        mock_translator.max_batch_items = 50
+        mock_translator.max_batch_chars = 5000
+        mock_translator.pack_segments = False
+        mock_translator.batch_is_single_request = True
+        mock_translator.translate_batch.side_effect = lambda texts, target, source: [
+            mock_translate(text, target, source) for text in texts
+        ]
         
         texts = ["Hello", "World", "Test"]
         results = service.translate_batch(texts, "sk", "en")
@@ -365,6 +1119,217 @@ class TestTranslationService:
         assert results[0].translated_text == "Ahoj"
         assert results[1].translated_text == "Svet"
         assert results[2].translated_text == "Test"
+        
+        # All uncached texts go to the backend in a single batch
+        mock_translator.translate_batch.assert_called_once()
+        mock_translator.translate.assert_not_called()
+    
+    def test_batch_of_per_text_requests_is_paced_per_text(self):
+        """Test that a backend sending one request per text pays for each one"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        
+        mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_translator.max_batch_items = 50
+        mock_translator.max_batch_chars = 5000
+        mock_translator.pack_segments = False
+        mock_translator.batch_is_single_request = False
+        mock_translator.translate_batch.side_effect = lambda texts, target, source: [
+            TranslationResult(
+                original_text=text,
+                translated_text=text.upper(),
+                source_language=source,
+                target_language=target,
+                service_used="google"
+            )
+            for text in texts
+        ]
+        service.translator = mock_translator
+        
+        results = service.translate_batch(["Hello", "World", "Test"], "sk", "en")
+        
+        assert [r.translated_text for r in results] == ["HELLO", "WORLD", "TEST"]
+        assert [c.args for c in service.rate_limiter.acquire.call_args_list] == [(5,), (5,), (4,)]
+        assert service.get_stats()["api_calls"] == 3
+    
+    def test_oversize_text_is_chunked(self):
+        """Test that text over the backend limit is translated in chunks"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.translator = Mock()
+        service.translator.max_text_chars = 40
+        service.translator.translate.side_effect = lambda text, target, source: TranslationResult(
+            original_text=text,
+            translated_text=text.upper(),
+            source_language=source,
+            target_language=target,
+            service_used="mock"
+        )
+        text = "First paragraph is here.\n\nSecond one is here too. It has two sentences."
+        
+        result = service.translate_text(text, "sk", "en")
+        
+        assert result.translated_text == text.upper()
+        assert result.original_text == text
+        sent = [call.args[0] for call in service.translator.translate.call_args_list]
+        assert len(sent) == 3
+        assert all(len(chunk) <= 40 for chunk in sent)
+    
+    def test_chunked_text_sends_no_blank_requests(self):
+        """Test that surrounding and blank-line whitespace is never sent as a chunk"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        service.translator = Mock()
+        service.translator.max_text_chars = 40
+        service.translator.translate.side_effect = lambda text, target, source: TranslationResult(
+            original_text=text,
+            translated_text=text.upper(),
+            source_language=source,
+            target_language=target,
+            service_used="mock"
+        )
+        text = "\n\n  First paragraph is here.\n\n   \n\nSecond one is here too. It has two.  "
+        
+        result = service.translate_text(text, "sk", "en")
+        
+        assert result.translated_text == text.upper()
+        sent = [call.args[0] for call in service.translator.translate.call_args_list]
+        assert all(chunk.strip() and len(chunk) <= 40 for chunk in sent)
+    
+    def test_chunks_are_not_cached_on_their_own(self):
+        """Test that only the reassembled text of a chunked segment is cached"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = TranslationCache(cache_dir=self.temp_dir, stats=service.stats)
+        service.rate_limiter = Mock()
+        service.translator = Mock()
+        service.translator.max_text_chars = 40
+        service.translator.translate.side_effect = lambda text, target, source: TranslationResult(
+            original_text=text,
+            translated_text=text.upper(),
+            source_language=source,
+            target_language=target,
+            service_used="mock"
+        )
+        text = "First paragraph is here.\n\nSecond one is here too. It has two sentences."
+        
+        result = service.translate_text(text, "sk", "en")
+        
+        assert result.translated_text == text.upper()
+        assert service.translator.translate.call_count == 3
+        assert service.get_stats()["cache_stores"] == 1
+        assert service.cache.get(text, "sk", "en") == text.upper()
+        assert service.cache.get("First paragraph is here.", "sk", "en") is None
+    
+    def test_batch_translation_falls_back_per_segment(self):
+        """Test that segments failing inside a batch are retried one by one"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        
+        mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_translator.max_batch_items = 50
+        mock_translator.max_batch_chars = 5000
+        mock_translator.pack_segments = False
+        service.translator = mock_translator
+        
+        def make_result(text, translated, error=None):
+            return TranslationResult(
+                original_text=text,
+                translated_text=translated,
+                source_language="en",
+                target_language="sk",
+                service_used="mock",
+                error_message=error
+            )
+        
+        mock_translator.translate_batch.return_value = [
+            make_result("Hello", "Ahoj"),
+            make_result("World", "", "Batch item failed"),
+        ]
+        mock_translator.translate.return_value = make_result("World", "Svet")
+        
+        results = service.translate_batch(["Hello", "World"], "sk", "en")
+        
+        assert [r.translated_text for r in results] == ["Ahoj", "Svet"]
+        mock_translator.translate.assert_called_once()
+    
+    def test_multi_target_translation(self):
+        """Test that cache misses for several languages share one backend call"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        
+        mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_translator.supports_multi_target = True
+        service.translator = mock_translator
+        
+        def make_result(target_lang, translated, error=None):
+            return TranslationResult(
+                original_text="Hello",
+                translated_text=translated,
+                source_language="en",
+                target_language=target_lang,
+                service_used="mock",
+                error_message=error
+            )
+        
+        mock_translator.translate_multi.return_value = {
+            "sk": make_result("sk", "Ahoj"),
+            "de": make_result("de", "Hallo"),
+            "hu": make_result("hu", "", "Missing from reply"),
+        }
+        mock_translator.translate.return_value = make_result("hu", "Szia")
+        
+        results = service.translate_text_multi("Hello", ["sk", "de", "hu"], "en")
+        
+        mock_translator.translate_multi.assert_called_once_with("Hello", ["sk", "de", "hu"], "en")
+        assert {lang: r.translated_text for lang, r in results.items()} == {
+            "sk": "Ahoj", "de": "Hallo", "hu": "Szia"
+        }
+        mock_translator.translate.assert_called_once()
+        assert service.get_stats()["api_calls"] == 2
+    
+    def test_lost_placeholders_are_translated_around(self):
+        """Test that a text whose placeholders were dropped is retranslated in runs"""
+        service = TranslationService(self.mock_config_manager)
+        service.cache = None
+        service.rate_limiter = Mock()
+        
+        mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_translator.max_batch_items = 50
+        mock_translator.max_batch_chars = 5000
+        mock_translator.pack_segments = False
+        service.translator = mock_translator
+        
+        words = {"Book": "Rezervujte", "now": "teraz"}
+        
+        def translate(text, target_lang, source_lang):
+            translated = "Rezervujte teraz" if "___" in text else words[text]
+            return TranslationResult(
+                original_text=text,
+                translated_text=translated,
+                source_language="en",
+                target_language=target_lang,
+                service_used="mock"
+            )
+        
+        mock_translator.translate.side_effect = translate
+        mock_translator.translate_batch.side_effect = lambda texts, target, source: [
+            translate(text, target, source) for text in texts
+        ]
+        
+        result = service.translate_text("Book <b>now</b>", "sk", "en")
+        
+        assert result.translated_text == "Rezervujte <b>teraz</b>"
+        assert not result.error_message
+        stats = service.get_stats()
+        assert stats["placeholder_fallbacks"] == 1
+        assert stats["placeholder_failures"] == 0
     
     @patch('services.translation_service.GoogleTranslationService')
     def test_formatting_preservation(self, mock_google_service):
@@ -372,6 +1337,10 @@ class TestTranslationService:
         self.mock_config_manager.translation_config.preserve_formatting = True
         
         mock_translator = Mock()
+        mock_translator.max_text_chars = 5000
+        mock_translator.max_batch_items = 1
+        mock_translator.max_batch_chars = 5000
+        mock_translator.pack_segments = False
         mock_google_service.return_value = mock_translator
         
         # Mock translator to return text without formatting
@@ -385,6 +1354,9 @@ class TestTranslationService:
             )
         
         mock_translator.translate.side_effect = mock_translate
+        mock_translator.translate_batch.side_effect = lambda texts, target, source: [
+            mock_translate(text, target, source) for text in texts
+        ]
         
         service = TranslationService(self.mock_config_manager)
         result = service.translate_text("This is <b>bold</b> text", "sk", "en")